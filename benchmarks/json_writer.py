@@ -0,0 +1,101 @@
+import os
+import numpy as np
+from json import dump
+from time import perf_counter
+from tempfile import TemporaryDirectory
+from typing import Any, List, Dict, Union, Callable
+from argparse import ArgumentParser, Namespace
+
+from stock_storage.json_writer import JsonWriter, orjson
+
+
+"""
+
+  -- Benchmark: JSON Writer --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+  usage  : python -m benchmarks.json_writer [--rows 700 5000 50000]
+
+"""
+
+
+def best_of(function: Callable[[], Any], repeat: int) -> float:
+  timings: List[float] = []
+  for _ in range(repeat):
+    start: float = perf_counter()
+    function()
+    timings.append(perf_counter() - start)
+  return min(timings)
+
+def indicator_columns(rows: int, random_generator: np.random.Generator) -> Dict[str, Union[np.ndarray, List[Any]]]:
+  # shaped like indicators/*.json: two text columns, float64 indicator columns
+  columns: Dict[str, Union[np.ndarray, List[Any]]] = {
+    'date':      [f'2023-{(row // 28) % 12 + 1:02d}-{row % 28 + 1:02d}' for row in range(rows)],
+    'full_date': ['Senin, 02 Januari 2023'] * rows
+  }
+  for name in ['Close', 'Volume', 'MFI', 'RSI', 'MACD', 'BB_PERCENT_B', 'ATR',
+               'STOCH_K', 'STOCH_D', 'CCI', 'OBV', 'CMF']:
+    columns[name] = random_generator.standard_normal(rows) * 10.0 ** random_generator.integers(-6, 18)
+
+  # the values orjson writes differently from json.dump (taken from the stdlib)
+  columns['CCI'][:4] = [np.nan, np.inf, -np.inf, 1e-05]
+  columns['OBV'][:2] = [1e16, -0.0]
+  return columns
+
+def dump_records(json_path: str, root_key: str, columns: Dict[str, Union[np.ndarray, List[Any]]]) -> None:
+  # previous implementation: list of dicts, then json.dump
+  records: List[Dict[str, Any]] = [
+    dict(zip(columns.keys(), row)) for row in zip(*[
+      values.tolist() if isinstance(values, np.ndarray) else values
+        for values in columns.values()
+    ])
+  ]
+  with open(json_path, 'w') as json_file:
+    dump({root_key: records}, json_file)
+
+def main() -> None:
+  parser: ArgumentParser = ArgumentParser(description = "JSON writer benchmark")
+  parser.add_argument('--rows',   type = int, nargs = '+', default = [700, 5_000, 50_000])
+  parser.add_argument('--repeat', type = int, default = 5)
+  arguments: Namespace = parser.parse_args()
+
+  serializers: List[str] = ['json'] if orjson is None else ['json', 'orjson']
+  if orjson is None: print('orjson is not installed, stdlib serializer only')
+
+  random_generator: np.random.Generator = np.random.default_rng(2024)
+  with TemporaryDirectory() as temporary_directory:
+    expected_path: str = os.path.join(temporary_directory, 'expected.json')
+    actual_path:   str = os.path.join(temporary_directory, 'actual.json')
+
+    for rows in arguments.rows:
+      columns: Dict[str, Union[np.ndarray, List[Any]]] = indicator_columns(rows, random_generator)
+
+      dump_records(expected_path, 'indicators', columns)
+      with open(expected_path, 'rb') as json_file: expected: bytes = json_file.read()
+
+      dump_time: float = best_of(
+        lambda: dump_records(expected_path, 'indicators', columns), arguments.repeat
+      )
+      timings: List[str] = [f'json.dump: {dump_time * 1000:8.1f} ms']
+
+      for serializer in serializers:
+        json_writer: JsonWriter = JsonWriter(serializer)
+        json_writer.write_records(actual_path, 'indicators', columns)
+        with open(actual_path, 'rb') as json_file:
+          assert json_file.read() == expected, f'{serializer} output differs from json.dump ({rows} rows)'
+
+        write_time: float = best_of(
+          lambda: json_writer.write_records(actual_path, 'indicators', columns), arguments.repeat
+        )
+        timings.append(
+          f'write_records[{serializer}]: {write_time * 1000:7.1f} ms ({dump_time / write_time:4.1f}x)'
+        )
+
+      print(f'{rows:>6} rows | ' + ' | '.join(timings) + ' | byte-identical: True')
+
+
+if __name__ == "__main__": main()
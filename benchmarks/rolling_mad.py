@@ -0,0 +1,72 @@
+import numpy as np
+from time import perf_counter
+from pandas import Series
+from typing import List, Callable
+from argparse import ArgumentParser, Namespace
+
+from stock_indicator.technical_indicator_v2 import TechnicalIndicator
+
+
+"""
+
+  -- Benchmark: Rolling Mean Absolute Deviation (CCI) --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+  usage  : python -m benchmarks.rolling_mad [--rows 10000 50000 100000]
+
+"""
+
+
+def best_of(function: Callable[[], np.ndarray], repeat: int) -> float:
+  timings: List[float] = []
+  for _ in range(repeat):
+    start: float = perf_counter()
+    function()
+    timings.append(perf_counter() - start)
+  return min(timings)
+
+def rolling_apply_mad(typical_price: Series, window_size: int) -> np.ndarray:
+  # previous implementation: one python callback per window
+  return typical_price.rolling(window = window_size).apply(
+    lambda x: np.mean(np.abs(x - np.mean(x))), raw = True
+  ).values
+
+def main() -> None:
+  parser: ArgumentParser = ArgumentParser(description = "rolling MAD benchmark")
+  parser.add_argument('--rows',   type = int, nargs = '+', default = [10_000, 50_000, 100_000])
+  parser.add_argument('--window', type = int, default = 20)
+  parser.add_argument('--repeat', type = int, default = 3)
+  arguments: Namespace = parser.parse_args()
+
+  strided_mad: Callable[[np.ndarray, int], np.ndarray] = \
+    TechnicalIndicator()._TechnicalIndicator__rolling_mean_absolute_deviation
+
+  random_generator: np.random.Generator = np.random.default_rng(2024)
+  for rows in arguments.rows:
+    # random walk price series with a few missing sessions
+    typical_price: Series = Series(1000 + np.cumsum(random_generator.normal(0, 5, rows)))
+    typical_price.iloc[random_generator.choice(rows, rows // 1000, replace = False)] = np.nan
+
+    expected: np.ndarray = rolling_apply_mad(typical_price, arguments.window)
+    actual:   np.ndarray = strided_mad(typical_price.values, arguments.window)
+    assert np.allclose(actual, expected, equal_nan = True), f'rolling MAD mismatch ({rows} rows)'
+
+    rolling_apply_time: float = best_of(
+      lambda: rolling_apply_mad(typical_price, arguments.window), arguments.repeat
+    )
+    strided_time: float = best_of(
+      lambda: strided_mad(typical_price.values, arguments.window), arguments.repeat
+    )
+    print(
+      f'{rows:>7} rows | rolling().apply(): {rolling_apply_time * 1000:9.1f} ms | '
+      f'sliding_window_view: {strided_time * 1000:7.1f} ms | '
+      f'{rolling_apply_time / strided_time:6.1f}x | '
+      f'bit-identical: {np.array_equal(actual, expected, equal_nan = True)}'
+    )
+
+
+if __name__ == "__main__": main()
@@ -1,16 +1,23 @@
 from pandas import DataFrame
+from typing import Any, List, Dict, Optional
 from argparse import ArgumentParser, Namespace
 
 from stock_sorting.sorter import Sorter
 from stock_scraping.infographic_scraper import InfographicScraper
 from stock_workflow.workloads_per_workflow import WorkloadsPerWorkflow
+from stock_workflow.pipeline_runner import PipelineStage, PipelineRunner, PartialResult
+from stock_storage.table_storage import TableStorage
+from stock_storage.modeling_panel import ModelingPanel
+from stock_storage.feature_tensor import FeatureTensor
 
-# from stock_scraping.historical_scraper import HistoricalScraper
-from stock_scraping.historical_scraper_cythonize import HistoricalScraper
+from stock_report.report_queue import ReportQueue
+from stock_scraping.historical_scraper import HistoricalScraper
+# from stock_scraping.historical_scraper_cythonize import HistoricalScraper
 from stock_indicator.technical_indicator_v2 import TechnicalIndicator
 # from stock_indicator.technical_indicator_cythonize import TechnicalIndicator
 
 from settings.logging_rules import logger
+from settings.location_rules import LocationRules
 
 from warnings import filterwarnings
 filterwarnings("ignore")
@@ -31,31 +38,226 @@ filterwarnings("ignore")
 def gen_new_data_requirements(v: str) -> bool:
   return v.lower() in ('true', '1', 'yes', 'y')
 
-def run_pipeline(arguments: Namespace) -> None:
-  try:
-    stocks_infographic: DataFrame = \
-      InfographicScraper().get_stocks_infographic(
-        generate_new_data  = arguments.gen_new_data, 
-        get_stocks_process = arguments.process
-      )
+def build_stages(arguments: Namespace) -> List[PipelineStage]:
+  storage: TableStorage = TableStorage()
+  report_queue: ReportQueue = ReportQueue.shared()
 
-    sorting_by_infographic: DataFrame = \
-      Sorter().by_default_infographic(
-        infographic = stocks_infographic,
-        ranking = {
-          'ranking_by': arguments.ranking_by,
-          'number'    : int(arguments.ranking_number)
-        }
-      )
+  # stage inputs / outputs (tables in the storage format, no PDF: the
+  # report pool may still be writing them when a stage is done)
+  infographic_csv: str = LocationRules.DATASET_INFOGRAPHIC_CSV_PATH
+  ranking_table:   str = storage.get_path(LocationRules.DATASET_RANKING_CSV_PATH)
+  historicals:     str = f'{LocationRules.DATASET_HISTORICAL_CSV_PATH}/*.{storage.extension}'
+  fundamentals:    str = f'{LocationRules.DATASET_FUNDAMENTAL_JSON_PATH}/*.json'
+  modeling_tables: str = f'{LocationRules.DATASET_MODELING_CSV_PATH}/*.{storage.extension}'
+
+  # stage callables return False when the wrapped call failed (those
+  # methods log and swallow their errors), so the runner marks them FAILED
+  def get_infographic(generate_new_data: bool) -> DataFrame:
+    infographic: Optional[DataFrame] = InfographicScraper().get_stocks_infographic(
+      generate_new_data  = generate_new_data,
+      get_stocks_process = arguments.process
+    )
+    return False if infographic is None else infographic
+
+  def rank(results: Dict[str, Any]) -> DataFrame:
+    sorting_by_infographic: DataFrame = Sorter().by_default_infographic(
+      infographic = results['infographic'].copy(),
+      ranking = {
+        'ranking_by': arguments.ranking_by,
+        'number'    : int(arguments.ranking_number)
+      },
+      generate_artefacts = False
+    )
+    return sorting_by_infographic
+
+  def generate_artefacts(results: Dict[str, Any]) -> bool:
+    is_generated: bool = Sorter().generate_artefacts(infographic = results['ranking'])
+    report_queue.flush()
+    return is_generated
+
+  # None: the whole process failed (False, the stage fails); failed
+  # symbols: the stage is partial, the other symbols go on to the next
+  # stages and a resume run retries the failed ones
+  def symbols_result(failed_symbols: Optional[List[str]], dataframe: DataFrame) -> Any:
+    if failed_symbols is None: return False
+    if not failed_symbols: return True
+
+    # the indicator returns the codes without the ".JK" suffix: keep the
+    # ranking symbols, so a retry selects the same rows
+    failed_symbols: List[str] = [
+      symbol for symbol in dataframe['symbol'].tolist()
+        if (symbol in failed_symbols) or (symbol[:len(symbol) - 3] in failed_symbols)
+    ]
+    return PartialResult(failed = failed_symbols, total = len(dataframe))
+
+  # symbols: retry of the failed symbols only (resume run)
+  def get_historicals(results: Dict[str, Any], symbols: Optional[List[str]] = None) -> Any:
+    ranking: DataFrame = results['ranking']
+    if symbols is not None: ranking = ranking[ranking['symbol'].isin(symbols)]
 
     historical: HistoricalScraper = HistoricalScraper()
-    historical.get_by_dataframe_sync(dataframe = sorting_by_infographic)
+    if arguments.historical_process == 'BATCH':
+      failed_symbols: Optional[List[str]] = historical.get_by_dataframe_batch(dataframe = ranking)
+    elif arguments.historical_process == 'ASYNCIO':
+      failed_symbols: Optional[List[str]] = historical.get_by_dataframe_asyncio(dataframe = ranking)
+    elif arguments.historical_process == 'ASYNC':
+      failed_symbols: Optional[List[str]] = historical.get_by_dataframe_async(dataframe = ranking)
+    else:
+      failed_symbols: Optional[List[str]] = historical.get_by_dataframe_sync(dataframe = ranking)
+
+    return symbols_result(failed_symbols, ranking)
+
+  def generate_indicators(results: Dict[str, Any], symbols: Optional[List[str]] = None) -> Any:
+    ranking: DataFrame = results['ranking']
+    if symbols is not None: ranking = ranking[ranking['symbol'].isin(symbols)]
 
     technical: TechnicalIndicator = TechnicalIndicator()
-    technical.generate_indicator_by_dataframe_sync(dataframe = sorting_by_infographic)
+    if arguments.indicator_process == 'PANEL':
+      failed_symbols: Optional[List[str]] = technical.generate_indicator_by_dataframe_panel(dataframe = ranking)
+    elif arguments.indicator_process == 'PARALLEL':
+      failed_symbols: Optional[List[str]] = technical.generate_indicator_by_dataframe_parallel(dataframe = ranking)
+    else:
+      failed_symbols: Optional[List[str]] = technical.generate_indicator_by_dataframe_sync(dataframe = ranking)
+    report_queue.flush()
+
+    return symbols_result(failed_symbols, ranking)
+
+  stages: List[PipelineStage] = [
+    PipelineStage(
+      name      = 'infographic',
+      run       = lambda results: get_infographic(arguments.gen_new_data),
+      outputs   = [infographic_csv],
+      cacheable = not arguments.gen_new_data,
+      load      = lambda: get_infographic(False)
+    ),
+    PipelineStage(
+      name       = 'ranking',
+      run        = rank,
+      after      = ['infographic'],
+      inputs     = [infographic_csv],
+      outputs    = [ranking_table],
+      parameters = [arguments.ranking_by, int(arguments.ranking_number)],
+      load       = lambda: storage.read(LocationRules.DATASET_RANKING_CSV_PATH)
+    )
+  ]
+
+  # optional: ranking profiles (CSV / JSON per profile) over the same infographic
+  if arguments.ranking_profiles:
+    def rank_profiles(results: Dict[str, Any]) -> Dict[str, DataFrame]:
+      sorter: Sorter = Sorter()
+      profiles: List[Dict[str, Any]] = sorter.read_profiles(arguments.ranking_profiles)
+      rankings: Dict[str, DataFrame] = sorter.by_profiles(
+        infographic = results['infographic'].copy(),
+        profiles    = profiles
+      )
+
+      # unreadable profiles, or a profile was rejected or failed
+      return rankings if (profiles and (len(rankings) == len(profiles))) else False
+
+    stages.append(PipelineStage(
+      name    = 'ranking_profiles',
+      run     = rank_profiles,
+      after   = ['infographic'],
+      inputs  = [infographic_csv, arguments.ranking_profiles],
+      outputs = [f'{LocationRules.DATASET_RANKING_PROFILES_PATH}/*.{storage.extension}']
+    ))
+
+  # ranking only: no artefacts, the pipeline stops after the ranking table
+  if arguments.ranking_mode == 'RANKING_ONLY': return stages
+
+  stages += [
+    # inline: next to the historical download; deferred: after it
+    PipelineStage(
+      name    = 'ranking_artefacts',
+      run     = generate_artefacts,
+      after   = ['ranking'] if arguments.ranking_mode == 'INLINE' else ['ranking', 'historical'],
+      inputs  = [ranking_table],
+      outputs = [
+        LocationRules.DATASET_RANKING_JSON_PATH,
+        LocationRules.DATASET_SECTOR_JSON_PATH,
+        fundamentals
+      ]
+    ),
+    PipelineStage(
+      name      = 'historical',
+      run       = get_historicals,
+      retry     = get_historicals,
+      after     = ['ranking'],
+      inputs    = [ranking_table],
+      outputs   = [historicals],
+      cacheable = False
+    ),
+    # reads the short names of the fundamentals JSON
+    PipelineStage(
+      name       = 'indicator',
+      run        = generate_indicators,
+      retry      = generate_indicators,
+      after      = ['historical', 'ranking_artefacts'],
+      inputs     = [ranking_table, historicals, fundamentals],
+      outputs    = [
+        f'{LocationRules.DATASET_INDICATOR_CSV_PATH}/*.{storage.extension}',
+        f'{LocationRules.DATASET_INDICATOR_CSV_PATH}/*.json',
+        f'{LocationRules.DATASET_HISTORICAL_CSV_PATH}/*.json',
+        f'{LocationRules.DATASET_MINMAX_CSV_PATH}/*.json',
+        modeling_tables
+      ],
+      parameters = storage.storage_format
+    ),
+    PipelineStage(
+      name    = 'workloads',
+      run     = lambda results: WorkloadsPerWorkflow().generate_workloads(),
+      after   = ['indicator'],
+      inputs  = [modeling_tables],
+      outputs = [LocationRules.DATASET_WOKLOADS_JSON_PATH]
+    )
+  ]
+
+  # optional: every symbol's modeling table consolidated in one file
+  if arguments.modeling_panel:
+    stages.append(PipelineStage(
+      name    = 'modeling_panel',
+      run     = lambda results: ModelingPanel().generate_panel() or False,
+      after   = ['indicator'],
+      inputs  = [modeling_tables, f'{LocationRules.DATASET_MINMAX_CSV_PATH}/*.json'],
+      outputs = [
+        LocationRules.DATASET_MODELING_PANEL_PATH,
+        LocationRules.DATASET_MODELING_PANEL_INDEX_PATH
+      ]
+    ))
+
+  # optional: float32 memory-mapped feature tensors for the trainer
+  if arguments.modeling_tensor in ('SYMBOL', 'PANEL'):
+    feature_tensor: FeatureTensor = FeatureTensor()
+    stages.append(PipelineStage(
+      name       = 'modeling_tensor',
+      run        = lambda results: (
+        feature_tensor.export_symbols() if arguments.modeling_tensor == 'SYMBOL'
+          else feature_tensor.export_panel()
+      ) or False,
+      after      = ['indicator'],
+      inputs     = [modeling_tables, f'{LocationRules.DATASET_MINMAX_CSV_PATH}/*.json'],
+      outputs    = [f'{LocationRules.DATASET_MODELING_TENSOR_PATH}/*.npy'],
+      parameters = arguments.modeling_tensor
+    ))
 
-    workloads_per_workflow: WorkloadsPerWorkflow = WorkloadsPerWorkflow()
-    workloads_per_workflow.generate_workloads()
+  return stages
+
+
+def run_pipeline(arguments: Namespace) -> None:
+  try:
+    # PDF reports: rendered inline, or collected and rendered on a process pool
+    # while the next stages run
+    report_queue: ReportQueue = ReportQueue.shared()
+    if arguments.report_process == 'POOL': report_queue.defer()
+
+    # stage DAG: unchanged stages skipped, independent stages concurrent,
+    # "resume" continues an unfinished run from its failed stage
+    PipelineRunner(
+      resume                = arguments.resume,
+      maximum_failure_ratio = arguments.maximum_failure_ratio
+    ).run(build_stages(arguments))
+
+    report_queue.wait()
 
   except Exception as error_message:
     logger.error(error_message)
@@ -72,8 +274,8 @@ def main() -> None:
     )
     parser.add_argument(
       '-proc', '--process',
-      type = str, required = True, choices = ['SYNC', 'ASYNC'],
-      help = 'Get Stocks Process [options: SYNC, ASYNC]'
+      type = str, required = True, choices = ['SYNC', 'ASYNC', 'ASYNCIO'],
+      help = 'Get Stocks Process [options: SYNC, ASYNC, ASYNCIO]'
     )
     parser.add_argument(
       '-rank_by',  '--ranking_by',
@@ -84,6 +286,52 @@ def main() -> None:
       '-rank_num', '--ranking_number',
       type = int, required = True, help = 'Ranking Number'
     )
+    parser.add_argument(
+      '-rank_mode', '--ranking_mode',
+      type = str, required = False, default = 'INLINE', choices = ['INLINE', 'DEFERRED', 'RANKING_ONLY'],
+      help = 'Ranking Artefacts (JSON / PDF) [options: INLINE, DEFERRED, RANKING_ONLY; default: INLINE]'
+    )
+    parser.add_argument(
+      '-rank_prof', '--ranking_profiles',
+      type = str, required = False, default = None,
+      help = 'Ranking Profiles JSON (list of {name, required_columns, is_ascendings, ranking}) [optional]'
+    )
+    parser.add_argument(
+      '-hist_proc', '--historical_process',
+      type = str, required = False, default = 'SYNC', choices = ['SYNC', 'ASYNC', 'ASYNCIO', 'BATCH'],
+      help = 'Get Historical Process [options: SYNC, ASYNC, ASYNCIO, BATCH; default: SYNC]'
+    )
+    parser.add_argument(
+      '-ind_proc', '--indicator_process',
+      type = str, required = False, default = 'SYNC', choices = ['SYNC', 'PANEL', 'PARALLEL'],
+      help = 'Generate Indicator Process [options: SYNC, PANEL, PARALLEL; default: SYNC]'
+    )
+
+    parser.add_argument(
+      '-panel', '--modeling_panel',
+      type = gen_new_data_requirements, required = False, default = False,
+      help = 'Consolidated Modeling Panel [options: True, False; default: False]'
+    )
+    parser.add_argument(
+      '-tensor', '--modeling_tensor',
+      type = str, required = False, default = 'NONE', choices = ['NONE', 'SYMBOL', 'PANEL'],
+      help = 'Modeling Feature Tensor (float32 .npy) [options: NONE, SYMBOL, PANEL; default: NONE]'
+    )
+    parser.add_argument(
+      '-resume', '--resume',
+      type = gen_new_data_requirements, required = False, default = False,
+      help = 'Resume the last unfinished run from its failed stage [options: True, False; default: False]'
+    )
+    parser.add_argument(
+      '-max_fail', '--maximum_failure_ratio',
+      type = float, required = False, default = None,
+      help = 'Failed Symbols Ratio above which a stage fails [default: 0.5]'
+    )
+    parser.add_argument(
+      '-rep_proc', '--report_process',
+      type = str, required = False, default = 'INLINE', choices = ['INLINE', 'POOL'],
+      help = 'Generate PDF Report Process [options: INLINE, POOL; default: INLINE]'
+    )
 
     arguments: Namespace = parser.parse_args()
     run_pipeline(arguments)
@@ -2,6 +2,12 @@ class LocationRules:
   # Dataset Main Location
   DATASET_MAIN_PATH:             str = 'indonesia_stocks'
 
+  # Dataset tables storage format: 'csv', 'parquet' or 'feather' (see TableStorage)
+  DATASET_STORAGE_FORMAT:        str = 'csv'
+
+  # JSON serializer: 'auto' (orjson if installed), 'orjson' or 'json' (see JsonWriter)
+  DATASET_JSON_SERIALIZER:       str = 'auto'
+
   # Infographic Location
   DATASET_SECTOR_JSON_PATH:      str = f'{DATASET_MAIN_PATH}/sectors.json'
   DATASET_RANKING_CSV_PATH:      str = f'{DATASET_MAIN_PATH}/top_50_stocks.csv'
@@ -9,11 +15,15 @@ class LocationRules:
   DATASET_INFOGRAPHIC_CSV_PATH:  str = f'{DATASET_MAIN_PATH}/infographic_stocks.csv'
   DATASET_FUNDAMENTAL_JSON_PATH: str = f'{DATASET_MAIN_PATH}/fundamentals'
 
+  # Ranking Profiles Location (one CSV / JSON per profile, see Sorter.by_profiles)
+  DATASET_RANKING_PROFILES_PATH: str = f'{DATASET_MAIN_PATH}/ranking_profiles'
+
   # Historical Location
   DATASET_HISTORICAL_CSV_PATH:  str = f'{DATASET_MAIN_PATH}/historicals'
 
   # Indicator Location
   DATASET_INDICATOR_CSV_PATH:   str = f'{DATASET_MAIN_PATH}/indicators'
+  DATASET_INDICATOR_STATE_PATH: str = f'{DATASET_MAIN_PATH}/indicator_states'
 
   # Modeling Location
   DATASET_MODELING_CSV_PATH:    str = f'{DATASET_MAIN_PATH}/modeling_datas'
@@ -21,6 +31,19 @@ class LocationRules:
   # Min-Max Location
   DATASET_MINMAX_CSV_PATH:      str = f'{DATASET_MAIN_PATH}/min_max'
 
+  # Modeling Panel Location (every symbol in one file, see ModelingPanel)
+  DATASET_MODELING_PANEL_PATH:       str = f'{DATASET_MAIN_PATH}/modeling_panel.parquet'
+  DATASET_MODELING_PANEL_INDEX_PATH: str = f'{DATASET_MAIN_PATH}/modeling_panel.json'
+
+  # Modeling Tensor Location (float32 .npy + JSON header, see FeatureTensor)
+  DATASET_MODELING_TENSOR_PATH: str = f'{DATASET_MAIN_PATH}/modeling_tensors'
+
+  # Artefact manifest (inputs hash of the PDF / JSON artefacts)
+  DATASET_ARTEFACT_MANIFEST_PATH: str = f'{DATASET_MAIN_PATH}/artefacts_manifest.json'
+
+  # Pipeline state (stage fingerprints / statuses, see PipelineRunner)
+  DATASET_PIPELINE_STATE_PATH: str = f'{DATASET_MAIN_PATH}/pipeline_state.json'
+
   # Workloads
   DATASET_WOKLOADS_JSON_PATH:   str = f'{DATASET_MAIN_PATH}/workloads'
   
\ No newline at end of file
@@ -1,9 +1,35 @@
+from os import cpu_count
 from typing import List, Dict, Any
 
 class ScraperRules:
   # Main
-  SCRAPER_RATE_LIMIT_HANDLE: int = 1
   SCRAPER_THREAD_WORKER:     int = 25
+  SCRAPER_PROCESS_WORKER:    int = cpu_count() or 1
+
+  # Historical (incremental download)
+  SCRAPER_HISTORICAL_START_DATE:   str = '2023-01-01'
+  SCRAPER_HISTORICAL_OVERLAP_DAYS: int = 7
+  SCRAPER_HISTORICAL_BATCH_SIZE:   int = 20
+  # relative price difference on the overlap window that triggers a full
+  # re-download (split / dividend re-adjusted history)
+  SCRAPER_HISTORICAL_ADJUSTED_TOLERANCE: float = 1e-6
+
+  # Rate limiter (token bucket shared by the scrapers, adaptive on HTTP 429)
+  SCRAPER_RATE_LIMIT:      float = 2.0 # requests per second
+  SCRAPER_RATE_BURST:      int   = 5
+  SCRAPER_RATE_MINIMUM:    float = 0.2
+  SCRAPER_RATE_DECREASE:   float = 0.5
+  SCRAPER_RATE_INCREASE:   float = 0.05
+  SCRAPER_BACKOFF_BASE:    int   = 3
+  SCRAPER_BACKOFF_MAXIMUM: int   = 60
+
+  # Asyncio engine
+  SCRAPER_ASYNC_CONCURRENCY: int   = 10
+  SCRAPER_ASYNC_RATE_LIMIT:  float = 5.0 # requests per second
+  SCRAPER_ASYNC_BURST:       int   = 10
+  SCRAPER_ASYNC_TIMEOUT:     int   = 30
+  SCRAPER_YAHOO_BASE_URL:    str   = 'https://query2.finance.yahoo.com'
+  SCRAPER_YAHOO_COOKIE_URL:  str   = 'https://fc.yahoo.com'
 
   # Retry mechanism
   SCRAPER_MAXIMUM_RETRY:     int = 10
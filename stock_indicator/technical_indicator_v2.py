@@ -1,16 +1,25 @@
 import numpy as np
+from hashlib import sha256
+from scipy.signal import lfilter
+from numpy.lib.stride_tricks import sliding_window_view
 from json import dump, load
-from typing import Any, List, Dict, Tuple
-from pandas import Series, DataFrame, read_csv, to_datetime, isnull
+from typing import Any, List, Dict, Tuple, Union, Optional
+from pandas.util import hash_pandas_object
+from pandas import Index, Series, DataFrame, to_datetime, isnull, concat
 
 from os import makedirs
 from os.path import exists as file_is_exists
+from multiprocessing import get_context
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from settings.logging_rules import logger
 from settings.scraper_rules import ScraperRules
 from settings.location_rules import LocationRules
 
-from stock_report.pdf_report import PdfReport
+from stock_report.report_queue import ReportQueue
+from stock_report.artefact_cache import ArtefactCache
+from stock_storage.table_storage import TableStorage
+from stock_storage.json_writer import JsonWriter
 
 from warnings import filterwarnings
 filterwarnings("ignore")
@@ -29,6 +38,164 @@ filterwarnings("ignore")
 
 
 class TechnicalIndicator(ScraperRules, LocationRules):
+  # day maping
+  DAY_NAME_MAPPING: Dict[str, str] = {
+    'Monday':    'Senin',
+    'Tuesday':   'Selasa',
+    'Wednesday': 'Rabu',
+    'Thursday':  'Kamis',
+    'Friday':    'Jumat',
+    'Saturday':  'Sabtu',
+    'Sunday':    'Minggu',
+  }
+
+  # month maping
+  MONTH_NAME_MAPPING: Dict[str, str] = {
+    'January':   'Januari',
+    'February':  'Februari',
+    'March':     'Maret',
+    'April':     'April',
+    'May':       'Mei',
+    'June':      'Juni',
+    'July':      'Juli',
+    'August':    'Agustus',
+    'September': 'September',
+    'October':   'Oktober',
+    'November':  'November',
+    'December':  'Desember',
+  }
+
+  # day / month names indexed by dt.dayofweek / (dt.month - 1)
+  # (the mappings above are in Monday..Sunday / January..December order)
+  DAY_NAMES:   np.ndarray = np.array(list(DAY_NAME_MAPPING.values()))
+  MONTH_NAMES: np.ndarray = np.array(list(MONTH_NAME_MAPPING.values()))
+
+  # output columns
+  INDICATOR_COLUMNS: List[str] = [
+    'MFI', 'RSI', 'MACD',
+    'BB_PERCENT_B', 'ATR',
+    'STOCH_K', 'STOCH_D',
+    'CCI', 'OBV', 'CMF'
+  ]
+
+  MODELING_COLUMNS: List[str] = ['Close', 'Volume'] + INDICATOR_COLUMNS
+
+  # historical columns read by the indicators (stored order)
+  HISTORICAL_COLUMNS: List[str] = ['Close', 'High', 'Low', 'Open', 'Volume']
+
+  # rows kept in the indicator state for the rolling indicators
+  # (largest window: Bollinger Bands, CCI & CMF -> 20)
+  INDICATOR_ROLLING_TAIL: int = 20
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - storage (dtype: Optional[TableStorage], default: TableStorage())
+
+    [ description ]:
+      Historical, indicator and modeling tables are read and written
+      through the storage backend (CSV, Parquet or Feather), the JSON
+      outputs through the JSON writer
+  """
+  def __init__(self, storage: Optional[TableStorage] = None) -> None:
+    self.storage: TableStorage = storage or TableStorage()
+    self.json_writer: JsonWriter = JsonWriter()
+
+  """
+    [ name ]:
+      __recursive_smoothing (return dtype: np.ndarray)
+
+    [ parameters ]
+      - values      (dtype: np.ndarray; shape: (rows,) or (rows, columns))
+      - window_size (dtype: int)
+      - alpha       (dtype: float)
+      - seed        (dtype: np.ndarray or float; default: mean of first window)
+      - previous    (dtype: np.ndarray or float; default: None)
+
+    [ description ]
+      Shared recursive smoothing kernel (first order IIR filter),
+      y[t] = (x[t] * alpha) + (y[t - 1] * (1 - alpha)), seeded on
+      index "window_size - 1". Computed with lfilter along axis 0,
+      bit-identical to the former per-element python loops.
+
+      With "previous" (last smoothed value of an earlier run) the
+      recursion continues from it without a warm-up window.
+  """
+  def __recursive_smoothing(
+    self, values: np.ndarray,
+    window_size:  int,
+    alpha:        float,
+    seed:         np.ndarray or float = None,
+    previous:     np.ndarray or float = None
+  ) -> np.ndarray:
+    values: np.ndarray = np.asarray(values, dtype = np.float64)
+
+    if previous is not None:
+      values = np.concatenate((np.reshape(previous, (1,) + values.shape[1:]), values))
+      return self.__recursive_smoothing(values, 1, alpha, seed = values[0])[1:]
+
+    smoothed: np.ndarray = np.full_like(values, np.nan, dtype = np.float64)
+
+    # mean over each column's own contiguous buffer, so 2-D seeds keep
+    # the same (pairwise) summation order as the 1-D np.mean
+    if seed is None:
+      seed = np.mean(np.ascontiguousarray(values[:window_size].T), axis = -1)
+
+    smoothed[window_size - 1] = seed
+    if len(values) <= window_size:
+      return smoothed
+
+    initial_state: np.ndarray = np.asarray(
+      (1 - alpha) * smoothed[window_size - 1], dtype = np.float64
+    ).reshape((1,) + values.shape[1:])
+
+    smoothed[window_size:], _ = lfilter(
+      [alpha], [1.0, -(1 - alpha)],
+      values[window_size:],
+      axis = 0,
+      zi   = initial_state
+    )
+
+    return smoothed
+
+
+  """
+    [ name ]:
+      __rolling_mean_absolute_deviation (return dtype: np.ndarray)
+
+    [ parameters ]
+      - values      (dtype: np.ndarray; shape: (rows,) or (rows, columns))
+      - window_size (dtype: int)
+
+    [ description ]
+      Rolling mean absolute deviation along axis 0, over strided
+      windows (sliding_window_view) instead of a python callback
+      per window. Same numerics as
+      rolling(window).apply(lambda x: np.mean(np.abs(x - np.mean(x))))
+  """
+  def __rolling_mean_absolute_deviation(
+    self, values: np.ndarray,
+    window_size:  int
+  ) -> np.ndarray:
+    values: np.ndarray = np.asarray(values, dtype = np.float64)
+    rolling_mad: np.ndarray = np.full_like(values, np.nan, dtype = np.float64)
+    if len(values) < window_size:
+      return rolling_mad
+
+    # one contiguous row per column, windows along the last axis
+    windows: np.ndarray = sliding_window_view(
+      np.ascontiguousarray(values.T), window_size, axis = -1
+    )
+    windows_mean: np.ndarray = np.mean(windows, axis = -1, keepdims = True)
+    rolling_mad[window_size - 1:] = \
+      np.mean(np.abs(windows - windows_mean), axis = -1).T
+
+    return rolling_mad
+
+
   """
     [ name ]:
       __simple_moving_average (return dtype: Series)
@@ -77,14 +244,18 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       - dataframe   (dtype: DataFrame)
       - column_name (dtype: str;       default: "Close")
       - window_size (dtype: int;       default: 20)
+      - state       (dtype: Dict[str, Any]; default: None)
 
     [ description ]
-      Exponential moving average
+      Exponential moving average.
+      state: pass {} to capture the smoothing state of this run,
+      or a captured state to continue from it (incremental update)
   """
   def __exponential_moving_average(
     self, dataframe: DataFrame,
     column_name:     str = 'Close',
-    window_size:     int = 20
+    window_size:     int = 20,
+    state:           Dict[str, Any] = None
   ) -> Series or np.ndarray:
     try:
       if column_name not in dataframe.columns:
@@ -92,20 +263,18 @@ class TechnicalIndicator(ScraperRules, LocationRules):
         return dataframe
 
       single_column: DataFrame = dataframe[column_name].values.astype(float)
-      if len(single_column) < window_size:
+      if (not state) and (len(single_column) < window_size):
         logger.critical('Amount of data is smaller than window')
         return dataframe
 
-      exponential_mov_avg: np.ndarray = np.full_like(single_column, np.nan, dtype = np.float64)
-      exponential_mov_avg[window_size - 1] = np.mean(single_column[:window_size])
-
       alpha: float = 2 / (window_size + 1)
+      exponential_mov_avg: np.ndarray = self.__recursive_smoothing(
+        single_column, window_size, alpha,
+        previous = state.get('average') if state else None
+      )
 
-      for _idx_col in range(window_size, len(single_column)):
-        exponential_mov_avg[_idx_col] = (
-          single_column[_idx_col] * alpha) + \
-            (exponential_mov_avg[_idx_col - 1] * (1 - alpha)
-        )
+      if (state is not None) and len(single_column):
+        state['average'] = float(exponential_mov_avg[-1])
 
       return Series(exponential_mov_avg, index = dataframe.index)
     
@@ -122,14 +291,18 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       - dataframe   (dtype: DataFrame)
       - column_name (dtype: str;       default: "Close")
       - window_size (dtype: int;       default: 14)
+      - state       (dtype: Dict[str, Any]; default: None)
 
     [ description ]
-      Relative Strength Index
+      Relative Strength Index.
+      state: pass {} to capture the smoothing state of this run,
+      or a captured state to continue from it (incremental update)
   """
   def __relative_strength_index(
     self, dataframe: DataFrame,
     column_name: str = 'Close',
-    window_size: int = 14
+    window_size: int = 14,
+    state:       Dict[str, Any] = None
   ) -> Series:
     try:
       if column_name not in dataframe.columns:
@@ -137,28 +310,28 @@ class TechnicalIndicator(ScraperRules, LocationRules):
         return dataframe
 
       single_column: DataFrame = dataframe[column_name].values.astype(float)
-      if len(single_column) < window_size:
+      if (not state) and (len(single_column) < window_size):
         logger.critical('Amount of data is smaller than window')
         return dataframe
 
-      delta: np.ndarray = np.diff(single_column, prepend = np.nan)
+      delta: np.ndarray = np.diff(
+        single_column, prepend = state.get('close') if state else np.nan
+      )
 
       gain_value: np.ndarray = np.where(delta > 0, delta, 0)
       loss_value: np.ndarray = np.where(delta < 0, -delta, 0)
 
-      average_gain: np.ndarray = np.full_like(single_column, np.nan)
-      average_gain[window_size - 1] = np.mean(gain_value[:window_size])
-
-      average_loss: np.ndarray = np.full_like(single_column, np.nan)
-      average_loss[window_size - 1] = np.mean(loss_value[:window_size])
-
       alpha: float = 2 / (window_size + 1)
 
-      for _idx_col in range(window_size, len(single_column)):
-        average_gain[_idx_col] = (gain_value[_idx_col] * alpha) + \
-          (average_gain[_idx_col - 1] * (1 - alpha))
-        average_loss[_idx_col] = (loss_value[_idx_col] * alpha) + \
-          (average_loss[_idx_col - 1] * (1 - alpha))
+      # gain & loss smoothed together: column 0 -> gain, column 1 -> loss
+      average_gain, average_loss = self.__recursive_smoothing(
+        np.column_stack((gain_value, loss_value)), window_size, alpha,
+        previous = state.get('average') if state else None
+      ).T
+
+      if (state is not None) and len(single_column):
+        state['close']   = float(single_column[-1])
+        state['average'] = [float(average_gain[-1]), float(average_loss[-1])]
 
       relative_strength: np.ndarray = average_gain / average_loss
       relative_strength_index: np.ndarray = 100 - (
@@ -179,13 +352,17 @@ class TechnicalIndicator(ScraperRules, LocationRules):
     [ parameters ]
       - dataframe   (dtype: DataFrame)
       - window_size (dtype: int;       default: 14)
+      - state       (dtype: Dict[str, Any]; default: None)
 
     [ description ]
-      Money Flow Index
+      Money Flow Index.
+      state: pass {} to capture the smoothing state of this run,
+      or a captured state to continue from it (incremental update)
   """
   def __money_flow_index(
     self, dataframe: DataFrame,
-    window_size: int = 14
+    window_size: int = 14,
+    state:       Dict[str, Any] = None
   ) -> Series:
     try:
       required_cols = ['High', 'Low', 'Close', 'Volume']
@@ -199,30 +376,30 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       volume: DataFrame = dataframe['Volume'].values.astype(float)
 
       typical_price: DataFrame = (high + low + close) / 3
-      if len(typical_price) < window_size:
+      if (not state) and (len(typical_price) < window_size):
         logger.critical("Amount of data is smaller than window")
         return dataframe
 
       raw_money_flow: DataFrame = typical_price * volume
 
-      delta_tp = np.diff(typical_price, prepend=np.nan)
+      delta_tp = np.diff(
+        typical_price, prepend = state.get('typical_price') if state else np.nan
+      )
 
       positive_flow: np.ndarray = np.where(delta_tp > 0, raw_money_flow, 0.0)
       negative_flow: np.ndarray = np.where(delta_tp < 0, raw_money_flow, 0.0)
 
-      average_pos: np.ndarray = np.full_like(typical_price, np.nan)
-      average_neg: np.ndarray = np.full_like(typical_price, np.nan)
-
-      average_pos[window_size - 1] = np.mean(positive_flow[:window_size])
-      average_neg[window_size - 1] = np.mean(negative_flow[:window_size])
-
       alpha: float = 2 / (window_size + 1)
 
-      for _idx_col in range(window_size, len(typical_price)):
-        average_pos[_idx_col] = (positive_flow[_idx_col] * alpha) + \
-          (average_pos[_idx_col - 1] * (1 - alpha))
-        average_neg[_idx_col] = (negative_flow[_idx_col] * alpha) + \
-          (average_neg[_idx_col - 1] * (1 - alpha))
+      # positive & negative flow smoothed together: column 0 -> pos, column 1 -> neg
+      average_pos, average_neg = self.__recursive_smoothing(
+        np.column_stack((positive_flow, negative_flow)), window_size, alpha,
+        previous = state.get('average') if state else None
+      ).T
+
+      if (state is not None) and len(typical_price):
+        state['typical_price'] = float(typical_price[-1])
+        state['average']       = [float(average_pos[-1]), float(average_neg[-1])]
 
       money_flow_ratio: np.ndarray = np.divide(
         average_pos, average_neg,
@@ -296,16 +473,19 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       - fast_window_size   (dtype: int;       default: 12)
       - slow_window_size   (dtype: int;       default: 26)
       - signal_window_size (dtype: int;       default: 9)
+      - state              (dtype: Dict[str, Any]; default: None)
 
     [ description ]
-      Moving Average Convergence Divergence
+      Moving Average Convergence Divergence.
+      state: pass {} to capture the fast & slow EMA states of this run
   """
   def __moving_average_convergence_divergence(
     self, dataframe: DataFrame,
     column_name:        str = "Close",
     fast_window_size:   int = 12,
     slow_window_size:   int = 26,
-    signal_window_size: int = 9
+    signal_window_size: int = 9,
+    state:              Dict[str, Any] = None
   ) -> Dict[str, Series]:
     try:
       if column_name not in dataframe.columns:
@@ -313,9 +493,11 @@ class TechnicalIndicator(ScraperRules, LocationRules):
         return dataframe
 
       exp_mov_avg_fast: Series = self.__exponential_moving_average(
-        dataframe, column_name, fast_window_size)
+        dataframe, column_name, fast_window_size,
+        state = None if state is None else state.setdefault('fast', {}))
       exp_mov_avg_slow: Series = self.__exponential_moving_average(
-        dataframe, column_name, slow_window_size)
+        dataframe, column_name, slow_window_size,
+        state = None if state is None else state.setdefault('slow', {}))
 
       macd_line: Series = exp_mov_avg_fast - exp_mov_avg_slow
       macd_line.dropna(inplace = True)
@@ -401,14 +583,18 @@ class TechnicalIndicator(ScraperRules, LocationRules):
     [ parameters ]
       - dataframe   (dtype: DataFrame)
       - window_size (dtype: int; default: 14)
+      - state       (dtype: Dict[str, Any]; default: None)
 
     [ description ]
       Average True Range — measures market volatility.
       Uses Wilder's smoothing (same as RSI) for consistency.
+      state: pass {} to capture the smoothing state of this run,
+      or a captured state to continue from it (incremental update)
   """
   def __average_true_range(
     self, dataframe: DataFrame,
-    window_size: int = 14
+    window_size: int = 14,
+    state:       Dict[str, Any] = None
   ) -> Series:
     try:
       required_cols = ['High', 'Low', 'Close']
@@ -421,7 +607,8 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       close: np.ndarray = dataframe['Close'].values.astype(float)
 
       prev_close: np.ndarray = np.roll(close, 1)
-      prev_close[0] = np.nan
+      if len(prev_close):
+        prev_close[0] = state.get('close') if state else np.nan
 
       true_range: np.ndarray = np.maximum(
         high - low,
@@ -431,14 +618,17 @@ class TechnicalIndicator(ScraperRules, LocationRules):
         )
       )
 
-      atr: np.ndarray = np.full_like(close, np.nan)
-      atr[window_size - 1] = np.nanmean(true_range[:window_size])
-
       # Wilder's smoothing
       wilder_alpha: float = 1 / window_size
-      for _idx_col in range(window_size, len(close)):
-        atr[_idx_col] = (true_range[_idx_col] * wilder_alpha) + \
-          (atr[_idx_col - 1] * (1 - wilder_alpha))
+      atr: np.ndarray = self.__recursive_smoothing(
+        true_range, window_size, wilder_alpha,
+        seed     = None if state else np.nanmean(true_range[:window_size]),
+        previous = state.get('average') if state else None
+      )
+
+      if (state is not None) and len(close):
+        state['close']   = float(close[-1])
+        state['average'] = float(atr[-1])
 
       return Series(atr, index=dataframe.index)
 
@@ -536,9 +726,8 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       rolling_mean: Series = typical_price.rolling(window=window_size).mean()
 
       # mean absolute deviation (manual — pandas mad() deprecated)
-      rolling_mad: Series = typical_price.rolling(window=window_size).apply(
-        lambda x: np.mean(np.abs(x - np.mean(x))), raw=True
-      )
+      rolling_mad: np.ndarray = \
+        self.__rolling_mean_absolute_deviation(typical_price.values, window_size)
 
       cci: Series = np.where(
         rolling_mad != 0,
@@ -559,13 +748,17 @@ class TechnicalIndicator(ScraperRules, LocationRules):
 
     [ parameters ]
       - dataframe (dtype: DataFrame)
+      - state     (dtype: Dict[str, Any]; default: None)
 
     [ description ]
       On-Balance Volume — cumulative volume indicator that maps
       buying/selling pressure. Trend direction matters more than value.
+      state: pass {} to capture the cumulative state of this run,
+      or a captured state to continue from it (incremental update)
   """
   def __on_balance_volume(
-    self, dataframe: DataFrame
+    self, dataframe: DataFrame,
+    state: Dict[str, Any] = None
   ) -> Series:
     try:
       required_cols = ['Close', 'Volume']
@@ -576,12 +769,21 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       close:  np.ndarray = dataframe['Close'].values.astype(float)
       volume: np.ndarray = dataframe['Volume'].values.astype(float)
 
-      delta:  np.ndarray = np.diff(close, prepend=np.nan)
+      delta:  np.ndarray = np.diff(
+        close, prepend = state.get('close') if state else np.nan
+      )
       direction: np.ndarray = np.sign(delta)   # +1, 0, -1
 
-      obv: np.ndarray = np.cumsum(np.where(
-        np.isnan(delta), 0, direction * volume
-      ))
+      obv_flow: np.ndarray = np.where(np.isnan(delta), 0, direction * volume)
+      if state:
+        # continue the running sum, same addition order as a full run
+        obv: np.ndarray = np.cumsum(np.concatenate(([state.get('obv')], obv_flow)))[1:]
+      else:
+        obv: np.ndarray = np.cumsum(obv_flow)
+
+      if (state is not None) and len(close):
+        state['close'] = float(close[-1])
+        state['obv']   = float(obv[-1])
 
       return Series(obv, index=dataframe.index)
 
@@ -641,6 +843,230 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       logger.error(error_message)
       return dataframe
 
+  """
+    [ name ]:
+      __panel_stack (return dtype: np.ndarray)
+
+    [ parameters ]
+      - dataframes  (dtype: List[DataFrame])
+      - column_name (dtype: str)
+
+    [ description ]
+      Stack one column of many symbols into a (rows, symbols) panel.
+      Every symbol is top-aligned on its own sessions (row i = i-th
+      session of the symbol), shorter histories are padded with NaN
+  """
+  def __panel_stack(
+    self, dataframes: List[DataFrame],
+    column_name:      str
+  ) -> np.ndarray:
+    max_rows: int = max((len(dataframe) for dataframe in dataframes), default = 0)
+    panel: np.ndarray = np.full((max_rows, len(dataframes)), np.nan, dtype = np.float64)
+
+    for _idx_symbol, dataframe in enumerate(dataframes):
+      panel[:len(dataframe), _idx_symbol] = dataframe[column_name].values.astype(float)
+
+    return panel
+
+
+  """
+    [ name ]:
+      __panel_dropna (return dtype: Tuple[Dict[str, np.ndarray], List[Index]])
+
+    [ parameters ]
+      - panel   (dtype: Dict[str, np.ndarray]; shape: (rows, symbols))
+      - indexes (dtype: List[Index])
+
+    [ description ]
+      Panel equivalent of "dataframe.dropna()", drop the rows that
+      have NaN on any column per symbol, then top-align the remaining
+      rows again. Keeps every symbol identical to its own sync process
+  """
+  def __panel_dropna(
+    self, panel: Dict[str, np.ndarray],
+    indexes:     List[Index]
+  ) -> Tuple[Dict[str, np.ndarray], List[Index]]:
+    is_valid: np.ndarray = ~np.any(
+      [np.isnan(values) for values in panel.values()], axis = 0
+    )
+
+    valid_rows: List[np.ndarray] = [
+      np.flatnonzero(is_valid[:len(index), _idx_symbol])
+      for _idx_symbol, index in enumerate(indexes)
+    ]
+    max_rows: int = max((len(rows) for rows in valid_rows), default = 0)
+
+    dropped_panel: Dict[str, np.ndarray] = {}
+    for column_name, values in panel.items():
+      dropped_values: np.ndarray = np.full((max_rows, len(indexes)), np.nan, dtype = np.float64)
+      for _idx_symbol, rows in enumerate(valid_rows):
+        dropped_values[:len(rows), _idx_symbol] = values[rows, _idx_symbol]
+      dropped_panel[column_name] = dropped_values
+
+    return dropped_panel, [
+      index[rows] for index, rows in zip(indexes, valid_rows)
+    ]
+
+
+  """
+    [ name ]:
+      __panel_indicators (return dtype: Dict[str, DataFrame])
+
+    [ parameters ]
+      - dataframes (dtype: Dict[str, DataFrame])
+
+    [ description ]
+      Compute MFI, RSI, MACD, Bollinger %B, ATR, Stochastic, CCI,
+      OBV and CMF column-wise over a (rows, symbols) panel in one
+      vectorized pass, then split the result back per symbol
+  """
+  def __panel_indicators(
+    self, dataframes: Dict[str, DataFrame]
+  ) -> Dict[str, DataFrame]:
+    symbols:    List[str]       = list(dataframes.keys())
+    historical: List[DataFrame] = list(dataframes.values())
+    indexes:    List[Index]     = [dataframe.index for dataframe in historical]
+
+    panel: Dict[str, np.ndarray] = {
+      column_name: self.__panel_stack(historical, column_name)
+      for column_name in ['Close', 'Volume', 'High', 'Low']
+    }
+
+    # --- existing indicators ---
+    high, low   = panel['High'], panel['Low']
+    close, volume = panel['Close'], panel['Volume']
+
+    typical_price:  np.ndarray = (high + low + close) / 3
+    raw_money_flow: np.ndarray = typical_price * volume
+    delta_tp:       np.ndarray = np.diff(typical_price, axis = 0, prepend = np.nan)
+
+    average_pos, average_neg = np.hsplit(self.__recursive_smoothing(
+      np.hstack((
+        np.where(delta_tp > 0, raw_money_flow, 0.0),
+        np.where(delta_tp < 0, raw_money_flow, 0.0)
+      )), 14, 2 / (14 + 1)
+    ), 2)
+    money_flow_ratio: np.ndarray = np.divide(
+      average_pos, average_neg,
+      out   = np.full_like(average_pos, np.nan),
+      where = average_neg != 0
+    )
+    panel['MFI'] = 100 - (100 / (1 + money_flow_ratio))
+
+    delta: np.ndarray = np.diff(close, axis = 0, prepend = np.nan)
+    average_gain, average_loss = np.hsplit(self.__recursive_smoothing(
+      np.hstack((
+        np.where(delta > 0, delta, 0),
+        np.where(delta < 0, -delta, 0)
+      )), 14, 2 / (14 + 1)
+    ), 2)
+    relative_strength: np.ndarray = average_gain / average_loss
+    panel['RSI'] = 100 - (
+      100 / (1 + np.where(average_loss == 0, np.nan, relative_strength))
+    )
+    panel, indexes = self.__panel_dropna(panel, indexes)
+
+    close: np.ndarray = panel['Close']
+    panel['MACD'] = \
+      self.__recursive_smoothing(close, 12, 2 / (12 + 1)) - \
+      self.__recursive_smoothing(close, 26, 2 / (26 + 1))
+    panel, indexes = self.__panel_dropna(panel, indexes)
+
+    # --- new indicators ---
+    high, low   = panel['High'], panel['Low']
+    close, volume = panel['Close'], panel['Volume']
+
+    # bollinger bands (%B)
+    close_frame:  DataFrame = DataFrame(close)
+    rolling_mean: DataFrame = close_frame.rolling(window = 20).mean()
+    rolling_std:  DataFrame = close_frame.rolling(window = 20).std(ddof = 0)
+    upper_band:   DataFrame = rolling_mean + (2.0 * rolling_std)
+    lower_band:   DataFrame = rolling_mean - (2.0 * rolling_std)
+    band_width:   DataFrame = upper_band - lower_band
+    panel['BB_PERCENT_B'] = np.where(
+      band_width != 0,
+      (close_frame - lower_band) / band_width,
+      np.nan
+    )
+
+    # average true range (Wilder's smoothing)
+    prev_close: np.ndarray = np.roll(close, 1, axis = 0)
+    prev_close[0] = np.nan
+    true_range: np.ndarray = np.maximum(
+      high - low,
+      np.maximum(
+        np.abs(high - prev_close),
+        np.abs(low  - prev_close)
+      )
+    )
+    panel['ATR'] = self.__recursive_smoothing(
+      true_range, 14, 1 / 14,
+      seed = np.nanmean(np.ascontiguousarray(true_range[:14].T), axis = -1)
+    )
+
+    # stochastic oscillator
+    high_frame: DataFrame = DataFrame(high)
+    low_frame:  DataFrame = DataFrame(low)
+    lowest_low:   DataFrame = low_frame.rolling(window = 14).min()
+    highest_high: DataFrame = high_frame.rolling(window = 14).max()
+    denominator:  DataFrame = highest_high - lowest_low
+    stoch_k: np.ndarray = np.where(
+      denominator != 0,
+      100 * (close_frame - lowest_low) / denominator,
+      np.nan
+    )
+    panel['STOCH_K'] = stoch_k
+    panel['STOCH_D'] = DataFrame(stoch_k).rolling(window = 3).mean().values
+
+    # commodity channel index
+    typical_frame: DataFrame = (high_frame + low_frame + close_frame) / 3
+    typical_mean:  DataFrame = typical_frame.rolling(window = 20).mean()
+    typical_mad:   np.ndarray = \
+      self.__rolling_mean_absolute_deviation(typical_frame.values, 20)
+    panel['CCI'] = np.where(
+      typical_mad != 0,
+      (typical_frame - typical_mean) / (0.015 * typical_mad),
+      np.nan
+    )
+
+    # on-balance volume
+    delta: np.ndarray = np.diff(close, axis = 0, prepend = np.nan)
+    panel['OBV'] = np.cumsum(np.where(
+      np.isnan(delta), 0, np.sign(delta) * volume
+    ), axis = 0)
+
+    # chaikin money flow
+    volume_frame: DataFrame = DataFrame(volume)
+    hl_range: np.ndarray = high - low
+    money_flow_multiplier: np.ndarray = np.where(
+      hl_range != 0,
+      ((close - low) - (high - close)) / hl_range,
+      0.0
+    )
+    money_flow_volume: DataFrame = DataFrame(money_flow_multiplier) * volume_frame
+    panel['CMF'] = (
+      money_flow_volume.rolling(window = 20).sum() /
+      volume_frame.rolling(window = 20).sum()
+    ).values
+
+    panel, indexes = self.__panel_dropna(panel, indexes)
+
+    # --- split back per symbol ---
+    indicators: Dict[str, DataFrame] = {}
+    for _idx_symbol, (symbol, index) in enumerate(zip(symbols, indexes)):
+      indicator: DataFrame = DataFrame({
+        column_name: values[:len(index), _idx_symbol]
+        for column_name, values in panel.items()
+      }, index = index)
+
+      # keep the original dtypes of the historical columns (e.g. Volume)
+      indicators[symbol] = indicator.astype(
+        dataframes[symbol][['Close', 'Volume', 'High', 'Low']].dtypes.to_dict()
+      )
+
+    return indicators
+
+
   """ 
     [ name ]:
       __csv_store_validation (return dtype: bool)
@@ -649,11 +1075,11 @@ class TechnicalIndicator(ScraperRules, LocationRules):
       - file_path (dtype: str)
 
     [ description ]:
-      To validate CSV
+      To validate the stored table
   """
   def __csv_store_validation(self, file_path: str) -> bool:
     try:
-      dataframe = read_csv(file_path)
+      dataframe = self.storage.read(file_path)
 
       # validation: if dataframe is empty
       if dataframe.empty: return False
@@ -698,16 +1124,16 @@ class TechnicalIndicator(ScraperRules, LocationRules):
 
   """
     [ name ]:
-      __retry_mechanism (return dtype: None)
+      __retry_mechanism (return dtype: List[str])
 
     [ parameters ]
       - failed_symbols (dtype: List[str])
 
     [ description ]
       Retry mechanism with throttling and exponential back-off,
-      to prevent scraping failure
+      to prevent scraping failure. Returns the symbols still failed
   """
-  def __retry_mechanism(self, failed_symbols: List[str]) -> None:
+  def __retry_mechanism(self, failed_symbols: List[str]) -> List[str]:
     try:
       retry_count: int = 0
       max_retries: int = self.SCRAPER_MAXIMUM_RETRY
@@ -719,69 +1145,75 @@ class TechnicalIndicator(ScraperRules, LocationRules):
         failed_symbols.clear()
           
         for symbol in stock_failed:
-          # json path
-          min_max_json_path:   str = f'{self.DATASET_MINMAX_CSV_PATH}/{symbol}.json'
-
-          # csv path
-          historical_csv_path: str = f'{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.csv'
-          indicator_csv_path:  str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.csv'
-          modeling_csv_path:   str = f'{self.DATASET_MODELING_CSV_PATH}/{symbol}.csv'
+          try:
+            # json path
+            min_max_json_path:   str = f'{self.DATASET_MINMAX_CSV_PATH}/{symbol}.json'
+
+            # csv path
+            historical_csv_path: str = f'{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.csv'
+            indicator_csv_path:  str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.csv'
+            modeling_csv_path:   str = f'{self.DATASET_MODELING_CSV_PATH}/{symbol}.csv'
           
-          dataframe: DataFrame = read_csv(historical_csv_path, index_col = 'Date')
-          dataframe.dropna(inplace = True)
+            dataframe: DataFrame = self.storage.read(
+              historical_csv_path, columns = self.HISTORICAL_COLUMNS, index_col = 'Date')
+            dataframe.dropna(inplace = True)
 
-          # --- existing indicators ---
-          dataframe['MFI']  = self.__money_flow_index(dataframe)
+            # --- existing indicators ---
+            dataframe['MFI']  = self.__money_flow_index(dataframe)
 
-          dataframe = dataframe[['Close', 'Volume', 'High', 'Low', 'MFI']]
-          dataframe['RSI']  = self.__relative_strength_index(dataframe)
-          dataframe.dropna(inplace = True)
+            dataframe = dataframe[['Close', 'Volume', 'High', 'Low', 'MFI']]
+            dataframe['RSI']  = self.__relative_strength_index(dataframe)
+            dataframe.dropna(inplace = True)
             
-          macd_result: Dict[str, Series] = \
-            self.__moving_average_convergence_divergence(dataframe)
-          dataframe['MACD'] = macd_result.get('line')
-          dataframe.dropna(inplace = True)
-
-          # --- new indicators ---
-          bb_result = self.__bollinger_bands(dataframe)
-          dataframe['BB_PERCENT_B'] = bb_result.get('percent_b')
-
-          dataframe['ATR'] = self.__average_true_range(dataframe)
-
-          stoch_result = self.__stochastic_oscillator(dataframe)
-          dataframe['STOCH_K'] = stoch_result.get('stoch_k')
-          dataframe['STOCH_D'] = stoch_result.get('stoch_d')
-
-          dataframe['CCI'] = self.__commodity_channel_index(dataframe)
-          dataframe['OBV'] = self.__on_balance_volume(dataframe)
-          dataframe['CMF'] = self.__chaikin_money_flow(dataframe)
-
-          dataframe.dropna(inplace = True)
-
-          dataframe_indicator: DataFrame = dataframe[
-            ['MFI', 'RSI', 'MACD',
-             'BB_PERCENT_B', 'ATR',
-             'STOCH_K', 'STOCH_D',
-             'CCI', 'OBV', 'CMF']
-          ].copy()
-          dataframe_indicator.to_csv(path_or_buf = indicator_csv_path)
-
-          dataframe_modeling: DataFrame = dataframe[
-            ['Close', 'Volume',
-             'MFI', 'RSI', 'MACD',
-             'BB_PERCENT_B', 'ATR',
-             'STOCH_K', 'STOCH_D',
-             'CCI', 'OBV', 'CMF']
-          ].copy()
-
-          dataframe_norm, dataframe_min_max = \
-            self.__min_max_normalization(dataframe_modeling)
+            macd_result: Dict[str, Series] = \
+              self.__moving_average_convergence_divergence(dataframe)
+            dataframe['MACD'] = macd_result.get('line')
+            dataframe.dropna(inplace = True)
+
+            # --- new indicators ---
+            bb_result = self.__bollinger_bands(dataframe)
+            dataframe['BB_PERCENT_B'] = bb_result.get('percent_b')
+
+            dataframe['ATR'] = self.__average_true_range(dataframe)
+
+            stoch_result = self.__stochastic_oscillator(dataframe)
+            dataframe['STOCH_K'] = stoch_result.get('stoch_k')
+            dataframe['STOCH_D'] = stoch_result.get('stoch_d')
+
+            dataframe['CCI'] = self.__commodity_channel_index(dataframe)
+            dataframe['OBV'] = self.__on_balance_volume(dataframe)
+            dataframe['CMF'] = self.__chaikin_money_flow(dataframe)
+
+            dataframe.dropna(inplace = True)
+
+            dataframe_indicator: DataFrame = dataframe[
+              ['MFI', 'RSI', 'MACD',
+               'BB_PERCENT_B', 'ATR',
+               'STOCH_K', 'STOCH_D',
+               'CCI', 'OBV', 'CMF']
+            ].copy()
+            self.storage.write(indicator_csv_path, dataframe_indicator)
+
+            dataframe_modeling: DataFrame = dataframe[
+              ['Close', 'Volume',
+               'MFI', 'RSI', 'MACD',
+               'BB_PERCENT_B', 'ATR',
+               'STOCH_K', 'STOCH_D',
+               'CCI', 'OBV', 'CMF']
+            ].copy()
+
+            dataframe_norm, dataframe_min_max = \
+              self.__min_max_normalization(dataframe_modeling)
             
-          with open(min_max_json_path, "w") as min_max_value:
-            dump(dataframe_min_max, min_max_value)
-          dataframe_norm.to_csv(path_or_buf = modeling_csv_path)
+            self.json_writer.write(min_max_json_path, dataframe_min_max)
+            self.storage.write(modeling_csv_path, dataframe_norm)
+
+            csv_file_is_valid: bool = self.__csv_store_validation(modeling_csv_path)
+
+          except Exception as error_message:
+            logger.error(f'{error_message} {symbol}')
+            csv_file_is_valid: bool = False
 
-          csv_file_is_valid: bool = self.__csv_store_validation(modeling_csv_path)
           if not csv_file_is_valid:
             failed_symbols.append(symbol)
             logger.warning(f'[ RETRY MECHANISM ] [ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
@@ -796,211 +1228,604 @@ class TechnicalIndicator(ScraperRules, LocationRules):
     except Exception as error_message:
       logger.error(error_message)
 
+    return failed_symbols
+
+
+  """ 
+    [ name ]:
+      __json_columns (return dtype: Dict[str, Union[List[str], np.ndarray]])
+
+    [ parameters ]:
+      - dataframe (dtype: DataFrame, DatetimeIndex)
+      - columns   (dtype: Dict[str, str], column name -> JSON key)
+
+    [ description ]:
+      JSON columns of the records ("date", "full_date", then the columns):
+      dates formatted once by numpy, Indonesian day / month names taken
+      from DAY_NAMES / MONTH_NAMES by dayofweek / month, values as float64
+      arrays (like the former iterrows rows), rows without a date skipped.
+      Written by JsonWriter.write_records without building the records
+  """
+  def __json_columns(
+    self, dataframe: DataFrame,
+    columns:         Dict[str, str]
+  ) -> Dict[str, Union[List[str], np.ndarray]]:
+    dataframe = dataframe[~isnull(dataframe.index)]
+    index: Index = dataframe.index
+
+    dates: List[str] = np.datetime_as_string(index.values, unit = 'D').tolist()
+    full_dates: List[str] = [
+      f'{day_name}, {date[8:10]} {month_name} {date[:4]}'
+        for day_name, month_name, date in zip(
+          self.DAY_NAMES[index.dayofweek].tolist(),
+          self.MONTH_NAMES[index.month - 1].tolist(),
+          dates
+        )
+    ]
+
+    return {
+      'date':      dates,
+      'full_date': full_dates,
+      **{
+        json_key: dataframe[column_name].to_numpy(dtype = np.float64)
+          for column_name, json_key in columns.items()
+      }
+    }
+
+
+  """ 
+    [ name ]:
+      __json_records (return dtype: List[Dict[str, Any]])
+
+    [ parameters ]:
+      - json_columns (dtype: Dict[str, Union[List[str], np.ndarray]])
+
+    [ description ]:
+      Records of JSON columns (the PDF reports iterate over records)
+  """
+  def __json_records(
+    self, json_columns: Dict[str, Union[List[str], np.ndarray]]
+  ) -> List[Dict[str, Any]]:
+    values: List[List[Any]] = [
+      column.tolist() if isinstance(column, np.ndarray) else column
+        for column in json_columns.values()
+    ]
+    return [dict(zip(json_columns.keys(), row)) for row in zip(*values)]
+
+
+  """ 
+    [ name ]:
+      __read_historical (return dtype: Tuple[DataFrame, str, Dict[str, Any]])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+
+    [ description ]:
+      Read historical CSV & company short name of a symbol,
+      and build its historical JSON columns
+  """
+  def __read_historical(
+    self, symbol: str
+  ) -> Tuple[DataFrame, str, Dict[str, Any]]:
+    fundamental_json_path: str = f'{self.DATASET_FUNDAMENTAL_JSON_PATH}/{symbol}.json'
+    historical_csv_path:   str = f'{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.csv'
+
+    dataframe: DataFrame = self.storage.read(
+      historical_csv_path, columns = self.HISTORICAL_COLUMNS, index_col = 'Date')
+    dataframe.index = to_datetime(dataframe.index, errors = 'coerce')
+
+    with open(fundamental_json_path, 'r') as fundamental_json:
+      fundamental_json_data: Dict[Any, Any] = load(fundamental_json)
+      short_name_company: str = fundamental_json_data \
+        .get('fundamentals').get('shortName')
+
+    logger.info(f'[ PROCESSED ] [ HISTORICAL ] [ {symbol} ] Generate Data...')
+
+    historical_columns: Dict[str, Any] = self.__json_columns(dataframe, {
+      'Open':  'open',
+      'High':  'high',
+      'Low':   'low',
+      'Close': 'close',
+      'Volume': 'volume'
+    })
+    logger.info(f'[ SUCCESS ] [ HISTORICAL ] [ {symbol} ] Generate Data Success...')
+
+    return dataframe, short_name_company, historical_columns
+
 
   """ 
     [ name ]:
-      generate_indicator_by_dataframe_sync (return dtype: None)
+      __store_indicator (return dtype: bool)
+
+    [ parameters ]:
+      - symbol          (dtype: str)
+      - short_name      (dtype: str)
+      - dataframe       (dtype: DataFrame)
+      - historical_columns (dtype: Dict[str, Any], JSON columns)
+
+    [ description ]:
+      Store indicator CSV & JSON, historical JSON, PDF reports,
+      min-max JSON and modeling CSV of a symbol.
+      return False if the modeling CSV is not valid
+  """
+  def __store_indicator(
+    self, symbol:    str,
+    short_name:      str,
+    dataframe:       DataFrame,
+    historical_columns: Dict[str, Any]
+  ) -> bool:
+    # json path
+    min_max_json_path: str = f'{self.DATASET_MINMAX_CSV_PATH}/{symbol}.json'
+
+    # csv path
+    indicator_csv_path: str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.csv'
+    modeling_csv_path:  str = f'{self.DATASET_MODELING_CSV_PATH}/{symbol}.csv'
+
+    # --- save indicator CSV & JSON ---
+    dataframe_indicator: DataFrame = dataframe[self.INDICATOR_COLUMNS].copy()
+    self.storage.write(indicator_csv_path, dataframe_indicator)
+
+    dataframe_indicator.index = to_datetime(dataframe_indicator.index, errors='coerce')
+    indicator_columns: Dict[str, Any] = self.__json_columns(
+      dataframe_indicator,
+      {column_name: column_name for column_name in self.INDICATOR_COLUMNS}
+    )
+
+    # JSON artefacts are skipped when unchanged (artefact manifest)
+    artefact_cache: ArtefactCache = ArtefactCache.shared()
+
+    indicator_json_path: str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.json'
+    if artefact_cache.write_json_records(indicator_json_path, 'indicators', indicator_columns):
+      logger.info(f'[ SAVED ] [ INDICATOR/TECHNICAL ] [ {symbol} ] Generate Data Saved on "{indicator_json_path}"...')
+
+    historical_columns = {
+      json_key: values[-len(indicator_columns['date']):]
+        for json_key, values in historical_columns.items()
+    }
+    historical_json_path: str = f'{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.json'
+    if artefact_cache.write_json_records(historical_json_path, 'historicals', historical_columns):
+      logger.info(f'[ SAVED ] [ HISTORICAL ] [ {symbol} ] Generate Data Saved on "{historical_json_path}"...')
+
+    artefact_cache.save()
+
+
+    # --- generate reports (rendered inline, or deferred to the report queue) ---
+    report_queue: ReportQueue = ReportQueue.shared()
+
+    logger.info(f'[ PROCESSED ] [ HISTORICAL ] [ PDF REPORT ] [ {symbol} ] Generate Report...')
+    report_queue.submit(
+      'generate_report_historicals', f'historicals/{symbol}.pdf',
+      symbol      = symbol,
+      short_name  = short_name,
+      historicals = self.__json_records(historical_columns)[::-1]
+    )
+
+    logger.info(f'[ PROCESSED ] [ INDICATOR/TECHNICAL ] [ PDF REPORT ] [ {symbol} ] Generate Report...')
+    report_queue.submit(
+      'generate_report_indicators', f'indicators/{symbol}.pdf',
+      symbol     = symbol,
+      short_name = short_name,
+      indicators = self.__json_records(indicator_columns)[::-1]
+    )
+
+
+    # --- normalization (modeling CSV) ---
+    dataframe_modeling: DataFrame = dataframe[self.MODELING_COLUMNS].copy()
+
+    dataframe_norm, dataframe_min_max = \
+      self.__min_max_normalization(dataframe_modeling)
+
+    self.json_writer.write(min_max_json_path, dataframe_min_max)
+    self.storage.write(modeling_csv_path, dataframe_norm)
+
+    return self.__csv_store_validation(modeling_csv_path)
+
+
+  """ 
+    [ name ]:
+      __history_hash (return dtype: str)
 
     [ parameters ]:
       - dataframe (dtype: DataFrame)
 
     [ description ]:
-      Generate indicator by dataframe (Synchronous Process)
+      Hash of historical rows (index & values), to detect revised history
+  """
+  def __history_hash(self, dataframe: DataFrame) -> str:
+    return sha256(
+      hash_pandas_object(dataframe, index = True).values.tobytes()
+    ).hexdigest()
+
+
+  """ 
+    [ name ]:
+      __load_indicator_state (return dtype: Dict[str, Any])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+
+    [ description ]:
+      Load the persisted indicator state of a symbol ({} if none)
   """
-  def generate_indicator_by_dataframe_sync(self, dataframe: DataFrame) -> None:
+  def __load_indicator_state(self, symbol: str) -> Dict[str, Any]:
     try:
-      if not file_is_exists(self.DATASET_INDICATOR_CSV_PATH):
-        makedirs(self.DATASET_INDICATOR_CSV_PATH)
+      state_json_path: str = f'{self.DATASET_INDICATOR_STATE_PATH}/{symbol}.json'
+      if not file_is_exists(state_json_path): return {}
 
-      if not file_is_exists(self.DATASET_MODELING_CSV_PATH):
-        makedirs(self.DATASET_MODELING_CSV_PATH)
+      with open(state_json_path, 'r') as state_json:
+        return load(state_json)
 
-      if not file_is_exists(self.DATASET_MINMAX_CSV_PATH):
-        makedirs(self.DATASET_MINMAX_CSV_PATH)
-      
-      failed_symbols: List[str] = []
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return {}
 
-      for symbol in dataframe['symbol'].tolist():
-        symbol: str = symbol[:len(symbol) - 3]
 
-        # json path
-        min_max_json_path:     str = f'{self.DATASET_MINMAX_CSV_PATH}/{symbol}.json'
-        fundamental_json_path: str = f'{self.DATASET_FUNDAMENTAL_JSON_PATH}/{symbol}.json'
-
-        # csv path
-        historical_csv_path: str = f'{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.csv'
-        indicator_csv_path:  str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.csv'
-        modeling_csv_path:   str = f'{self.DATASET_MODELING_CSV_PATH}/{symbol}.csv'
-        
-        dataframe: DataFrame = read_csv(historical_csv_path, index_col = 'Date')
-        dataframe.index = to_datetime(dataframe.index, errors = 'coerce')
-
-        with open(fundamental_json_path, 'r') as fundamental_json:
-          fundamental_json_data: Dict[Any, Any] = load(fundamental_json)
-          short_name_company: str = fundamental_json_data \
-            .get('fundamentals').get('shortName')
-        
-        # day maping
-        day_name_maping: Dict[str, str] = {
-          'Monday':    'Senin',
-          'Tuesday':   'Selasa',
-          'Wednesday': 'Rabu',
-          'Thursday':  'Kamis',
-          'Friday':    'Jumat',
-          'Saturday':  'Sabtu',
-          'Sunday':    'Minggu',
-        }
+  """ 
+    [ name ]:
+      __save_indicator_state (return dtype: None)
 
-        # month maping
-        month_name_maping: Dict[str, str] = {
-          'January':   'Januari',
-          'February':  'Februari',
-          'March':     'Maret',
-          'April':     'April',
-          'May':       'Mei',
-          'June':      'Juni',
-          'July':      'Juli',
-          'August':    'Agustus',
-          'September': 'September',
-          'October':   'Oktober',
-          'November':  'November',
-          'December':  'Desember',
-        }
+    [ parameters ]:
+      - symbol (dtype: str)
+      - state  (dtype: Dict[str, Any])
+
+    [ description ]:
+      Persist the indicator state of a symbol
+  """
+  def __save_indicator_state(self, symbol: str, state: Dict[str, Any]) -> None:
+    try:
+      state_json_path: str = f'{self.DATASET_INDICATOR_STATE_PATH}/{symbol}.json'
+      with open(state_json_path, 'w') as state_json:
+        dump(state, state_json)
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+
+
+  """ 
+    [ name ]:
+      __update_indicator (return dtype: Optional[DataFrame])
+
+    [ parameters ]:
+      - symbol     (dtype: str)
+      - historical (dtype: DataFrame)
+      - state      (dtype: Dict[str, Any])
+
+    [ description ]:
+      Incremental (append-only) update: compute indicators for the
+      historical rows added since the persisted state only, and append
+      them to the stored indicator CSV. The recursive indicators (MFI,
+      RSI, MACD, ATR, OBV) continue from their state, the rolling ones
+      are computed over the stored tail + the new rows.
+
+      return None (full recompute) if there is no usable state or the
+      already processed history was revised
+  """
+  def __update_indicator(
+    self, symbol: str,
+    historical:   DataFrame,
+    state:        Dict[str, Any]
+  ) -> Optional[DataFrame]:
+    try:
+      indicator_csv_path: str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.csv'
+      processed_rows:     int = state.get('rows', 0)
+
+      required_states: List[str] = ['MFI', 'RSI', 'MACD', 'ATR', 'OBV', 'tail']
+      if (not all(state.get(name) for name in required_states)) or \
+        (len(state['tail'].get('Close', [])) < self.INDICATOR_ROLLING_TAIL) or \
+        (not self.storage.exists(indicator_csv_path)):
+        return None
+
+      if (len(historical) < processed_rows) or historical.index.has_duplicates or \
+        (self.__history_hash(historical.iloc[:processed_rows]) != state.get('history_hash')):
+        logger.info(f'[ INCREMENTAL ] [ {symbol} ] History revised, full recompute...')
+        return None
+
+      indicator: DataFrame = self.storage.read(
+        indicator_csv_path, index_col = 'Date', round_trip = True)
+      indicator.index = to_datetime(indicator.index, errors = 'coerce')
+      if indicator.empty or (str(indicator.index[-1]) != state.get('indicator_last_date')):
+        return None
+
+      logger.info(f'[ INCREMENTAL ] [ {symbol} ] {len(historical) - processed_rows} new rows...')
+      dataframe: DataFrame = historical.iloc[processed_rows:].copy()
+
+      # --- existing indicators ---
+      dataframe['MFI'] = self.__money_flow_index(dataframe, state = state['MFI'])
+
+      dataframe = dataframe[['Close', 'Volume', 'High', 'Low', 'MFI']]
+      dataframe['RSI'] = self.__relative_strength_index(dataframe, state = state['RSI'])
+      dataframe.dropna(inplace = True)
+
+      dataframe['MACD'] = \
+        self.__exponential_moving_average(dataframe, 'Close', 12, state = state['MACD']['fast']) - \
+        self.__exponential_moving_average(dataframe, 'Close', 26, state = state['MACD']['slow'])
+      dataframe.dropna(inplace = True)
+
+      # --- new indicators ---
+      rolling_frame: DataFrame = concat([
+        DataFrame(state['tail']),
+        dataframe[['Close', 'Volume', 'High', 'Low']]
+      ], ignore_index = True)
+      tail_size: int = len(rolling_frame) - len(dataframe)
+
+      bb_result = self.__bollinger_bands(rolling_frame)
+      dataframe['BB_PERCENT_B'] = bb_result.get('percent_b').values[tail_size:]
 
-        logger.info(f'[ PROCESSED ] [ HISTORICAL ] [ {symbol} ] Generate Data...')
+      dataframe['ATR'] = self.__average_true_range(dataframe, state = state['ATR'])
 
-        historical_json: list[dict[str, str]] = []
-        for dt, row in dataframe.iterrows():
-          if isnull(dt):
-            continue
-          historical_json.append({
-            "date":      dt.strftime("%Y-%m-%d"),
-            "full_date": f"{day_name_maping[dt.strftime('%A')]}, {dt.strftime('%d')} {month_name_maping[dt.strftime('%B')]} {dt.strftime('%Y')}",
-            "open":      row["Open"],
-            "high":      row["High"],
-            "low":       row["Low"],
-            "close":     row["Close"],
-            "volume":    row["Volume"]
-          })
-        logger.info(f'[ SUCCESS ] [ HISTORICAL ] [ {symbol} ] Generate Data Success...')
+      stoch_result = self.__stochastic_oscillator(rolling_frame)
+      dataframe['STOCH_K'] = stoch_result.get('stoch_k').values[tail_size:]
+      dataframe['STOCH_D'] = stoch_result.get('stoch_d').values[tail_size:]
 
+      dataframe['CCI'] = self.__commodity_channel_index(rolling_frame).values[tail_size:]
+      dataframe['OBV'] = self.__on_balance_volume(dataframe, state = state['OBV'])
+      dataframe['CMF'] = self.__chaikin_money_flow(rolling_frame).values[tail_size:]
 
-        # indicator / technical
-        logger.info(f'[ PROCESSED ] [ INDICATOR/TECHNICAL ] [ {symbol} ] Generate Data...')
+      dataframe.dropna(inplace = True)
+      state['tail'] = rolling_frame.tail(self.INDICATOR_ROLLING_TAIL).to_dict('list')
+
+      indicator = concat([indicator, dataframe[self.INDICATOR_COLUMNS]])
+      return indicator.join(historical[['Close', 'Volume']])
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return None
+
+
+  """ 
+    [ name ]:
+      generate_indicator_by_symbol (return dtype: Tuple[bool, str])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+
+    [ description ]:
+      Generate indicator by symbol. Only the new historical rows are
+      computed when a persisted indicator state is usable (incremental
+      update), otherwise everything is recomputed and the state is saved
+  """
+  def generate_indicator_by_symbol(self, symbol: str) -> Tuple[bool, str]:
+    symbol: str = symbol[:len(symbol) - 3]
+    try:
+      historical, short_name_company, historical_columns = \
+        self.__read_historical(symbol)
+      history_hash: str = self.__history_hash(historical)
+
+      # indicator / technical
+      logger.info(f'[ PROCESSED ] [ INDICATOR/TECHNICAL ] [ {symbol} ] Generate Data...')
+
+      state: Dict[str, Any] = self.__load_indicator_state(symbol)
+      dataframe: Optional[DataFrame] = \
+        self.__update_indicator(symbol, historical, state) if state else None
+
+      if dataframe is None:
+        state: Dict[str, Any] = {'MFI': {}, 'RSI': {}, 'MACD': {}, 'ATR': {}, 'OBV': {}}
+        dataframe: DataFrame = historical
 
         # --- existing indicators ---
-        dataframe['MFI'] = self.__money_flow_index(dataframe)
+        dataframe['MFI'] = self.__money_flow_index(dataframe, state = state['MFI'])
 
         dataframe = dataframe[['Close', 'Volume', 'High', 'Low', 'MFI']]
-        dataframe['RSI']  = self.__relative_strength_index(dataframe)
+        dataframe['RSI']  = self.__relative_strength_index(dataframe, state = state['RSI'])
         dataframe.dropna(inplace = True)
 
         macd_result: Dict[str, Series] = \
-          self.__moving_average_convergence_divergence(dataframe)
+          self.__moving_average_convergence_divergence(dataframe, state = state['MACD'])
         dataframe['MACD'] = macd_result.get('line')
         dataframe.dropna(inplace = True)
+        state['tail'] = dataframe[['Close', 'Volume', 'High', 'Low']] \
+          .tail(self.INDICATOR_ROLLING_TAIL).to_dict('list')
 
         # --- new indicators ---
         bb_result = self.__bollinger_bands(dataframe)
         dataframe['BB_PERCENT_B'] = bb_result.get('percent_b')
 
-        dataframe['ATR'] = self.__average_true_range(dataframe)
+        dataframe['ATR'] = self.__average_true_range(dataframe, state = state['ATR'])
 
         stoch_result = self.__stochastic_oscillator(dataframe)
         dataframe['STOCH_K'] = stoch_result.get('stoch_k')
         dataframe['STOCH_D'] = stoch_result.get('stoch_d')
 
         dataframe['CCI'] = self.__commodity_channel_index(dataframe)
-        dataframe['OBV'] = self.__on_balance_volume(dataframe)
+        dataframe['OBV'] = self.__on_balance_volume(dataframe, state = state['OBV'])
         dataframe['CMF'] = self.__chaikin_money_flow(dataframe)
 
         dataframe.dropna(inplace = True)
-        logger.info(f'[ SUCCESS ] [ INDICATOR/TECHNICAL ] [ {symbol} ] Generate Data Success...')
-
-
-        # --- save indicator CSV & JSON ---
-        indicator_cols = ['MFI', 'RSI', 'MACD',
-                          'BB_PERCENT_B', 'ATR',
-                          'STOCH_K', 'STOCH_D',
-                          'CCI', 'OBV', 'CMF']
-        dataframe_indicator: DataFrame = dataframe[indicator_cols].copy()
-        dataframe_indicator.to_csv(path_or_buf = indicator_csv_path)
-
-        dataframe_indicator.index = to_datetime(dataframe_indicator.index, errors='coerce')
-        indicator_json: list[dict[str, str]] = [
-          {
-            "date":      dt.strftime("%Y-%m-%d"),
-            "full_date": f"{day_name_maping[dt.strftime('%A')]}, {dt.strftime('%d')} {month_name_maping[dt.strftime('%B')]} {dt.strftime('%Y')}",
-            "MFI":         row["MFI"],
-            "RSI":         row["RSI"],
-            "MACD":        row["MACD"],
-            "BB_PERCENT_B": row["BB_PERCENT_B"],
-            "ATR":         row["ATR"],
-            "STOCH_K":     row["STOCH_K"],
-            "STOCH_D":     row["STOCH_D"],
-            "CCI":         row["CCI"],
-            "OBV":         row["OBV"],
-            "CMF":         row["CMF"]
-          }
-          for dt, row in dataframe_indicator.iterrows()
-          if not isnull(dt)
-        ]
-
-        indicator_json_path: str = f'{self.DATASET_INDICATOR_CSV_PATH}/{symbol}.json'
-        with open(indicator_json_path, "w") as indicator_json_file:
-          dump({'indicators': indicator_json}, indicator_json_file)
-          logger.info(f'[ SAVED ] [ INDICATOR/TECHNICAL ] [ {symbol} ] Generate Data Saved on "{indicator_json_path}"...')
-
-        historical_json = historical_json[-len(indicator_json):]
-        historical_json_path: str = f'{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.json'
-        with open(historical_json_path, "w") as historical_json_file:
-          dump({'historicals': historical_json}, historical_json_file)
-          logger.info(f'[ SAVED ] [ HISTORICAL ] [ {symbol} ] Generate Data Saved on "{historical_json_path}"...')
-
-
-        # --- generate reports ---
-        pdf_report: PdfReport = PdfReport()
-
-        logger.info(f'[ PROCESSED ] [ HISTORICAL ] [ PDF REPORT ] [ {symbol} ] Generate Report...')
-        pdf_report.generate_report_historicals(
-          symbol      = symbol,
-          short_name  = short_name_company,
-          historicals = historical_json[::-1]
-        )
-        logger.info(f'[ SUCCESS ] [ HISTORICAL ] [ PDF REPORT ] [ {symbol} ] Generate Report Success...')
 
-        logger.info(f'[ PROCESSED ] [ INDICATOR/TECHNICAL ] [ PDF REPORT ] [ {symbol} ] Generate Report...')
-        pdf_report.generate_report_indicators(
-          symbol     = symbol,
-          short_name = short_name_company,
-          indicators = indicator_json[::-1]
-        )
-        logger.info(f'[ SUCCESS ] [ INDICATOR/TECHNICAL ] [ PDF REPORT ] [ {symbol} ] Generate Report Success...')
+      logger.info(f'[ SUCCESS ] [ INDICATOR/TECHNICAL ] [ {symbol} ] Generate Data Success...')
 
+      csv_file_is_valid: bool = self.__store_indicator(
+        symbol          = symbol,
+        short_name      = short_name_company,
+        dataframe       = dataframe,
+        historical_columns = historical_columns
+      )
 
-        # --- normalization (modeling CSV) ---
-        modeling_cols = ['Close', 'Volume',
-                         'MFI', 'RSI', 'MACD',
-                         'BB_PERCENT_B', 'ATR',
-                         'STOCH_K', 'STOCH_D',
-                         'CCI', 'OBV', 'CMF']
-        dataframe_modeling: DataFrame = dataframe[modeling_cols].copy()
+      if csv_file_is_valid:
+        state.update({
+          'rows':                len(historical),
+          'history_hash':        history_hash,
+          'indicator_last_date': str(dataframe.index[-1])
+        })
+        self.__save_indicator_state(symbol, state)
 
-        dataframe_norm, dataframe_min_max = \
-          self.__min_max_normalization(dataframe_modeling)
+      return csv_file_is_valid, symbol
 
-        with open(min_max_json_path, "w") as min_max_value:
-          dump(dataframe_min_max, min_max_value)
-          
-        dataframe_norm.to_csv(path_or_buf = modeling_csv_path)
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return False, symbol
+
+
+  """ 
+    [ name ]:
+      generate_indicator_by_dataframe_sync (return dtype: Optional[List[str]])
+
+    [ parameters ]:
+      - dataframe (dtype: DataFrame)
+
+    [ description ]:
+      Generate indicator by dataframe (Synchronous Process).
+      Returns the failed symbols (None when the process failed)
+  """
+  def generate_indicator_by_dataframe_sync(self, dataframe: DataFrame) -> Optional[List[str]]:
+    try:
+      if not file_is_exists(self.DATASET_INDICATOR_CSV_PATH):
+        makedirs(self.DATASET_INDICATOR_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_MODELING_CSV_PATH):
+        makedirs(self.DATASET_MODELING_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_MINMAX_CSV_PATH):
+        makedirs(self.DATASET_MINMAX_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_INDICATOR_STATE_PATH):
+        makedirs(self.DATASET_INDICATOR_STATE_PATH)
+      
+      failed_symbols: List[str] = []
+
+      for symbol in dataframe['symbol'].tolist():
+        csv_file_is_valid, symbol = self.generate_indicator_by_symbol(symbol)
+        if not csv_file_is_valid:
+          failed_symbols.append(symbol)
+          logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+
+      # Retry mechanism with throttling and exponential back-off
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      return failed_symbols
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
+
+
+  """ 
+    [ name ]:
+      generate_indicator_by_dataframe_parallel (return dtype: Optional[List[str]])
+
+    [ parameters ]:
+      - dataframe (dtype: DataFrame)
+
+    [ description ]:
+      Generate indicator by dataframe (Parallel Process),
+      symbols are spread across a process pool (one worker per core).
+      Spawned workers: the pool is created from a pipeline thread while
+      other threads run, a forked child could inherit a held lock.
+      Returns the failed symbols (None when the process failed)
+  """
+  def generate_indicator_by_dataframe_parallel(self, dataframe: DataFrame) -> Optional[List[str]]:
+    try:
+      if not file_is_exists(self.DATASET_INDICATOR_CSV_PATH):
+        makedirs(self.DATASET_INDICATOR_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_MODELING_CSV_PATH):
+        makedirs(self.DATASET_MODELING_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_MINMAX_CSV_PATH):
+        makedirs(self.DATASET_MINMAX_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_INDICATOR_STATE_PATH):
+        makedirs(self.DATASET_INDICATOR_STATE_PATH)
+
+      failed_symbols: List[str] = []
+
+      with ProcessPoolExecutor(
+        max_workers = self.SCRAPER_PROCESS_WORKER,
+        mp_context  = get_context('spawn')
+      ) as executor:
+        future_to_generate_indicator = {
+          executor.submit(self.generate_indicator_by_symbol, symbol):
+            symbol for symbol in dataframe['symbol'].tolist()
+        }
+
+        for future in as_completed(future_to_generate_indicator):
+          try:
+            csv_file_is_valid, symbol = future.result()
+
+          except Exception as error_message:
+            # worker process died (e.g. BrokenProcessPool)
+            symbol: str = future_to_generate_indicator[future]
+            symbol, csv_file_is_valid = symbol[:len(symbol) - 3], False
+            logger.error(f'{error_message} {symbol}')
+
+          if not csv_file_is_valid:
+            failed_symbols.append(symbol)
+            logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+
+      # Retry mechanism with throttling and exponential back-off
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      return failed_symbols
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
+
+
+  """ 
+    [ name ]:
+      generate_indicator_by_dataframe_panel (return dtype: Optional[List[str]])
+
+    [ parameters ]:
+      - dataframe (dtype: DataFrame)
+
+    [ description ]:
+      Generate indicator by dataframe (Panel Process),
+      all symbols are computed together over one (rows, symbols) panel.
+      Returns the failed symbols (None when the process failed)
+  """
+  def generate_indicator_by_dataframe_panel(self, dataframe: DataFrame) -> Optional[List[str]]:
+    try:
+      if not file_is_exists(self.DATASET_INDICATOR_CSV_PATH):
+        makedirs(self.DATASET_INDICATOR_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_MODELING_CSV_PATH):
+        makedirs(self.DATASET_MODELING_CSV_PATH)
+
+      if not file_is_exists(self.DATASET_MINMAX_CSV_PATH):
+        makedirs(self.DATASET_MINMAX_CSV_PATH)
+
+      failed_symbols: List[str] = []
+
+      historicals:     Dict[str, DataFrame] = {}
+      short_names:     Dict[str, str] = {}
+      historical_columns: Dict[str, Dict[str, Any]] = {}
+
+      for symbol in dataframe['symbol'].tolist():
+        symbol: str = symbol[:len(symbol) - 3]
+        try:
+          historicals[symbol], short_names[symbol], historical_columns[symbol] = \
+            self.__read_historical(symbol)
+
+        except Exception as error_message:
+          logger.error(f'{error_message} {symbol}')
+          failed_symbols.append(symbol)
+          logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+
+      # indicator / technical
+      logger.info(f'[ PROCESSED ] [ INDICATOR/TECHNICAL ] [ PANEL ] [ {len(historicals)} SYMBOLS ] Generate Data...')
+      indicators: Dict[str, DataFrame] = self.__panel_indicators(historicals)
+      logger.info(f'[ SUCCESS ] [ INDICATOR/TECHNICAL ] [ PANEL ] [ {len(historicals)} SYMBOLS ] Generate Data Success...')
+
+      for symbol, dataframe in indicators.items():
+        try:
+          csv_file_is_valid: bool = (not dataframe.empty) and self.__store_indicator(
+            symbol          = symbol,
+            short_name      = short_names[symbol],
+            dataframe       = dataframe,
+            historical_columns = historical_columns[symbol]
+          )
+
+        except Exception as error_message:
+          logger.error(f'{error_message} {symbol}')
+          csv_file_is_valid: bool = False
 
-        csv_file_is_valid: bool = self.__csv_store_validation(modeling_csv_path)
         if not csv_file_is_valid:
           failed_symbols.append(symbol)
           logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
 
       # Retry mechanism with throttling and exponential back-off
-      if failed_symbols: self.__retry_mechanism(failed_symbols)
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      return failed_symbols
 
     except Exception as error_message:
-      logger.error(error_message)
\ No newline at end of file
+      logger.error(error_message)
+      return None
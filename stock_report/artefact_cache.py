@@ -0,0 +1,310 @@
+import os
+import numpy as np
+from hashlib import sha256
+from threading import Lock
+from json import dump, dumps, load
+from typing import Any, List, Dict, Union, Optional
+
+from os.path import exists as file_is_exists
+
+from settings.logging_rules import logger
+from settings.location_rules import LocationRules
+from stock_storage.json_writer import JsonWriter
+
+# manifest lock: flock on POSIX, msvcrt.locking on Windows
+try:
+  import fcntl
+except ImportError:
+  fcntl = None
+
+try:
+  import msvcrt
+except ImportError:
+  msvcrt = None
+
+
+"""
+
+  -- Artefact Cache --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class ArtefactCache(LocationRules):
+  # one cache per process (forked workers get their own)
+  __SHARED: Dict[int, 'ArtefactCache'] = {}
+  __SHARED_LOCK: Lock = Lock()
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - manifest_path (dtype: Optional[str], default: DATASET_ARTEFACT_MANIFEST_PATH)
+
+    [ description ]:
+      Skip cache for the PDF and JSON artefacts: the manifest maps each
+      artefact path to the hash of its inputs (template, context data,
+      date label). An artefact is regenerated only when the hash changes
+      or the file is missing
+  """
+  def __init__(self, manifest_path: Optional[str] = None) -> None:
+    self.manifest_path: str = manifest_path or self.DATASET_ARTEFACT_MANIFEST_PATH
+
+    self.__lock:    Lock = Lock()
+    self.__entries: Dict[str, str] = self.__load()
+    self.__pending: Dict[str, str] = {}
+
+    self.json_writer: JsonWriter = JsonWriter()
+
+
+  """
+    [ name ]:
+      shared (return dtype: ArtefactCache)
+  """
+  @classmethod
+  def shared(cls) -> 'ArtefactCache':
+    with cls.__SHARED_LOCK:
+      process_id: int = os.getpid()
+      if process_id not in cls.__SHARED: cls.__SHARED[process_id] = cls()
+      return cls.__SHARED[process_id]
+
+
+  """
+    [ name ]:
+      __load (return dtype: Dict[str, str])
+  """
+  def __load(self) -> Dict[str, str]:
+    try:
+      if not file_is_exists(self.manifest_path): return {}
+      with open(self.manifest_path, 'r') as manifest_file:
+        return load(manifest_file)
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {self.manifest_path}')
+      return {}
+
+
+  """
+    [ name ]:
+      hash_inputs (return dtype: str)
+
+    [ parameters ]:
+      - inputs (dtype: Any, JSON serializable)
+
+    [ description ]:
+      sha256 of the canonical JSON of the inputs
+  """
+  @staticmethod
+  def hash_inputs(*inputs: Any) -> str:
+    return sha256(
+      dumps(inputs, sort_keys = True, default = str, separators = (',', ':')).encode('utf-8')
+    ).hexdigest()
+
+
+  """
+    [ name ]:
+      hash_columns (return dtype: str)
+
+    [ parameters ]:
+      - root_key (dtype: str)
+      - columns  (dtype: Dict[str, Union[np.ndarray, List[Any]]])
+
+    [ description ]:
+      sha256 of JSON columns: number arrays hashed as raw bytes, other
+      columns as text (no JSON serialization of the records)
+  """
+  @staticmethod
+  def hash_columns(root_key: str, columns: Dict[str, Union[np.ndarray, List[Any]]]) -> str:
+    digest = sha256(root_key.encode('utf-8'))
+    for key, values in columns.items():
+      digest.update(b'\x1e' + key.encode('utf-8') + b'\x1f')
+
+      if isinstance(values, np.ndarray) and (values.dtype.kind in 'biuf'):
+        digest.update(values.dtype.str.encode('ascii'))
+        digest.update(np.ascontiguousarray(values).tobytes())
+      else:
+        digest.update('\x1f'.join(map(repr, values)).encode('utf-8', 'surrogatepass'))
+
+    return digest.hexdigest()
+
+
+  """
+    [ name ]:
+      is_fresh (return dtype: bool)
+
+    [ parameters ]:
+      - artefact_path (dtype: str)
+      - digest        (dtype: str)
+
+    [ description ]:
+      The artefact exists and was generated from the same inputs
+  """
+  def is_fresh(self, artefact_path: str, digest: str) -> bool:
+    artefact_path = os.path.normpath(artefact_path)
+    with self.__lock:
+      stored_digest: Optional[str] = self.__pending.get(artefact_path) \
+        or self.__entries.get(artefact_path)
+
+    return (stored_digest == digest) and file_is_exists(artefact_path)
+
+
+  """
+    [ name ]:
+      record (return dtype: None)
+
+    [ parameters ]:
+      - artefact_path (dtype: str)
+      - digest        (dtype: str)
+  """
+  def record(self, artefact_path: str, digest: str) -> None:
+    with self.__lock:
+      self.__pending[os.path.normpath(artefact_path)] = digest
+
+
+  """
+    [ name ]:
+      __lock_manifest (return dtype: Optional[int])
+
+    [ parameters ]:
+      - manifest_directory (dtype: str)
+
+    [ description ]:
+      Exclusive lock between processes: flock of the manifest directory
+      on POSIX (no lock file left in the dataset), msvcrt.locking of a
+      "<manifest>.lock" file on Windows, no lock elsewhere.
+      Returns the locked descriptor
+  """
+  def __lock_manifest(self, manifest_directory: str) -> Optional[int]:
+    if fcntl is not None:
+      descriptor: int = os.open(manifest_directory, os.O_RDONLY)
+      fcntl.flock(descriptor, fcntl.LOCK_EX)
+      return descriptor
+
+    if msvcrt is not None:
+      descriptor: int = os.open(f'{self.manifest_path}.lock', os.O_RDWR | os.O_CREAT)
+      while True:
+        try:
+          msvcrt.locking(descriptor, msvcrt.LK_LOCK, 1)
+          return descriptor
+
+        # LK_LOCK gives up after 10 seconds, keep waiting
+        except OSError: continue
+
+    return None
+
+
+  """
+    [ name ]:
+      __unlock_manifest (return dtype: None)
+
+    [ parameters ]:
+      - descriptor (dtype: Optional[int])
+  """
+  def __unlock_manifest(self, descriptor: Optional[int]) -> None:
+    if descriptor is None: return
+
+    if fcntl is not None:
+      fcntl.flock(descriptor, fcntl.LOCK_UN)
+    elif msvcrt is not None:
+      os.lseek(descriptor, 0, os.SEEK_SET)
+      msvcrt.locking(descriptor, msvcrt.LK_UNLCK, 1)
+
+    os.close(descriptor)
+
+
+  """
+    [ name ]:
+      save (return dtype: None)
+
+    [ description ]:
+      Merge the recorded hashes into the manifest (__lock_manifest, so
+      worker processes can save concurrently), written atomically
+  """
+  def save(self) -> None:
+    try:
+      with self.__lock:
+        pending: Dict[str, str] = self.__pending
+        self.__pending = {}
+
+      if not pending: return
+
+      manifest_directory: str = os.path.dirname(self.manifest_path) or '.'
+      if not file_is_exists(manifest_directory): os.makedirs(manifest_directory)
+
+      manifest_descriptor: Optional[int] = self.__lock_manifest(manifest_directory)
+      try:
+        entries: Dict[str, str] = self.__load()
+        entries.update(pending)
+
+        temporary_path: str = f'{self.manifest_path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w') as manifest_file:
+          dump(entries, manifest_file, sort_keys = True, indent = 1)
+        os.replace(temporary_path, self.manifest_path)
+
+      finally:
+        self.__unlock_manifest(manifest_descriptor)
+
+      with self.__lock:
+        self.__entries = entries
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {self.manifest_path}')
+
+
+  """
+    [ name ]:
+      write_json (return dtype: bool)
+
+    [ parameters ]:
+      - json_path (dtype: str)
+      - payload   (dtype: Any)
+
+    [ description ]:
+      Write the JSON artefact unless the manifest says it is unchanged.
+      Returns True when the file was written
+  """
+  def write_json(self, json_path: str, payload: Any) -> bool:
+    digest: str = self.hash_inputs(payload)
+    if self.is_fresh(json_path, digest):
+      logger.info(f'[ SKIPPED ] "{json_path}" is unchanged')
+      return False
+
+    self.json_writer.write(json_path, payload)
+    self.record(json_path, digest)
+    return True
+
+
+  """
+    [ name ]:
+      write_json_records (return dtype: bool)
+
+    [ parameters ]:
+      - json_path (dtype: str)
+      - root_key  (dtype: str)
+      - columns   (dtype: Dict[str, Union[np.ndarray, List[Any]]])
+
+    [ description ]:
+      write_json of {root_key: [records]} streamed from columns
+      (JsonWriter.write_records), hashed by hash_columns.
+      Returns True when the file was written
+  """
+  def write_json_records(
+    self, json_path: str,
+    root_key:        str,
+    columns:         Dict[str, Union[np.ndarray, List[Any]]]
+  ) -> bool:
+    digest: str = self.hash_columns(root_key, columns)
+    if self.is_fresh(json_path, digest):
+      logger.info(f'[ SKIPPED ] "{json_path}" is unchanged')
+      return False
+
+    self.json_writer.write_records(json_path, root_key, columns)
+    self.record(json_path, digest)
+    return True
@@ -1,9 +1,19 @@
 import os
-from weasyprint import HTML
-from typing import Any, List, Dict
+from io import BytesIO
+from itertools import repeat
+from time import perf_counter
+from multiprocessing import parent_process, get_context
+from concurrent.futures import ProcessPoolExecutor
+from pypdf import PdfReader, PdfWriter
+from weasyprint import HTML, CSS
+from weasyprint.text.fonts import FontConfiguration
+from typing import Any, List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
 from jinja2 import Template, Environment, FileSystemLoader
 
+from settings.logging_rules import logger
+from stock_report.artefact_cache import ArtefactCache
+
 
 """
 
@@ -26,10 +36,31 @@ class PdfReport:
   HISTORICAL_REPORT:   str = './indonesia_stocks/historicals'
   FUNDAMENTAL_REPORT:  str = './indonesia_stocks/fundamentals'
 
+  STYLESHEET_NAME:     str = 'report_style.css'
+  TEMPLATE_NAMES: List[str] = [
+    'technical_report.jinja2',  'historical_report.jinja2',
+    'issuers_report.jinja2',    'fundamental_report.jinja2'
+  ]
+
+  # long reports (historicals, indicators)
+  REPORT_MAX_SESSIONS:  int = 0   # rendered window: last N sessions (0: all)
+  REPORT_CHUNK_ROWS:    int = 0   # rows per rendered chunk (0: one document)
+  REPORT_CHUNK_WORKERS: int = 1   # chunk render processes (1: sequential)
+
+  # chunks have no page footer, it is stamped after the merge
+  # (user stylesheet: !important to override the template <style>)
+  CHUNK_STYLESHEET:  str = '@page { @bottom-right { content: none !important; } }'
+
   environment: Environment = Environment(
     loader = FileSystemLoader(CONTRACTS_PATH)
   )
 
+  # long-lived renderer, built once per process (see __get_renderer)
+  __RENDERERS: Dict[int, Dict[str, Any]] = {}
+
+  # chunk render pool, reused by every document of the process
+  __CHUNK_EXECUTOR: Optional[ProcessPoolExecutor] = None
+
 
   def __init__(self) -> None:
     self.full_name:    str = 'Al-Fariqy Raihan Azhwar'
@@ -52,10 +83,279 @@ class PdfReport:
 
     self.tomorrow: datetime = datetime.now() + timedelta(days = 1)
 
+    # the last __write_pdf was skipped (unchanged artefact), see render_many
+    self.__is_skipped: bool = False
+
+
+  """ 
+    [ name ]:
+      __get_renderer (return dtype: Dict[str, Any])
+
+    [ description ]:
+      Long-lived renderer of the process: the four templates compiled once
+      (report_style.css included in their <style> block, so it keeps the
+      author precedence of the original inline styles), one shared font
+      configuration and one image cache (signature) for every document
+  """
+  def __get_renderer(self) -> Dict[str, Any]:
+    process_id: int = os.getpid()
+    if process_id not in self.__RENDERERS:
+      stylesheet_path: str = f'{self.CONTRACTS_PATH}/{self.STYLESHEET_NAME}'
+      with open(stylesheet_path, 'r') as stylesheet_file:
+        stylesheet_source: str = stylesheet_file.read()
+
+      font_config: FontConfiguration = FontConfiguration()
+      self.__RENDERERS[process_id] = {
+        'templates': {
+          template_name: self.environment.get_template(template_name)
+            for template_name in self.TEMPLATE_NAMES
+        },
+        'template_sources': {
+          template_name: self.environment.loader.get_source(self.environment, template_name)[0]
+            for template_name in self.TEMPLATE_NAMES
+        },
+        'stylesheet_source': stylesheet_source,
+        'chunk_stylesheets': [
+          CSS(string = self.CHUNK_STYLESHEET, font_config = font_config)
+        ],
+        'font_config': font_config,
+        'image_cache': {}
+      }
+
+    return self.__RENDERERS[process_id]
+
+
+  """ 
+    [ name ]:
+      __write_pdf (return dtype: bool)
+
+    [ parameters ]:
+      - template_name    (dtype: str)
+      - template_context (dtype: Dict[str, Any])
+      - pdf_path         (dtype: str)
+      - rows_name        (dtype: Optional[str], table rows in the context, chunked when long)
+
+    [ description ]:
+      Render the template to PDF with the long-lived renderer, skipped when
+      the artefact manifest has the same inputs hash (template source,
+      stylesheet, context data, date label, chunk size).
+      Returns True when rendered, False when skipped
+  """
+  def __write_pdf(
+    self, template_name: str,
+    template_context:    Dict[str, Any],
+    pdf_path:            str,
+    rows_name:           Optional[str] = None
+  ) -> bool:
+    renderer: Dict[str, Any] = self.__get_renderer()
+    artefact_cache: ArtefactCache = ArtefactCache.shared()
+
+    rows: List[Any] = template_context[rows_name] if rows_name else []
+    is_chunked: bool = 0 < self.REPORT_CHUNK_ROWS < len(rows)
+
+    digest: str = artefact_cache.hash_inputs(
+      renderer['template_sources'][template_name],
+      renderer['stylesheet_source'],
+      template_context,
+      self.REPORT_CHUNK_ROWS if is_chunked else 0
+    )
+    self.__is_skipped = artefact_cache.is_fresh(pdf_path, digest)
+    if self.__is_skipped:
+      logger.info(f'[ SKIPPED ] "{pdf_path}" is unchanged')
+      return False
+
+    if is_chunked:
+      self.__write_pdf_chunked(template_name, template_context, rows_name, pdf_path)
+
+    else:
+      template: Template = renderer['templates'][template_name]
+      template_render: str = template.render(template_context)
+      HTML(
+        string   = template_render, 
+        base_url = os.getcwd()
+      ).write_pdf(
+        pdf_path,
+        font_config = renderer['font_config'],
+        cache       = renderer['image_cache']
+      )
+
+    artefact_cache.record(pdf_path, digest)
+    artefact_cache.save()
+    return True
+
+
+  """ 
+    [ name ]:
+      __write_pdf_chunked (return dtype: None)
+
+    [ parameters ]:
+      - template_name    (dtype: str)
+      - template_context (dtype: Dict[str, Any])
+      - rows_name        (dtype: str)
+      - pdf_path         (dtype: str)
+
+    [ description ]:
+      Long table: render fixed-size chunks of REPORT_CHUNK_ROWS rows (header
+      on the first chunk, signature on the last, continuous row numbers),
+      on the chunk pool when REPORT_CHUNK_WORKERS > 1, then merge them into
+      one PDF and stamp the "Halaman X dari Y" footer over the merged pages
+  """
+  def __write_pdf_chunked(
+    self, template_name: str,
+    template_context:    Dict[str, Any],
+    rows_name:           str,
+    pdf_path:            str
+  ) -> None:
+    rows: List[Any] = template_context[rows_name]
+    chunk_contexts: List[Dict[str, Any]] = [
+      {
+        **template_context,
+        rows_name:        rows[row_offset:row_offset + self.REPORT_CHUNK_ROWS],
+        'row_offset':     row_offset,
+        'total_data':     len(rows),
+        'show_header':    row_offset == 0,
+        'show_signature': (row_offset + self.REPORT_CHUNK_ROWS) >= len(rows)
+      } for row_offset in range(0, len(rows), self.REPORT_CHUNK_ROWS)
+    ]
+
+    # no nested pool inside the ReportQueue worker processes
+    if (self.REPORT_CHUNK_WORKERS > 1) and (parent_process() is None):
+      if PdfReport.__CHUNK_EXECUTOR is None:
+        # spawned: created from a pipeline thread while others run
+        PdfReport.__CHUNK_EXECUTOR = ProcessPoolExecutor(
+          max_workers = self.REPORT_CHUNK_WORKERS,
+          mp_context  = get_context('spawn')
+        )
+      chunk_pdfs: List[bytes] = list(
+        PdfReport.__CHUNK_EXECUTOR.map(render_chunk, repeat(template_name), chunk_contexts)
+      )
+
+    else:
+      chunk_pdfs: List[bytes] = [
+        self.render_chunk(template_name, chunk_context)
+          for chunk_context in chunk_contexts
+      ]
+
+    pdf_writer: PdfWriter = PdfWriter()
+    for chunk_pdf in chunk_pdfs:
+      pdf_writer.append(PdfReader(BytesIO(chunk_pdf)))
+
+    footer_pdf: PdfReader = PdfReader(BytesIO(self.__render_footers(len(pdf_writer.pages))))
+    for page, footer_page in zip(pdf_writer.pages, footer_pdf.pages):
+      page.merge_page(footer_page)
+
+    temporary_path: str = f'{pdf_path}.{os.getpid()}.tmp'
+    with open(temporary_path, 'wb') as pdf_file:
+      pdf_writer.write(pdf_file)
+    os.replace(temporary_path, pdf_path)
+
+
+  """ 
+    [ name ]:
+      __render_footers (return dtype: bytes)
+
+    [ parameters ]:
+      - total_pages (dtype: int)
+
+    [ description ]:
+      Blank pages with only the report_style.css page footer, one per merged page
+  """
+  def __render_footers(self, total_pages: int) -> bytes:
+    renderer: Dict[str, Any] = self.__get_renderer()
+    blank_pages: str = '<div style="page-break-after: always"></div>' * (total_pages - 1)
+
+    return HTML(
+      string   = (
+        f'<html><head><style>{renderer["stylesheet_source"]}</style></head>' +
+        f'<body>{blank_pages}<div></div></body></html>'
+      ),
+      base_url = os.getcwd()
+    ).write_pdf(
+      font_config = renderer['font_config']
+    )
+
+
+  """ 
+    [ name ]:
+      render_chunk (return dtype: bytes)
+
+    [ parameters ]:
+      - template_name    (dtype: str)
+      - template_context (dtype: Dict[str, Any], one chunk of the table rows)
+
+    [ description ]:
+      Render one chunk of a long report to PDF bytes (without page footer)
+  """
+  def render_chunk(self, template_name: str, template_context: Dict[str, Any]) -> bytes:
+    renderer: Dict[str, Any] = self.__get_renderer()
+    template: Template = renderer['templates'][template_name]
+
+    return HTML(
+      string   = template.render(template_context),
+      base_url = os.getcwd()
+    ).write_pdf(
+      stylesheets = renderer['chunk_stylesheets'],
+      font_config = renderer['font_config'],
+      cache       = renderer['image_cache']
+    )
+
 
   """ 
     [ name ]:
-      generate_report_indicators (return dtype: None)
+      __get_window (return dtype: List[Any])
+
+    [ parameters ]:
+      - rows (dtype: List[Any], newest session first)
+
+    [ description ]:
+      Rendered window of a long report: the last REPORT_MAX_SESSIONS
+      sessions (the CSV and JSON artefacts keep every session)
+  """
+  def __get_window(self, rows: List[Any]) -> List[Any]:
+    return rows[:self.REPORT_MAX_SESSIONS] if self.REPORT_MAX_SESSIONS > 0 else rows
+
+
+  """ 
+    [ name ]:
+      render_many (return dtype: List[Tuple[str, float, str]])
+
+    [ parameters ]:
+      - jobs (dtype: List[Tuple[str, str, Dict[str, Any]]],
+              (generate_report_* method name, label, method arguments))
+
+    [ description ]:
+      Render a batch of documents with one renderer setup.
+      Returns (label, seconds, status) per document, status:
+      RENDERED, SKIPPED (unchanged) or FAILED
+  """
+  def render_many(
+    self, jobs: List[Tuple[str, str, Dict[str, Any]]]
+  ) -> List[Tuple[str, float, str]]:
+    timings: List[Tuple[str, float, str]] = []
+    try:
+      self.__get_renderer()
+    except Exception as error_message:
+      logger.error(error_message)
+
+    for method, label, options in jobs:
+      started: float = perf_counter()
+      self.__is_skipped = False
+      try:
+        is_success: bool = getattr(self, method)(**options)
+
+      except Exception as error_message:
+        logger.error(f'{error_message} {label}')
+        is_success: bool = False
+
+      status: str = 'FAILED' if not is_success else ('SKIPPED' if self.__is_skipped else 'RENDERED')
+      timings.append((label, perf_counter() - started, status))
+
+    return timings
+
+
+  """ 
+    [ name ]:
+      generate_report_indicators (return dtype: bool)
 
     [ parameters ]:
       - symbol     (dtype: str)
@@ -63,7 +363,7 @@ class PdfReport:
       - indicators (dtype: List)
 
     [ description ]:
-      Generate Report Indicators
+      Generate Report Indicators (False when it failed)
 
       jinja template: 
         - technical_report.jinja2
@@ -72,11 +372,8 @@ class PdfReport:
     self, symbol: str, 
     short_name:   str, 
     indicators:   List[Any]
-  ) -> None:
+  ) -> bool:
     try:
-      template: Template = self.environment \
-        .get_template('technical_report.jinja2')
-
       ##  get full date
       get_day:   str  = self.tomorrow.strftime('%d')
       get_month: str  = self.month_name_mapping[self.tomorrow.strftime('%B')]
@@ -88,25 +385,29 @@ class PdfReport:
       template_context: Dict[str, Any] = {
         'symbol':      symbol,
         'short_name':  short_name,
-        'indicators':  indicators,
+        'indicators':  self.__get_window(indicators),
 
         'full_name':   self.full_name,
         'npm_numbers': self.npm_numbers,
         'full_date':   full_date
       }
 
-      template_render: str = template.render(template_context)
-      HTML(
-        string   = template_render, 
-        base_url = os.getcwd()
-      ).write_pdf(f'{self.TECHNICAL_REPORT}/{symbol}.pdf')
+      self.__write_pdf(
+        template_name    = 'technical_report.jinja2',
+        template_context = template_context,
+        pdf_path         = f'{self.TECHNICAL_REPORT}/{symbol}.pdf',
+        rows_name        = 'indicators'
+      )
+      return True
+
     except Exception as error_message:
       print(error_message)
+      return False
 
 
   """ 
     [ name ]:
-      generate_report_historicals (return dtype: None)
+      generate_report_historicals (return dtype: bool)
 
     [ parameters ]:
       - symbol      (dtype: str)
@@ -114,7 +415,7 @@ class PdfReport:
       - historicals (dtype: List)
 
     [ description ]:
-      Generate Report Historicals
+      Generate Report Historicals (False when it failed)
 
       jinja template: 
         - historical_report.jinja2
@@ -123,11 +424,8 @@ class PdfReport:
     self, symbol: str, 
     short_name:   str, 
     historicals:  List[Any]
-  ) -> None:
+  ) -> bool:
     try:
-      template: Template = self.environment \
-        .get_template('historical_report.jinja2')
-
       ##  get full date
       get_day:   str  = self.tomorrow.strftime('%d')
       get_month: str  = self.month_name_mapping[self.tomorrow.strftime('%B')]
@@ -139,25 +437,29 @@ class PdfReport:
       template_context: Dict[str, Any] = {
         'symbol':       symbol,
         'short_name':   short_name,
-        'historicals':  historicals,
+        'historicals':  self.__get_window(historicals),
 
         'full_name':   self.full_name,
         'npm_numbers': self.npm_numbers,
         'full_date':   full_date
       }
 
-      template_render: str = template.render(template_context)
-      HTML(
-        string   = template_render, 
-        base_url = os.getcwd()
-      ).write_pdf(f'{self.HISTORICAL_REPORT}/{symbol}.pdf')
+      self.__write_pdf(
+        template_name    = 'historical_report.jinja2',
+        template_context = template_context,
+        pdf_path         = f'{self.HISTORICAL_REPORT}/{symbol}.pdf',
+        rows_name        = 'historicals'
+      )
+      return True
+
     except Exception as error_message:
       print(error_message)
+      return False
 
 
   """ 
     [ name ]:
-      generate_report_issuers (return dtype: None)
+      generate_report_issuers (return dtype: bool)
 
     [ parameters ]:
       - symbol      (dtype: str)
@@ -165,16 +467,13 @@ class PdfReport:
       - issuers     (dtype: List)
 
     [ description ]:
-      Generate Report Issuers
+      Generate Report Issuers (False when it failed)
 
       jinja template: 
         - issuers_report.jinja2
   """
-  def generate_report_issuers(self, issuers: List[Any]) -> None:
+  def generate_report_issuers(self, issuers: List[Any]) -> bool:
     try:
-      template: Template = self.environment \
-        .get_template('issuers_report.jinja2')
-
       ##  get full date
       get_day:   str  = self.tomorrow.strftime('%d')
       get_month: str  = self.month_name_mapping[self.tomorrow.strftime('%B')]
@@ -191,18 +490,21 @@ class PdfReport:
         'full_date':   full_date
       }
 
-      template_render: str = template.render(template_context)
-      HTML(
-        string   = template_render, 
-        base_url = os.getcwd()
-      ).write_pdf(f'{self.ISSUER_REPORT}/emiten_saham.pdf')
+      self.__write_pdf(
+        template_name    = 'issuers_report.jinja2',
+        template_context = template_context,
+        pdf_path         = f'{self.ISSUER_REPORT}/emiten_saham.pdf'
+      )
+      return True
+
     except Exception as error_message:
       print(error_message)
+      return False
 
 
   """ 
     [ name ]:
-      generate_report_fundamental (return dtype: None)
+      generate_report_fundamental (return dtype: bool)
 
     [ parameters ]:
       - symbol       (dtype: str)
@@ -211,7 +513,7 @@ class PdfReport:
       - issuer_data  (dtype: Dict[str, Any])
 
     [ description ]:
-      Generate Report Historicals
+      Generate Report Historicals (False when it failed)
       
       jinja template: 
         - issuers_report.jinja2
@@ -221,11 +523,8 @@ class PdfReport:
     short_name:   str, 
     issuer_labels:  Dict[str, str],
     issuer_datas:   Dict[str, Any]
-  ) -> None:
+  ) -> bool:
     try:
-      template: Template = self.environment \
-        .get_template('fundamental_report.jinja2')
-
       ##  get full date
       get_day:   str  = self.tomorrow.strftime('%d')
       get_month: str  = self.month_name_mapping[self.tomorrow.strftime('%B')]
@@ -246,11 +545,29 @@ class PdfReport:
         'full_date':   full_date
       }
 
-      template_render: str = template.render(template_context)
-      HTML(
-        string   = template_render, 
-        base_url = os.getcwd()
-      ).write_pdf(f'{self.FUNDAMENTAL_REPORT}/{symbol}.pdf')
+      self.__write_pdf(
+        template_name    = 'fundamental_report.jinja2',
+        template_context = template_context,
+        pdf_path         = f'{self.FUNDAMENTAL_REPORT}/{symbol}.pdf'
+      )
+      return True
+
     except Exception as error_message:
       print(error_message)
+      return False
 
+
+"""
+  [ name ]:
+    render_chunk (return dtype: bytes)
+
+  [ parameters ]:
+    - template_name    (dtype: str)
+    - template_context (dtype: Dict[str, Any])
+
+  [ description ]:
+    PdfReport.render_chunk on the chunk pool (module level, so the
+    process pool can pickle it)
+"""
+def render_chunk(template_name: str, template_context: Dict[str, Any]) -> bytes:
+  return PdfReport().render_chunk(template_name, template_context)
@@ -0,0 +1,229 @@
+import os
+from time import perf_counter
+from threading import Lock
+from multiprocessing import get_context
+from typing import Any, List, Dict, Tuple, Optional
+from concurrent.futures import ProcessPoolExecutor, Future, wait
+
+from settings.logging_rules import logger
+from settings.scraper_rules import ScraperRules
+from stock_report.pdf_report import PdfReport
+
+
+"""
+
+  -- Report Queue --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+# one PdfReport (long-lived renderer) per (worker) process
+WORKER_PDF_REPORT: Optional[PdfReport] = None
+
+
+"""
+  [ name ]:
+    render_reports (return dtype: List[Tuple[str, float, str]])
+
+  [ parameters ]:
+    - jobs (dtype: List[Tuple[str, str, Dict[str, Any]]],
+            (PdfReport.generate_report_* method name, label, method arguments))
+
+  [ description ]:
+    Render a batch of PDF documents with PdfReport.render_many (module
+    level, so the process pool can pickle it).
+    Returns (label, seconds, status) per document, status: RENDERED,
+    SKIPPED (unchanged) or FAILED
+"""
+def render_reports(jobs: List[Tuple[str, str, Dict[str, Any]]]) -> List[Tuple[str, float, str]]:
+  global WORKER_PDF_REPORT
+  try:
+    if WORKER_PDF_REPORT is None: WORKER_PDF_REPORT = PdfReport()
+    return WORKER_PDF_REPORT.render_many(jobs)
+
+  except Exception as error_message:
+    logger.error(error_message)
+    return [(label, 0.0, 'FAILED') for _, label, _ in jobs]
+
+
+class ReportQueue(ScraperRules):
+  # one queue shared by the pipeline stages (Sorter, TechnicalIndicator)
+  __SHARED: Optional['ReportQueue'] = None
+  __SHARED_LOCK: Lock = Lock()
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - max_workers (dtype: Optional[int], default: SCRAPER_PROCESS_WORKER)
+
+    [ description ]:
+      PDF render jobs queue. Inline (default) renders on submit, like before.
+      Deferred jobs are collected during the pipeline and rendered on a
+      process pool, at the end (wait) or while the next stage runs (flush)
+  """
+  def __init__(self, max_workers: Optional[int] = None) -> None:
+    self.max_workers: int = max(1, max_workers or self.SCRAPER_PROCESS_WORKER)
+    self.is_deferred: bool = False
+
+    self.__owner_pid: int = os.getpid()
+    self.__lock:      Lock = Lock()
+    self.__jobs:      List[Tuple[str, str, Dict[str, Any]]] = []
+    self.__futures:   List[Future] = []
+    self.__timings:   List[Tuple[str, float, str]] = []
+    self.__executor:  Optional[ProcessPoolExecutor] = None
+    self.__started:   Optional[float] = None
+
+
+  """
+    [ name ]:
+      shared (return dtype: ReportQueue)
+  """
+  @classmethod
+  def shared(cls) -> 'ReportQueue':
+    with cls.__SHARED_LOCK:
+      if cls.__SHARED is None: cls.__SHARED = cls()
+      return cls.__SHARED
+
+
+  """
+    [ name ]:
+      defer (return dtype: None)
+
+    [ description ]:
+      Collect the render jobs instead of rendering them on submit
+  """
+  def defer(self) -> None:
+    self.is_deferred = True
+
+
+  """
+    [ name ]:
+      submit (return dtype: None)
+
+    [ parameters ]:
+      - method  (dtype: str, PdfReport.generate_report_* method name)
+      - label   (dtype: str, document name for the timings)
+      - options (dtype: Dict[str, Any], method arguments)
+
+    [ description ]:
+      Add a render job (rendered inline when the queue is not deferred,
+      or when called from a worker process of another pool)
+  """
+  def submit(self, method: str, label: str, **options) -> None:
+    if (not self.is_deferred) or (os.getpid() != self.__owner_pid):
+      for timing in render_reports([(method, label, options)]):
+        self.__log_timing(timing)
+      return
+
+    with self.__lock:
+      self.__jobs.append((method, label, options))
+
+
+  """
+    [ name ]:
+      __log_timing (return dtype: None)
+
+    [ parameters ]:
+      - timing (dtype: Tuple[str, float, str], (label, seconds, status))
+  """
+  def __log_timing(self, timing: Tuple[str, float, str]) -> None:
+    label, seconds, status = timing
+    self.__timings.append(timing)
+
+    if status == 'RENDERED':
+      logger.info(f'[ REPORT ] [ {label} ] rendered in {seconds:.2f} seconds')
+    elif status == 'SKIPPED':
+      logger.info(f'[ REPORT ] [ {label} ] [ SKIPPED ] unchanged')
+    else:
+      logger.error(f'[ REPORT ] [ {label} ] [ FAILED ] after {seconds:.2f} seconds')
+
+
+  """
+    [ name ]:
+      flush (return dtype: None)
+
+    [ description ]:
+      Start rendering the collected jobs on the process pool, without
+      waiting (the next pipeline stage runs meanwhile). Spawned workers:
+      flush runs in a pipeline thread while others (e.g. the historical
+      download) run, a forked child could inherit a held lock
+  """
+  def flush(self) -> None:
+    with self.__lock:
+      jobs: List[Tuple[str, str, Dict[str, Any]]] = self.__jobs
+      self.__jobs = []
+
+      if not jobs: return
+      if self.__executor is None:
+        self.__executor = ProcessPoolExecutor(
+          max_workers = self.max_workers,
+          mp_context  = get_context('spawn')
+        )
+        self.__started  = perf_counter()
+
+      # batches (render_many), a few per process for load balancing
+      batch_size: int = max(1, -(-len(jobs) // (self.max_workers * 2)))
+      self.__futures.extend([
+        self.__executor.submit(render_reports, jobs[index:index + batch_size])
+          for index in range(0, len(jobs), batch_size)
+      ])
+
+    logger.info(f'[ REPORT QUEUE ] {len(jobs)} documents sent to {self.max_workers} render processes')
+
+
+  """
+    [ name ]:
+      wait (return dtype: List[Tuple[str, float, str]])
+
+    [ description ]:
+      Render the remaining jobs, wait for every document and log the
+      per-document timings. Returns (label, seconds, status) per document
+  """
+  def wait(self) -> List[Tuple[str, float, str]]:
+    try:
+      self.flush()
+
+      with self.__lock:
+        futures: List[Future] = self.__futures
+        self.__futures = []
+
+      wait(futures)
+      for future in futures:
+        for timing in future.result():
+          self.__log_timing(timing)
+
+      if self.__executor is not None:
+        self.__executor.shutdown()
+        self.__executor = None
+
+      if self.__timings:
+        rendered: List[Tuple[str, float, str]] = [timing for timing in self.__timings if timing[2] == 'RENDERED']
+        failed:   List[str] = [label for label, _, status in self.__timings if status == 'FAILED']
+        skipped:  int = len(self.__timings) - len(rendered) - len(failed)
+
+        render_seconds: float = sum(seconds for _, seconds, _ in rendered)
+        wall_seconds:   float = (perf_counter() - self.__started) if self.__started is not None else render_seconds
+        slowest: List[Tuple[str, float, str]] = sorted(rendered, key = lambda timing: -timing[1])[:5]
+        logger.info(
+          f'[ REPORT QUEUE ] {len(rendered)} rendered, {skipped} skipped (unchanged), ' +
+          f'{len(failed)} failed, render: {render_seconds:.1f}s, wall: {wall_seconds:.1f}s, slowest: ' +
+          ', '.join(f'{label} ({seconds:.1f}s)' for label, seconds, _ in slowest)
+        )
+        if failed: logger.error(f'[ REPORT QUEUE ] failed documents: {failed}')
+
+      timings: List[Tuple[str, float, str]] = self.__timings
+      self.__timings = []
+      self.__started = None
+      return timings
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return []
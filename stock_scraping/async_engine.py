@@ -0,0 +1,469 @@
+import asyncio
+from time import monotonic
+from random import choice
+from typing import List, Dict, Any, Optional, Callable, Awaitable
+
+from numpy import array, ndarray
+from curl_cffi.requests import AsyncSession
+from pandas import DataFrame, DatetimeIndex, to_datetime
+
+from settings.logging_rules import logger
+from settings.scraper_rules import ScraperRules
+from stock_scraping.rate_limiter import RateLimiter
+
+from warnings import filterwarnings
+filterwarnings("ignore")
+
+
+"""
+
+  -- Asyncio Fetch Engine --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class AsyncTokenBucket:
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - rate         (dtype: float, tokens per second)
+      - capacity     (dtype: int,   burst size)
+      - cancel_event (dtype: Optional[asyncio.Event], stop waiting once set)
+
+    [ description ]:
+      Token-bucket rate limiter for coroutines (replaces the per-call sleep)
+  """
+  def __init__(
+    self, rate: float, capacity: int,
+    cancel_event: Optional[asyncio.Event] = None
+  ) -> None:
+    self.rate:     float = max(float(rate), 1e-6)
+    self.capacity: float = float(max(capacity, 1))
+    self.tokens:   float = self.capacity
+    self.updated:  float = monotonic()
+    self.lock:     asyncio.Lock = asyncio.Lock()
+    self.blocked_until: float = 0.0
+    self.cancel_event: Optional[asyncio.Event] = cancel_event
+
+
+  """
+    [ name ]:
+      pause (return dtype: None)
+
+    [ parameters ]:
+      - seconds (dtype: float)
+
+    [ description ]:
+      No token is handed out for the next seconds (HTTP 429 Retry-After)
+  """
+  def pause(self, seconds: float) -> None:
+    self.tokens = 0.0
+    self.blocked_until = max(self.blocked_until, monotonic() + seconds)
+
+
+  """
+    [ name ]:
+      acquire (return dtype: None)
+
+    [ description ]:
+      Wait until one token is available, then take it
+      (returns without a token once cancelled)
+  """
+  async def acquire(self) -> None:
+    async with self.lock:
+      while True:
+        if (self.cancel_event is not None) and self.cancel_event.is_set(): return
+
+        now: float = monotonic()
+        self.tokens  = min(self.capacity, self.tokens + ((now - self.updated) * self.rate))
+        self.updated = now
+
+        if now < self.blocked_until:
+          await asyncio.sleep(self.blocked_until - now)
+          continue
+
+        if self.tokens >= 1:
+          self.tokens -= 1
+          return
+
+        await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncEngine(ScraperRules):
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - base_url     (dtype: Optional[str], default: SCRAPER_YAHOO_BASE_URL)
+      - cookie_url   (dtype: Optional[str], default: SCRAPER_YAHOO_COOKIE_URL)
+      - rate_limiter (dtype: Optional[RateLimiter], default: RateLimiter.shared(),
+                      back-off and HTTP 429 bookkeeping)
+
+    [ description ]:
+      Asyncio fetch engine on the curl_cffi async session: semaphore-based
+      concurrency cap, token-bucket rate limiter and cooperative cancellation.
+      The URLs are injectable, so the engine can run against a local HTTP stub
+  """
+  def __init__(
+    self,
+    base_url:     Optional[str] = None,
+    cookie_url:   Optional[str] = None,
+    rate_limiter: Optional[RateLimiter] = None
+  ) -> None:
+    self.base_url:     str = base_url or self.SCRAPER_YAHOO_BASE_URL
+    self.cookie_url:   str = cookie_url or self.SCRAPER_YAHOO_COOKIE_URL
+    self.rate_limiter: RateLimiter = rate_limiter or RateLimiter.shared()
+
+    self.__loop:         Optional[asyncio.AbstractEventLoop] = None
+    self.__cancel_event: Optional[asyncio.Event] = None
+    self.__crumb:        Optional[str] = None
+
+
+  """
+    [ name ]:
+      cancel (return dtype: None)
+
+    [ description ]:
+      Cooperative cancellation (thread-safe): running requests finish,
+      pending symbols are not requested anymore
+  """
+  def cancel(self) -> None:
+    if (self.__loop is not None) and (self.__cancel_event is not None):
+      self.__loop.call_soon_threadsafe(self.__cancel_event.set)
+
+
+  """
+    [ name ]:
+      __is_cancelled (return dtype: bool)
+  """
+  def __is_cancelled(self) -> bool:
+    return (self.__cancel_event is not None) and self.__cancel_event.is_set()
+
+
+  """
+    [ name ]:
+      __get_json (return dtype: Optional[Dict[str, Any]])
+
+    [ parameters ]
+      - session   (dtype: AsyncSession)
+      - semaphore (dtype: asyncio.Semaphore)
+      - bucket    (dtype: AsyncTokenBucket)
+      - url       (dtype: str)
+      - params    (dtype: Dict[str, Any])
+
+    [ description ]
+      GET a JSON document under the concurrency cap and the rate limiter,
+      with exponential back-off on failures (404 is not retried,
+      429 waits for Retry-After)
+  """
+  async def __get_json(
+    self,
+    session:   AsyncSession,
+    semaphore: asyncio.Semaphore,
+    bucket:    AsyncTokenBucket,
+    url:       str,
+    params:    Dict[str, Any]
+  ) -> Optional[Dict[str, Any]]:
+    for retry_count in range(self.SCRAPER_MAXIMUM_RETRY):
+      if self.__is_cancelled(): return None
+
+      try:
+        await bucket.acquire()
+        if self.__is_cancelled(): return None
+
+        async with semaphore:
+          response = await session.get(
+            url, params = params,
+            impersonate = choice(self.SCRAPER_BROWSER_AGENTS),
+            timeout     = self.SCRAPER_ASYNC_TIMEOUT
+          )
+
+        if response.status_code == 404:
+          logger.info(f'[ NOT FOUND ] {url}')
+          return None
+
+        if response.status_code == 200:
+          self.rate_limiter.reward()
+          return response.json()
+
+        if response.status_code == 429:
+          retry_after: Optional[str] = response.headers.get('Retry-After')
+          retry_after: Optional[float] = float(retry_after) \
+            if retry_after and retry_after.replace('.', '', 1).isdigit() else None
+
+          self.rate_limiter.penalize(retry_after)
+          bucket.pause(retry_after if retry_after is not None else self.SCRAPER_BACKOFF_BASE)
+          continue
+
+        logger.warning(f'[ HTTP {response.status_code} ] {url} (retry count: {retry_count + 1})')
+
+      except asyncio.CancelledError:
+        raise
+
+      except Exception as error_message:
+        logger.error(f'{error_message} {url} (retry count: {retry_count + 1})')
+
+      await asyncio.sleep(self.rate_limiter.backoff(retry_count))
+
+    return None
+
+
+  """
+    [ name ]:
+      __get_crumb (return dtype: Optional[str])
+
+    [ parameters ]
+      - session (dtype: AsyncSession)
+
+    [ description ]
+      Cookie + crumb needed by the quote summary endpoint
+  """
+  async def __get_crumb(self, session: AsyncSession) -> Optional[str]:
+    try:
+      await session.get(self.cookie_url, timeout = self.SCRAPER_ASYNC_TIMEOUT)
+      response = await session.get(
+        f'{self.base_url}/v1/test/getcrumb', timeout = self.SCRAPER_ASYNC_TIMEOUT
+      )
+
+      return response.text if (response.status_code == 200) and response.text else None
+
+    except Exception as error_message:
+      logger.error(f'[ CRUMB ] {error_message}')
+      return None
+
+
+  """
+    [ name ]:
+      __chart_to_dataframe (return dtype: Optional[DataFrame])
+
+    [ parameters ]
+      - chart (dtype: Dict[str, Any])
+
+    [ description ]
+      Chart JSON -> daily DataFrame shaped like a single-ticker yfinance
+      download (auto adjusted: Close, High, Low, Open, Volume; index "Date")
+  """
+  def __chart_to_dataframe(self, chart: Dict[str, Any]) -> Optional[DataFrame]:
+    result: List[Dict[str, Any]] = (chart.get('chart') or {}).get('result') or []
+    if not result: return None
+
+    timestamps: List[int] = result[0].get('timestamp') or []
+    indicators: Dict[str, Any] = result[0].get('indicators') or {}
+    quote: Dict[str, Any] = (indicators.get('quote') or [{}])[0]
+
+    dates: DatetimeIndex = to_datetime(timestamps, unit = 's', utc = True) \
+      .tz_convert(result[0].get('meta', {}).get('exchangeTimezoneName') or 'UTC') \
+      .tz_localize(None).normalize()
+
+    dataframe = DataFrame({
+      'Close':  quote.get('close')  or [None] * len(timestamps),
+      'High':   quote.get('high')   or [None] * len(timestamps),
+      'Low':    quote.get('low')    or [None] * len(timestamps),
+      'Open':   quote.get('open')   or [None] * len(timestamps),
+      'Volume': quote.get('volume') or [None] * len(timestamps),
+    }, index = dates, dtype = 'float64')
+    dataframe.index.name = 'Date'
+
+    adjclose: List[float] = ((indicators.get('adjclose') or [{}])[0]).get('adjclose')
+    if adjclose:
+      ratio: ndarray = array(adjclose, dtype = 'float64') / dataframe['Close'].to_numpy()
+      dataframe['Open']  = dataframe['Open']  * ratio
+      dataframe['High']  = dataframe['High']  * ratio
+      dataframe['Low']   = dataframe['Low']   * ratio
+      dataframe['Close'] = dataframe['Close'] * ratio
+
+    dataframe = dataframe[~dataframe.index.duplicated(keep = 'last')].dropna(how = 'all')
+    if not dataframe['Volume'].isnull().any():
+      dataframe['Volume'] = dataframe['Volume'].astype('int64')
+
+    return dataframe
+
+
+  """
+    [ name ]:
+      __info_to_dict (return dtype: Optional[Dict[str, Any]])
+
+    [ parameters ]
+      - symbol        (dtype: str)
+      - quote_summary (dtype: Optional[Dict[str, Any]])
+      - quote         (dtype: Optional[Dict[str, Any]])
+
+    [ description ]
+      Quote summary + quote JSON -> flat info dictionary (like Ticker.info)
+  """
+  def __info_to_dict(
+    self,
+    symbol:        str,
+    quote_summary: Optional[Dict[str, Any]],
+    quote:         Optional[Dict[str, Any]]
+  ) -> Optional[Dict[str, Any]]:
+    query_info: Dict[str, Any] = {}
+    for document, key in [(quote_summary, 'quoteSummary'), (quote, 'quoteResponse')]:
+      results: List[Dict[str, Any]] = ((document or {}).get(key) or {}).get('result') or []
+      if results: query_info.update(results[0])
+
+    if not query_info: return None
+
+    def formatting(key: Optional[str], value: Any) -> Any:
+      if isinstance(value, dict) and ('raw' in value) and ('fmt' in value):
+        return value['fmt'] if key in {'regularMarketTime', 'postMarketTime'} else value['raw']
+      if isinstance(value, list): return [formatting(None, item) for item in value]
+      if isinstance(value, dict): return {k: formatting(k, v) for k, v in value.items()}
+      if isinstance(value, str):  return value.replace('\xa0', ' ')
+      return value
+
+    stock_info: Dict[str, Any] = {}
+    for key, value in query_info.items():
+      if isinstance(value, dict):
+        for sub_key, sub_value in value.items():
+          if sub_value is not None:
+            stock_info[sub_key] = 86400 if (sub_key == 'maxAge') and (sub_value == 1) else sub_value
+
+      elif value is not None:
+        stock_info[key] = value
+
+    stock_info = {key: formatting(key, value) for key, value in stock_info.items()}
+    stock_info['symbol'] = symbol
+    return stock_info
+
+
+  """
+    [ name ]:
+      __run (return dtype: Dict[str, Any])
+
+    [ parameters ]
+      - symbols (dtype: List[str])
+      - fetch   (dtype: Callable[..., Awaitable[Any]])
+      - crumb   (dtype: bool)
+
+    [ description ]
+      Run one fetch coroutine per symbol on a shared async session
+  """
+  async def __run(
+    self,
+    symbols: List[str],
+    fetch:   Callable[..., Awaitable[Any]],
+    crumb:   bool = False
+  ) -> Dict[str, Any]:
+    self.__loop         = asyncio.get_running_loop()
+    self.__cancel_event = asyncio.Event()
+
+    semaphore: asyncio.Semaphore = asyncio.Semaphore(self.SCRAPER_ASYNC_CONCURRENCY)
+    bucket: AsyncTokenBucket = AsyncTokenBucket(
+      rate     = self.SCRAPER_ASYNC_RATE_LIMIT,
+      capacity = self.SCRAPER_ASYNC_BURST,
+      cancel_event = self.__cancel_event
+    )
+
+    async with AsyncSession(impersonate = choice(self.SCRAPER_BROWSER_AGENTS)) as session:
+      if crumb: self.__crumb = await self.__get_crumb(session)
+
+      async def worker(symbol: str) -> Any:
+        try:
+          if self.__is_cancelled(): return None
+          return await fetch(session, semaphore, bucket, symbol)
+
+        except asyncio.CancelledError:
+          logger.warning(f'[ CANCELLED ] {symbol}')
+          raise
+
+        except Exception as error_message:
+          logger.error(f'{error_message} {symbol}')
+          return None
+
+      tasks: List[asyncio.Task] = [asyncio.create_task(worker(symbol)) for symbol in symbols]
+      try:
+        results: List[Any] = await asyncio.gather(*tasks)
+
+      except asyncio.CancelledError:
+        for task in tasks: task.cancel()
+        await asyncio.gather(*tasks, return_exceptions = True)
+        raise
+
+    return dict(zip(symbols, results))
+
+
+  """
+    [ name ]:
+      get_charts (return dtype: Dict[str, Optional[DataFrame]])
+
+    [ parameters ]
+      - symbols     (dtype: List[str])
+      - start_dates (dtype: Dict[str, str])
+      - end_date    (dtype: str)
+
+    [ description ]
+      Daily historical data of every symbol (None for failed symbols)
+  """
+  def get_charts(
+    self,
+    symbols:     List[str],
+    start_dates: Dict[str, str],
+    end_date:    str
+  ) -> Dict[str, Optional[DataFrame]]:
+    async def fetch(session, semaphore, bucket, symbol: str) -> Optional[DataFrame]:
+      chart: Optional[Dict[str, Any]] = await self.__get_json(
+        session, semaphore, bucket,
+        url    = f'{self.base_url}/v8/finance/chart/{symbol}',
+        params = {
+          'period1':        int(to_datetime(start_dates[symbol]).timestamp()),
+          'period2':        int(to_datetime(end_date).timestamp()),
+          'interval':       '1d',
+          'includePrePost': 'false',
+          'events':         'div,splits,capitalGains'
+        }
+      )
+      return self.__chart_to_dataframe(chart) if chart is not None else None
+
+    try:
+      return asyncio.run(self.__run(symbols, fetch))
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return {symbol: None for symbol in symbols}
+
+
+  """
+    [ name ]:
+      get_infos (return dtype: Dict[str, Optional[Dict[str, Any]]])
+
+    [ parameters ]
+      - symbols (dtype: List[str])
+
+    [ description ]
+      Stock info of every symbol (None for failed / not found symbols)
+  """
+  def get_infos(self, symbols: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    async def fetch(session, semaphore, bucket, symbol: str) -> Optional[Dict[str, Any]]:
+      quote_summary: Optional[Dict[str, Any]] = await self.__get_json(
+        session, semaphore, bucket,
+        url    = f'{self.base_url}/v10/finance/quoteSummary/{symbol}',
+        params = {
+          'modules':   'financialData,quoteType,defaultKeyStatistics,assetProfile,summaryDetail',
+          'corsDomain': 'finance.yahoo.com',
+          'formatted': 'false',
+          'symbol':    symbol,
+          'crumb':     self.__crumb or ''
+        }
+      )
+      quote: Optional[Dict[str, Any]] = await self.__get_json(
+        session, semaphore, bucket,
+        url    = f'{self.base_url}/v7/finance/quote',
+        params = {'symbols': symbol, 'formatted': 'false', 'crumb': self.__crumb or ''}
+      )
+      return self.__info_to_dict(symbol, quote_summary, quote)
+
+    try:
+      return asyncio.run(self.__run(symbols, fetch, crumb = True))
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return {symbol: None for symbol in symbols}
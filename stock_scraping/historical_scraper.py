@@ -1,18 +1,23 @@
-from time import sleep
-from random import uniform
-from typing import List, Dict
+import numpy as np
+from typing import List, Dict, Optional, Callable
 from datetime import datetime, timedelta
 
-from yfinance import download
-from pandas import DataFrame, read_csv, to_datetime
+from yfinance import Ticker, download
+from yfinance import shared as yfinance_shared
+from yfinance.exceptions import YFRateLimitError
+from pandas import DataFrame, to_datetime, concat
+from pandas.api.types import is_datetime64_any_dtype
 
 from os import makedirs
 from os.path import exists as file_is_exists
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from settings.logging_rules import logger
 from settings.scraper_rules import ScraperRules
 from settings.location_rules import LocationRules
+from stock_scraping.async_engine import AsyncEngine
+from stock_scraping.rate_limiter import RateLimiter
+from stock_scraping.retry_queue import RetryQueue
+from stock_storage.table_storage import TableStorage
 
 from warnings import filterwarnings
 filterwarnings("ignore")
@@ -31,26 +36,54 @@ filterwarnings("ignore")
 
 
 class HistoricalScraper(ScraperRules, LocationRules):
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - downloader   (dtype: Optional[Callable[..., DataFrame]], default: __download_history)
+      - engine       (dtype: Optional[AsyncEngine], default: AsyncEngine())
+      - rate_limiter (dtype: Optional[RateLimiter], default: RateLimiter.shared())
+      - storage      (dtype: Optional[TableStorage], default: TableStorage())
+
+    [ description ]:
+      The downloader and the asyncio engine are injectable, so the scraping
+      paths can run against a local fake-download / HTTP stub
+  """
+  def __init__(
+    self,
+    downloader:   Optional[Callable[..., DataFrame]] = None,
+    engine:       Optional[AsyncEngine] = None,
+    rate_limiter: Optional[RateLimiter] = None,
+    storage:      Optional[TableStorage] = None
+  ) -> None:
+    self.downloader:   Callable[..., DataFrame] = downloader or self.__download_history
+    self.storage:      TableStorage = storage or TableStorage()
+    self.rate_limiter: RateLimiter = rate_limiter or RateLimiter.shared()
+    self.engine:       AsyncEngine = engine or AsyncEngine(rate_limiter = self.rate_limiter)
+
+
   """ 
     [ name ]:
-      __csv_store_validation (return dtype: bool)
+      __dataframe_validation (return dtype: bool)
 
     [ parameters ]:
-      - file_path (dtype: str)
+      - dataframe (dtype: DataFrame)
 
     [ description ]:
-      To validate CSV
+      To validate the historical DataFrame before it is stored
   """
-  def __csv_store_validation(self, file_path: str) -> bool:
+  def __dataframe_validation(self, dataframe: DataFrame) -> bool:
     try:
-      dataframe = read_csv(file_path)
-
       # validation brohh..: if dataframe is empty
       if dataframe.empty: return False
 
       # validation brohh..: header only, without values
       if len(dataframe) == 0: return False
 
+      # validation brohh..: without dates
+      if ('Date' not in dataframe.columns) or dataframe['Date'].isnull().all(): return False
+
       return True
       
     except Exception as error_message:
@@ -60,71 +93,345 @@ class HistoricalScraper(ScraperRules, LocationRules):
 
   """
     [ name ]:
-       __get_historical (return dtype: str or None)
+       __get_stored_historical (return dtype: Optional[DataFrame])
 
     [ parameters ]
-      - symbol (dtype: str)
+      - csv_filename (dtype: str)
+
+    [ description ]
+      Get the stored historical data (None if there is no usable table)
+  """
+  def __get_stored_historical(self, csv_filename: str) -> Optional[DataFrame]:
+    try:
+      if not self.storage.exists(csv_filename): return None
+
+      # round trip: the stored prices are written back unchanged on merge
+      stored_historical: DataFrame = self.storage.read(csv_filename, round_trip = True)
+      if stored_historical.empty or ('Date' not in stored_historical.columns):
+        return None
+
+      # typed storage (datetime64): same text dates as the downloaded sessions
+      if is_datetime64_any_dtype(stored_historical['Date']):
+        stored_historical['Date'] = stored_historical['Date'].dt.strftime('%Y-%m-%d')
+
+      return stored_historical
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {csv_filename}')
+      return None
+
+
+  """
+    [ name ]:
+       __get_start_date (return dtype: str)
+
+    [ parameters ]
+      - stored_historical (dtype: Optional[DataFrame])
+
+    [ description ]
+      Download start date: last stored date minus an overlap window
+      (to catch revised sessions), or the initial start date
+  """
+  def __get_start_date(self, stored_historical: Optional[DataFrame]) -> str:
+    if stored_historical is None:
+      return self.SCRAPER_HISTORICAL_START_DATE
+
+    last_date: datetime = to_datetime(stored_historical['Date'], errors = 'coerce').max()
+    start_date: str = (
+      last_date - timedelta(days = self.SCRAPER_HISTORICAL_OVERLAP_DAYS)
+    ).strftime('%Y-%m-%d')
+
+    return max(start_date, self.SCRAPER_HISTORICAL_START_DATE)
+
+
+  """
+    [ name ]:
+       __is_adjusted (return dtype: bool)
+
+    [ parameters ]
+      - stored_historical (dtype: DataFrame)
+      - dataframe         (dtype: DataFrame, downloaded sessions)
+
+    [ description ]
+      The prices of the overlap window differ from the stored ones
+      (split / dividend re-adjusted history): the whole history has to
+      be downloaded again. The last stored session is left out, it may
+      have been stored before the market closed
+  """
+  def __is_adjusted(self, stored_historical: DataFrame, dataframe: DataFrame) -> bool:
+    columns: List[str] = [
+      column for column in ['Adj Close', 'Close', 'High', 'Low', 'Open']
+        if (column in stored_historical.columns) and (column in dataframe.columns)
+    ]
+
+    last_date: str = stored_historical['Date'].max()
+    overlap: DataFrame = stored_historical.loc[
+      stored_historical['Date'] < last_date, ['Date'] + columns
+    ].merge(dataframe[['Date'] + columns], on = 'Date', suffixes = ('_stored', ''))
+    if overlap.empty: return False
+
+    return not np.allclose(
+      overlap[[f'{column}_stored' for column in columns]].to_numpy(dtype = np.float64),
+      overlap[columns].to_numpy(dtype = np.float64),
+      rtol = self.SCRAPER_HISTORICAL_ADJUSTED_TOLERANCE, atol = 0, equal_nan = True
+    )
+
+
+  """
+    [ name ]:
+       __download_history (return dtype: DataFrame)
+
+    [ parameters ]
+      - tickers (dtype: str or List[str])
+      - start   (dtype: str)
+      - end     (dtype: str)
+      - options (dtype: Dict[str, Any], extra download arguments)
+
+    [ description ]
+      Default downloader. One symbol goes through Ticker.history (the
+      call yfinance.download makes per symbol, same arguments), with
+      raise_errors: errors are raised to this call instead of being left
+      in the process-global yfinance_shared._ERRORS, which concurrent
+      downloads overwrite. A failed download (timeout, HTTP 5xx, no
+      price data) is not an empty frame, so the symbol is retried.
+
+      Several symbols go through yfinance.download, their errors are
+      kept in DataFrame.attrs['errors'] (the batch path and its retries
+      run one download at a time)
+  """
+  def __download_history(
+    self, tickers: str or List[str],
+    start:         str,
+    end:           str,
+    **options
+  ) -> DataFrame:
+    if isinstance(tickers, str):
+      historical: DataFrame = Ticker(tickers).history(
+        start = start, end = end, actions = False, auto_adjust = True,
+        raise_errors = True, **options
+      )
+      historical.index = historical.index.tz_localize(None)
+      return historical
+
+    historicals: DataFrame = download(tickers = tickers, start = start, end = end, **options)
+    historicals.attrs['errors'] = {
+      ticker: yfinance_shared._ERRORS[ticker.upper()]
+        for ticker in tickers if ticker.upper() in yfinance_shared._ERRORS
+    }
+    return historicals
+
+
+  """
+    [ name ]:
+       __download (return dtype: DataFrame)
+
+    [ parameters ]
+      - tickers    (dtype: str or List[str])
+      - start_date (dtype: str)
+      - options    (dtype: Dict[str, Any], extra download arguments)
+
+    [ description ]
+      One download call through the shared rate limiter
+      (rate limit errors of this call slow the limiter down)
+  """
+  def __download(self, tickers: str or List[str], start_date: str, **options) -> DataFrame:
+    # end_date: str = datetime.now().strftime('%Y-%m-%d')
+    end_date: str = (datetime.now() + timedelta(days = 1)).strftime('%Y-%m-%d')
+
+    try:
+      with self.rate_limiter.request():
+        historical: DataFrame = self.downloader(
+          tickers = tickers,
+          start   = start_date,
+          end     = end_date,
+          **options
+        )
+
+    except YFRateLimitError:
+      self.rate_limiter.penalize()
+      raise
+
+    # errors of this call only (not the process-global yfinance_shared._ERRORS)
+    errors: Dict[str, str] = historical.attrs.get('errors', {}) if historical is not None else {}
+    if any('YFRateLimitError' in str(error) for error in errors.values()):
+      self.rate_limiter.penalize()
+    else:
+      self.rate_limiter.reward()
+
+    return historical
+
+
+  """
+    [ name ]:
+       __get_historical (return dtype: DataFrame or None)
+
+    [ parameters ]
+      - symbol     (dtype: str)
+      - start_date (dtype: str)
 
     [ description ]
       Get Historical Data
   """
-  def __get_historical(self, symbol: str) -> str or None:
+  def __get_historical(self, symbol: str, start_date: str) -> DataFrame or None:
     try:
       if not file_is_exists(self.DATASET_HISTORICAL_CSV_PATH):
         makedirs(self.DATASET_HISTORICAL_CSV_PATH)
 
-      start_date: str = '2023-01-01'
-      # end_date: str = datetime.now().strftime('%Y-%m-%d')
-      end_date:   str = (datetime.now() + timedelta(days = 1)).strftime('%Y-%m-%d')
-
-      historical: DataFrame = download(
-        tickers  = symbol,
-        start    = start_date,
-        end      = end_date
+      historical: DataFrame = self.__download(
+        tickers    = symbol,
+        start_date = start_date
         # progress = False,
         # interval ='1d'
       )
 
-      symbol:       str = symbol[:len(symbol) - 3]
-      csv_filename: str = f"{self.DATASET_HISTORICAL_CSV_PATH}/{symbol}.csv"
-      historical.to_csv(path_or_buf = csv_filename)
-
-      return csv_filename
+      return historical
     
     except Exception as error_message:
       logger.error(f'{error_message} {symbol}')
       return None
 
 
+  """
+    [ name ]:
+       __get_historicals (return dtype: DataFrame or None)
+
+    [ parameters ]
+      - symbols    (dtype: List[str])
+      - start_date (dtype: str)
+
+    [ description ]
+      Get Historical Data of several symbols in one download call
+      (MultiIndex columns: price, ticker)
+  """
+  def __get_historicals(self, symbols: List[str], start_date: str) -> DataFrame or None:
+    try:
+      if not file_is_exists(self.DATASET_HISTORICAL_CSV_PATH):
+        makedirs(self.DATASET_HISTORICAL_CSV_PATH)
+
+      historicals: DataFrame = self.__download(
+        tickers    = symbols,
+        start_date = start_date,
+        group_by   = 'column'
+      )
+
+      return historicals
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbols}')
+      return None
+
+
+  """
+    [ name ]:
+       __flatten_historical (return dtype: DataFrame)
+
+    [ parameters ]
+      - historicals (dtype: DataFrame)
+      - symbol      (dtype: str)
+
+    [ description ]
+      Take one symbol out of a yfinance download, in memory:
+      flat columns, "Date" column (YYYY-MM-DD), sessions without data dropped
+  """
+  def __flatten_historical(self, historicals: DataFrame, symbol: str) -> DataFrame:
+    columns: List[str] = ['Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume']
+
+    if historicals.columns.nlevels > 1:
+      if symbol not in historicals.columns.get_level_values(1):
+        return DataFrame(columns = ['Date'] + columns[1:])
+
+      historical: DataFrame = historicals.xs(symbol, axis = 1, level = 1)
+    else:
+      historical: DataFrame = historicals
+
+    historical = historical.dropna(how = 'all')
+    if len([column for column in historical.columns if column in columns]) not in (5, 6):
+      logger.info(f"[Shape: {historical.shape[1] + 1}] [Symbol: {symbol}] Number Of Columns Does'nt match")
+
+    dataframe = DataFrame({'Date': to_datetime(historical.index).strftime('%Y-%m-%d')})
+    for column in columns:
+      if column in historical.columns:
+        dataframe[column] = historical[column].to_numpy()
+
+    # the multi-ticker frame is a union of sessions (NaN padded),
+    # restore the integer volume of a single-ticker download
+    if ('Volume' in dataframe.columns) and (not dataframe['Volume'].isnull().any()):
+      dataframe['Volume'] = dataframe['Volume'].astype('int64')
+
+    return dataframe
+
+
+  """
+    [ name ]:
+       __store_historical (return dtype: None)
+
+    [ parameters ]
+      - csv_filename      (dtype: str)
+      - dataframe         (dtype: DataFrame)
+      - stored_historical (dtype: Optional[DataFrame])
+
+    [ description ]
+      Merge with the stored data (downloaded sessions win on the same date)
+      and write the table once (TableStorage: temporary file, then atomic replace)
+  """
+  def __store_historical(
+    self,
+    csv_filename:      str,
+    dataframe:         DataFrame,
+    stored_historical: Optional[DataFrame]
+  ) -> None:
+    if stored_historical is not None:
+      columns: List[str] = [
+        column for column in dataframe.columns
+          if column in stored_historical.columns
+      ]
+      dataframe = concat([stored_historical[columns], dataframe[columns]]) \
+        .drop_duplicates(subset = 'Date', keep = 'last') \
+        .sort_values(by = 'Date') \
+        .reset_index(drop = True)
+
+    self.storage.write(csv_filename, dataframe, index = False)
+
+
   """
     [ name ]:
        get_by_symbol (return dtype: Dict[bool, str])
 
     [ parameters ]
-      - symbol (dtype: str)
+      - symbol        (dtype: str)
+      - full_download (dtype: bool, default: False)
 
     [ description ]
-      Get historical data by symbol
+      Get historical data by symbol. Only the sessions after the last
+      stored date (plus an overlap window) are downloaded, then merged
+      with the stored data and de-duplicated on the date. The whole
+      history is downloaded again (full_download) when the overlap
+      window was re-adjusted
   """
-  def get_by_symbol(self, symbol: str) -> Dict[bool, str]:
+  def get_by_symbol(self, symbol: str, full_download: bool = False) -> Dict[bool, str]:
+    csv_filename: str = self.storage.get_path(f"{self.DATASET_HISTORICAL_CSV_PATH}/{symbol[:len(symbol) - 3]}.csv")
     try:
-      sleep(uniform(0.3, 0.5))
-      csv_filename: str or None = self.__get_historical(symbol)
-      if csv_filename is None: return False, symbol, csv_filename
+      stored_historical: Optional[DataFrame] = \
+        None if full_download else self.__get_stored_historical(csv_filename)
+      start_date: str = self.__get_start_date(stored_historical)
+
+      historical: DataFrame or None = self.__get_historical(symbol, start_date)
+      if historical is None: return False, symbol, None
 
-      dataframe = read_csv(csv_filename, header = None)
-      dataframe = dataframe.drop([0, 1, 2])
-      dataframe.reset_index(drop = True, inplace = True)
+      dataframe: DataFrame = self.__flatten_historical(historical, symbol)
+      if not self.__dataframe_validation(dataframe):
+        if stored_historical is not None:
+          logger.info(f'[ SKIPPED ] No new data since {start_date} for "{csv_filename}"')
+          return True, symbol, csv_filename
 
-      if dataframe.shape[1] == 7:
-        dataframe.columns = ['Date', 'Adj Close', 'Close', 'High', 'Low', 'Open', 'Volume']
-      elif dataframe.shape[1] == 6:
-        dataframe.columns = ['Date', 'Close', 'High', 'Low', 'Open', 'Volume']
-      else:
-          logger.info(f"[Shape: {dataframe.shape[1]}] [Symbol: {symbol}] Number Of Columns Does'nt match")
+        return False, symbol, csv_filename
 
-      dataframe['Date'] = to_datetime(dataframe['Date']).dt.strftime('%Y-%m-%d')
-      dataframe.to_csv(csv_filename, index = False)
+      if (stored_historical is not None) and self.__is_adjusted(stored_historical, dataframe):
+        logger.warning(f'[ ADJUSTED ] Overlap window revised since {start_date}, full download of "{csv_filename}"')
+        return self.get_by_symbol(symbol, full_download = True)
+
+      # merge with the stored data, downloaded sessions win on the same date
+      self.__store_historical(csv_filename, dataframe, stored_historical)
 
       logger.info(f'[ SAVED ] Datasets are stored on "{csv_filename}"')
       return True, symbol, csv_filename
@@ -136,178 +443,373 @@ class HistoricalScraper(ScraperRules, LocationRules):
 
   """
     [ name ]:
-      __retry_mechanism (return dtype: None)
+       get_by_batch (return dtype: List[str])
+
+    [ parameters ]
+      - symbols (dtype: List[str])
+
+    [ description ]
+      Get historical data of a chunk of symbols with one download call,
+      split per symbol in memory and stored with one write per symbol.
+      Returns the failed symbols
+  """
+  def get_by_batch(self, symbols: List[str]) -> List[str]:
+    failed_symbols: List[str] = []
+    try:
+      csv_filenames: Dict[str, str] = {
+        symbol: self.storage.get_path(f"{self.DATASET_HISTORICAL_CSV_PATH}/{symbol[:len(symbol) - 3]}.csv")
+          for symbol in symbols
+      }
+      stored_historicals: Dict[str, Optional[DataFrame]] = {
+        symbol: self.__get_stored_historical(csv_filenames[symbol])
+          for symbol in symbols
+      }
+
+      # one request for the whole chunk: start from the earliest start date
+      start_date: str = min(
+        self.__get_start_date(stored_historicals[symbol]) for symbol in symbols
+      )
+
+      historicals: DataFrame or None = self.__get_historicals(symbols, start_date)
+      if historicals is None: return symbols.copy()
+
+      # symbols whose download failed (not a download without new rows)
+      errors: Dict[str, str] = historicals.attrs.get('errors', {})
+
+      for symbol in symbols:
+        try:
+          csv_filename: str = csv_filenames[symbol]
+          stored_historical: Optional[DataFrame] = stored_historicals[symbol]
+          dataframe: DataFrame = self.__flatten_historical(historicals, symbol)
+
+          if not self.__dataframe_validation(dataframe):
+            if (stored_historical is None) or (symbol in errors):
+              failed_symbols.append(symbol)
+              logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+            else:
+              logger.info(f'[ SKIPPED ] No new data since {start_date} for "{csv_filename}"')
+            continue
+
+          if (stored_historical is not None) and self.__is_adjusted(stored_historical, dataframe):
+            logger.warning(f'[ ADJUSTED ] Overlap window revised, full download of "{csv_filename}"')
+            if not self.get_by_symbol(symbol, full_download = True)[0]:
+              failed_symbols.append(symbol)
+              logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+            continue
+
+          self.__store_historical(csv_filename, dataframe, stored_historical)
+          logger.info(f'[ SAVED ] Datasets are stored on "{csv_filename}"')
+
+        except Exception as error_message:
+          logger.error(f'{error_message} {symbol}')
+          failed_symbols.append(symbol)
+
+      return failed_symbols
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbols}')
+      return symbols.copy()
+
+
+  """
+    [ name ]:
+      __retry_mechanism (return dtype: List[str])
 
     [ parameters ]
       - failed_symbols (dtype: List[str])
 
     [ description ]
-      Retry mechanism with throttling and exponential back-off,
-      to prevent scraping failure
+      Retry mechanism (retry queue: per-symbol jittered exponential
+      back-off and attempt budget, throttled by the shared rate limiter),
+      to prevent scraping failure. One worker: the SYNC / BATCH / ASYNCIO
+      paths retry one symbol at a time, as their first pass downloads.
+      Returns the symbols still failed after the retries
   """
-  def __retry_mechanism(self, failed_symbols: List[str]) -> None:
+  def __retry_mechanism(self, failed_symbols: List[str]) -> List[str]:
     try:
-      retry_count: int = 0
-      max_retries: int = self.SCRAPER_MAXIMUM_RETRY
-      exponential_backoff: int = 3
-
-      while failed_symbols and retry_count < max_retries:
-        logger.warning(f'[ RETRY MECHANISM ] retry count: {retry_count + 1}')
-        stock_failed: List[str] = failed_symbols.copy()
-        failed_symbols.clear()
-          
-        for symbol in stock_failed:
-          sleep(uniform(0.3, 0.5))
-          is_success, symbol, csv_filename = self.get_by_symbol(symbol)
-          csv_file_is_valid: bool = self.__csv_store_validation(csv_filename)
-
-          if (not is_success) or (not csv_file_is_valid):
-            failed_symbols.append(symbol)
-            logger.warning(f'[ RETRY MECHANISM ] [ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
-          
-        retry_count += 1
-        if failed_symbols:
-          logger.info(f'[ RETRY MECHANISM ] Waiting {exponential_backoff} seconds before next retry...')
-          sleep(exponential_backoff)
-          exponential_backoff += (self.SCRAPER_EXPONENTIAL_RETRY + uniform(0.1, 0.4))
+      logger.warning(f'[ RETRY MECHANISM ] {len(failed_symbols)} symbols on the retry queue')
+      failed_symbols = RetryQueue(rate_limiter = self.rate_limiter, max_workers = 1).run(
+        symbols       = failed_symbols,
+        task          = lambda symbol: self.get_by_symbol(symbol)[0],
+        first_attempt = 1
+      )
 
       if failed_symbols:
-          logger.warning(f"Symbols failed after {max_retries} retries: {failed_symbols}")
+          logger.warning(f"Symbols failed after {self.SCRAPER_MAXIMUM_RETRY} retries: {failed_symbols}")
 
     except Exception as error_message:
       logger.error(error_message) 
 
+    return failed_symbols
+
+
+  """
+    [ name ]:
+      __get_by_retry_queue (return dtype: List[str])
+
+    [ parameters ]
+      - symbols (dtype: List[str])
+
+    [ description ]
+      First pass and retries flow through the same worker pool.
+      Returns the failed symbols
+  """
+  def __get_by_retry_queue(self, symbols: List[str]) -> List[str]:
+    failed_symbols: List[str] = RetryQueue(rate_limiter = self.rate_limiter).run(
+      symbols = symbols,
+      task    = lambda symbol: self.get_by_symbol(symbol)[0]
+    )
+
+    if failed_symbols:
+      logger.warning(f"Symbols failed after {self.SCRAPER_MAXIMUM_RETRY} retries: {failed_symbols}")
+
+    return failed_symbols
+
 
   """
     [ name ]:
-       get_by_dataframe_sync (return dtype: None)
+       get_by_dataframe_sync (return dtype: Optional[List[str]])
 
     [ parameters ]
       - dataframe (dtype: DataFrame)
 
     [ description ]
-      Get historical data by DataFrame (Synchronous Process)
+      Get historical data by DataFrame (Synchronous Process).
+      Returns the failed symbols (None when the process failed)
   """
-  def get_by_dataframe_sync(self, dataframe: DataFrame) -> None:
+  def get_by_dataframe_sync(self, dataframe: DataFrame) -> Optional[List[str]]:
     try:
       failed_symbols: List[str] = []
 
       for symbol in dataframe['symbol'].tolist():
         is_success, symbol, csv_filename = self.get_by_symbol(symbol)
-        csv_file_is_valid: bool = self.__csv_store_validation(csv_filename)
 
-        if (not is_success) or (not csv_file_is_valid):
+        if not is_success:
           failed_symbols.append(symbol)
           logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
 
       # Retry mechanism with throttling and exponential back-off
       # to prevent scraping failure
-      if failed_symbols: self.__retry_mechanism(failed_symbols)
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      self.rate_limiter.log_metrics('historical')
+      return failed_symbols
 
     except Exception as error_message:
       logger.error(error_message)
+      return None
 
 
   """
     [ name ]:
-       get_by_dataframe_async (return dtype: None)
+       get_by_dataframe_async (return dtype: Optional[List[str]])
 
     [ parameters ]
       - dataframe (dtype: DataFrame)
 
     [ description ]
-      Get historical data by DataFrame (Asynchronous Process)
+      Get historical data by DataFrame (Asynchronous Process).
+      Returns the failed symbols (None when the process failed)
   """
-  def get_by_dataframe_async(self, dataframe: DataFrame) -> None:
+  def get_by_dataframe_async(self, dataframe: DataFrame) -> Optional[List[str]]:
     try:
-      # for symbol in dataframe['symbol'].tolist():
-      #   self.get_by_symbol(symbol)
-      failed_symbols: List[str] = []
-
-      with ThreadPoolExecutor(max_workers = self.SCRAPER_THREAD_WORKER) as executor:
-        future_to_get_by_dataframe = {
-          executor.submit(self.get_by_symbol, symbol):
-            symbol for symbol in dataframe['symbol'].tolist()
-        }
-
-        for future in as_completed(future_to_get_by_dataframe):
-          is_success, symbol, csv_filename = future.result()
-          csv_file_is_valid: bool = self.__csv_store_validation(csv_filename)
-
-          if (not is_success) or (not csv_file_is_valid):
-            failed_symbols.append(symbol)
-            logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
-
-      # Retry mechanism with throttling and exponential back-off
-      # to prevent scraping failure
-      if failed_symbols: self.__retry_mechanism(failed_symbols)
+      # first pass and retries share the retry queue worker pool
+      failed_symbols: List[str] = self.__get_by_retry_queue(dataframe['symbol'].tolist())
+      self.rate_limiter.log_metrics('historical')
+      return failed_symbols
 
     except Exception as error_message:
       logger.error(error_message)
+      return None
 
 
   """
     [ name ]:
-      get_by_symbols_sync (return dtype: None)
+      get_by_symbols_sync (return dtype: Optional[List[str]])
 
     [ parameters ]
       - symbols (dtype: List[str])
 
     [ description ]
-      Get historical data by symbols (Synchronous Process)
+      Get historical data by symbols (Synchronous Process).
+      Returns the failed symbols (None when the process failed)
   """
-  def get_by_symbols_sync(self, symbols: List[str]) -> None:
+  def get_by_symbols_sync(self, symbols: List[str]) -> Optional[List[str]]:
     try:
       failed_symbols: List[str] = []
       for symbol in symbols:
         is_success, symbol, csv_filename = self.get_by_symbol(symbol)
-        csv_file_is_valid: bool = self.__csv_store_validation(csv_filename)
 
-        if (not is_success) or (not csv_file_is_valid):
+        if not is_success:
           failed_symbols.append(symbol)
           logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
 
       # Retry mechanism with throttling and exponential back-off
       # to prevent scraping failure
-      if failed_symbols: self.__retry_mechanism(failed_symbols)
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      self.rate_limiter.log_metrics('historical')
+      return failed_symbols
     
     except Exception as error_message:
       logger.error(error_message)
+      return None
+
+
+  """
+    [ name ]:
+      get_by_symbols_async (return dtype: Optional[List[str]])
+
+    [ parameters ]
+      - symbols (dtype: List[str])
+
+    [ description ]
+      Get historical data by symbols (Asynchronous Process).
+      Returns the failed symbols (None when the process failed)
+  """
+  def get_by_symbols_async(self, symbols: List[str]) -> Optional[List[str]]:
+    try:
+      # first pass and retries share the retry queue worker pool
+      failed_symbols: List[str] = self.__get_by_retry_queue(symbols)
+      self.rate_limiter.log_metrics('historical')
+      return failed_symbols
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
 
 
   """
     [ name ]:
-      get_by_symbols_async (return dtype: None)
+      get_by_symbols_batch (return dtype: Optional[List[str]])
 
     [ parameters ]
       - symbols (dtype: List[str])
 
     [ description ]
-      Get historical data by symbols (Asynchronous Process)
+      Get historical data by symbols (Batch Process, multi-ticker
+      download of SCRAPER_HISTORICAL_BATCH_SIZE symbols per call).
+      Returns the failed symbols (None when the process failed)
   """
-  def get_by_symbols_async(self, symbols: List[str]) -> None:
+  def get_by_symbols_batch(self, symbols: List[str]) -> Optional[List[str]]:
     try:
-      # for symbol in symbols:
-      #   self.get_by_symbol(symbol)
       failed_symbols: List[str] = []
-      with ThreadPoolExecutor(max_workers = self.SCRAPER_THREAD_WORKER) as executor:
-        future_to_get_by_symbols = {
-          executor.submit(self.get_by_symbol, symbol):
-            symbol for symbol in symbols
-        }
+      batch_size: int = max(1, self.SCRAPER_HISTORICAL_BATCH_SIZE)
+
+      for index in range(0, len(symbols), batch_size):
+        failed_symbols.extend(self.get_by_batch(symbols[index:index + batch_size]))
+
+      # Retry mechanism with throttling and exponential back-off
+      # to prevent scraping failure
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      self.rate_limiter.log_metrics('historical')
+      return failed_symbols
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
+
+
+  """
+    [ name ]:
+       get_by_dataframe_batch (return dtype: Optional[List[str]])
+
+    [ parameters ]
+      - dataframe (dtype: DataFrame)
+
+    [ description ]
+      Get historical data by DataFrame (Batch Process).
+      Returns the failed symbols (None when the process failed)
+  """
+  def get_by_dataframe_batch(self, dataframe: DataFrame) -> Optional[List[str]]:
+    return self.get_by_symbols_batch(dataframe['symbol'].tolist())
+
+
+  """
+    [ name ]:
+      get_by_symbols_asyncio (return dtype: Optional[List[str]])
+
+    [ parameters ]
+      - symbols (dtype: List[str])
+
+    [ description ]
+      Get historical data by symbols (Asyncio Process, see AsyncEngine).
+      Returns the failed symbols (None when the process failed)
+  """
+  def get_by_symbols_asyncio(self, symbols: List[str]) -> Optional[List[str]]:
+    try:
+      if not file_is_exists(self.DATASET_HISTORICAL_CSV_PATH):
+        makedirs(self.DATASET_HISTORICAL_CSV_PATH)
 
-        for future in as_completed(future_to_get_by_symbols):
-          is_success, symbol, csv_filename = future.result()
-          csv_file_is_valid: bool = self.__csv_store_validation(csv_filename)
+      failed_symbols: List[str] = []
+      csv_filenames: Dict[str, str] = {
+        symbol: self.storage.get_path(f"{self.DATASET_HISTORICAL_CSV_PATH}/{symbol[:len(symbol) - 3]}.csv")
+          for symbol in symbols
+      }
+      stored_historicals: Dict[str, Optional[DataFrame]] = {
+        symbol: self.__get_stored_historical(csv_filenames[symbol])
+          for symbol in symbols
+      }
+
+      historicals: Dict[str, Optional[DataFrame]] = self.engine.get_charts(
+        symbols     = symbols,
+        start_dates = {
+          symbol: self.__get_start_date(stored_historicals[symbol])
+            for symbol in symbols
+        },
+        end_date    = (datetime.now() + timedelta(days = 1)).strftime('%Y-%m-%d')
+      )
 
-          if (not is_success) or (not csv_file_is_valid):
-            failed_symbols.append(symbol)
-            logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+      for symbol in symbols:
+        try:
+          csv_filename: str = csv_filenames[symbol]
+          stored_historical: Optional[DataFrame] = stored_historicals[symbol]
+
+          historical: Optional[DataFrame] = historicals.get(symbol)
+          dataframe: Optional[DataFrame] = self.__flatten_historical(historical, symbol) \
+            if historical is not None else None
+
+          if (dataframe is None) or (not self.__dataframe_validation(dataframe)):
+            if (historical is not None) and (stored_historical is not None):
+              logger.info(f'[ SKIPPED ] No new data for "{csv_filename}"')
+            else:
+              failed_symbols.append(symbol)
+              logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+            continue
+
+          if (stored_historical is not None) and self.__is_adjusted(stored_historical, dataframe):
+            logger.warning(f'[ ADJUSTED ] Overlap window revised, full download of "{csv_filename}"')
+            if not self.get_by_symbol(symbol, full_download = True)[0]:
+              failed_symbols.append(symbol)
+              logger.warning(f'[ FAILED SYMBOL ] Append "{symbol}" to LIST -> failed_symbols: List[str]')
+            continue
+
+          self.__store_historical(csv_filename, dataframe, stored_historical)
+          logger.info(f'[ SAVED ] Datasets are stored on "{csv_filename}"')
+
+        except Exception as error_message:
+          logger.error(f'{error_message} {symbol}')
+          failed_symbols.append(symbol)
 
       # Retry mechanism with throttling and exponential back-off
       # to prevent scraping failure
-      if failed_symbols: self.__retry_mechanism(failed_symbols)
+      if failed_symbols: failed_symbols = self.__retry_mechanism(failed_symbols)
+      self.rate_limiter.log_metrics('historical')
+      return failed_symbols
 
     except Exception as error_message:
       logger.error(error_message)
+      return None
+
+
+  """
+    [ name ]:
+       get_by_dataframe_asyncio (return dtype: Optional[List[str]])
 
+    [ parameters ]
+      - dataframe (dtype: DataFrame)
+
+    [ description ]
+      Get historical data by DataFrame (Asyncio Process).
+      Returns the failed symbols (None when the process failed)
+  """
+  def get_by_dataframe_asyncio(self, dataframe: DataFrame) -> Optional[List[str]]:
+    return self.get_by_symbols_asyncio(dataframe['symbol'].tolist())
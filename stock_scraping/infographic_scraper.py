@@ -1,19 +1,21 @@
 import re
-from time import sleep
-from random import choice, uniform
+from random import choice
 from typing import List, Dict, Any, Optional
 
 from curl_cffi.requests import Session 
 from os.path import exists as file_is_exists
-from concurrent.futures import ThreadPoolExecutor, as_completed
 
 from yfinance.ticker import Ticker
+from yfinance.exceptions import YFRateLimitError
 from pandas import DataFrame, read_csv
 from investpy.stocks import get_stocks as investpy_get_stocks
 
 from settings.logging_rules import logger
 from settings.scraper_rules import ScraperRules
 from settings.location_rules import LocationRules
+from stock_scraping.async_engine import AsyncEngine
+from stock_scraping.rate_limiter import RateLimiter
+from stock_scraping.retry_queue import RetryQueue
 
 from warnings import filterwarnings
 filterwarnings("ignore")
@@ -40,6 +42,26 @@ class InfographicScraper(ScraperRules, LocationRules):
   ]
 
 
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - engine       (dtype: Optional[AsyncEngine], default: AsyncEngine())
+      - rate_limiter (dtype: Optional[RateLimiter], default: RateLimiter.shared())
+
+    [ description ]:
+      The asyncio engine is injectable (local HTTP stub)
+  """
+  def __init__(
+    self,
+    engine:       Optional[AsyncEngine] = None,
+    rate_limiter: Optional[RateLimiter] = None
+  ) -> None:
+    self.rate_limiter: RateLimiter = rate_limiter or RateLimiter.shared()
+    self.engine:       AsyncEngine = engine or AsyncEngine(rate_limiter = self.rate_limiter)
+
+
   """
     [ name ]:
        __is_valid_stock (return dtype: bool)
@@ -99,22 +121,27 @@ class InfographicScraper(ScraperRules, LocationRules):
         session = choice(self.__BROWSER_SESSIONS)
       )
 
-      stock_info: Dict[str, Any] = ticker.info
+      with self.rate_limiter.request():
+        stock_info: Dict[str, Any] = ticker.info
       stock_info['symbol']       = symbol
+      self.rate_limiter.reward()
 
       # Validation: Is Valid Stock ?.
       is_valid: bool = self.__is_valid_stock(stock_info)
       if process == 'ASYNC':
-        return stock_info, 'VALIDATION_STEP' if (is_valid == True) \
-          else None, 'VALIDATION_STEP' 
+        return (stock_info, 'VALIDATION_STEP') if (is_valid == True) \
+          else (None, 'VALIDATION_STEP')
 
       elif process == 'SYNC':
         return stock_info if (is_valid == True) else None
 
     except Exception as error_message:
       logger.error(f"{symbol} {error_message}")
+      if isinstance(error_message, YFRateLimitError):
+        self.rate_limiter.penalize()
+
       if process == 'ASYNC':
-        if re.search(r'http.*404', error_message, re.IGNORECASE):
+        if re.search(r'http.*404', str(error_message), re.IGNORECASE):
           return None, 'NOT_FOUND'
         else:
           return None, 'EXCEPTION_STEP'
@@ -166,8 +193,8 @@ class InfographicScraper(ScraperRules, LocationRules):
           )
 
         iteration += 1
-        sleep(self.SCRAPER_RATE_LIMIT_HANDLE)
 
+      self.rate_limiter.log_metrics('infographic')
       return stock_datas
       
     except Exception as error_message:
@@ -181,65 +208,30 @@ class InfographicScraper(ScraperRules, LocationRules):
 
     [ description ]
       Get Stocks Data (Asynchronous Process) [ -- ON DEVELOPMENT -- ]
-
-    def __fetch_with_throttle(self, symbol: str):
-      sleep(uniform(0.3, 0.8))
-      return self.__fetch_stock_info(symbol, 'ASYNC')
+      (throttled by the shared rate limiter)
   """
   def __get_stocks_data_async(self) -> Optional[Dict[str, Any]]:
     PROCESS: str = 'ASYNC'
     try:
-      failed_symbols: List[str] = []
-      stock_datas:    List[Dict[str, Any]] = []
+      stock_datas: List[Dict[str, Any]] = []
+
+      # True: finished (valid, rejected or not found), False: retry
+      def fetch(stock_symbol: str) -> bool:
+        stock_info, step = self.__fetch_stock_info(stock_symbol, PROCESS)
+        if (stock_info) and (step == 'VALIDATION_STEP'):
+          stock_datas.append(stock_info)
+          logger.info(f"[stocks: {len(stock_datas)}] [{stock_symbol} | {stock_info.get('longName')}]")
 
-      with ThreadPoolExecutor(max_workers = self.SCRAPER_THREAD_WORKER) as executor:
-        future_to_fetch_stock_info = {
-          executor.submit(self.__fetch_stock_info, stock_symbol, PROCESS):
-            stock_symbol for stock_symbol in self.get_stocks_symbol()
-        }
-
-        for future in as_completed(future_to_fetch_stock_info):
-          stock_info, step = future.result()
-          if (stock_info) and (step == 'VALIDATION_STEP'):
-            stock_symbol: str = stock_info.get('symbol')
-            stock_datas.append(stock_info)
-            logger.info(f"[stocks: {len(stock_datas)}] [{stock_symbol} | {stock_info.get('longName')}]")
-
-          elif (not stock_info) and (step == 'VALIDATION_STEP'): pass
-          elif (not stock_info) and (step == 'NOT_FOUND'): pass
-          else: failed_symbols.append(stock_symbol)
-
-      # Retry mechanism with exponential back-off
-      # to prevent scraping failure
-      retry_count: int = 0
-      max_retries: int = self.SCRAPER_MAXIMUM_RETRY
-      exponential_backoff: int = 3
-
-      while failed_symbols and retry_count < max_retries:
-        logger.warning(f'[ RETRY MECHANISM ] retry count: {retry_count + 1}')
-        stock_failed: List[str] = failed_symbols.copy()
-        failed_symbols.clear()
-          
-        for symbol in stock_failed:
-          # throttling mechanism
-          sleep(uniform(0.3, 0.8))
-          stock_info: Optional[Dict[str, Any]] = \
-            self.__fetch_stock_info(symbol, process = PROCESS)
-            
-          if stock_info:
-            stock_symbol: str = stock_info.get('symbol')
-            stock_datas.append(stock_info)
-            logger.info(f"[stocks: {len(stock_datas)}] [{stock_symbol} | {stock_info.get('longName')}]")
-          else: failed_symbols.append(symbol)
-          
-        retry_count += 1
-        if failed_symbols:
-          logger.info(f'[ RETRY MECHANISM ] Waiting {exponential_backoff} seconds before next retry...')
-          sleep(exponential_backoff)
-          exponential_backoff += self.SCRAPER_EXPONENTIAL_RETRY
+        return step in ('VALIDATION_STEP', 'NOT_FOUND')
 
+      # Retry queue with per-symbol exponential back-off
+      # to prevent scraping failure (first pass and retries share the workers)
+      failed_symbols: List[str] = RetryQueue(rate_limiter = self.rate_limiter) \
+        .run(symbols = self.get_stocks_symbol(), task = fetch)
+
+      self.rate_limiter.log_metrics('infographic')
       if failed_symbols:
-        logger.warning(f"Symbols failed after {max_retries} retries: {failed_symbols}")
+        logger.warning(f"Symbols failed after {self.SCRAPER_MAXIMUM_RETRY} retries: {failed_symbols}")
         return None
       
       return stock_datas
@@ -249,6 +241,43 @@ class InfographicScraper(ScraperRules, LocationRules):
       return None
 
 
+  """
+    [ name ]:
+      __get_stocks_data_asyncio (return dtype: Optional[Dict[str, Any]])
+
+    [ description ]
+      Get Stocks Data (Asyncio Process, see AsyncEngine)
+  """
+  def __get_stocks_data_asyncio(self) -> Optional[Dict[str, Any]]:
+    try:
+      stock_datas:    List[Dict[str, Any]] = []
+      failed_symbols: List[str] = []
+      stock_infos: Dict[str, Optional[Dict[str, Any]]] = \
+        self.engine.get_infos(self.get_stocks_symbol())
+
+      for stock_symbol, stock_info in stock_infos.items():
+        # no stock info: failed after the engine retries (or not found)
+        if not stock_info:
+          failed_symbols.append(stock_symbol)
+          logger.warning(f'[ FAILED SYMBOL ] Append "{stock_symbol}" to LIST -> failed_symbols: List[str]')
+
+        elif self.__is_valid_stock(stock_info):
+          stock_datas.append(stock_info)
+          logger.info(f"[stocks: {len(stock_datas)}] [{stock_symbol} | {stock_info.get('longName')}]")
+
+      if failed_symbols:
+        logger.warning(
+          f"[ PARTIAL INFOGRAPHIC ] {len(failed_symbols)} of {len(stock_infos)} " +
+          f"symbols failed after {self.SCRAPER_MAXIMUM_RETRY} retries: {failed_symbols}"
+        )
+
+      return stock_datas
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
+
+
   """
     [ name ]:
       get_stocks_infographic (return dtype: Optional[DataFrame])
@@ -261,7 +290,7 @@ class InfographicScraper(ScraperRules, LocationRules):
   """
   def get_stocks_infographic(
     self, generate_new_data: bool = False,
-    get_stocks_process:      str  = 'SYNC' # SYNC, ASYNC
+    get_stocks_process:      str  = 'SYNC' # SYNC, ASYNC, ASYNCIO
   ) -> Optional[DataFrame]:
     try:
       sector_translation = {
@@ -293,9 +322,12 @@ class InfographicScraper(ScraperRules, LocationRules):
       }
 
       if not file_is_exists(self.DATASET_INFOGRAPHIC_CSV_PATH) or generate_new_data:
-        stocks_data: Optional[Dict[str, Any]] = \
-          self.__get_stocks_data_async() if get_stocks_process is 'ASYNC' \
-            else self.__get_stocks_data_sync()
+        if get_stocks_process == 'ASYNCIO':
+          stocks_data: Optional[Dict[str, Any]] = self.__get_stocks_data_asyncio()
+        elif get_stocks_process == 'ASYNC':
+          stocks_data: Optional[Dict[str, Any]] = self.__get_stocks_data_async()
+        else:
+          stocks_data: Optional[Dict[str, Any]] = self.__get_stocks_data_sync()
 
         indonesia_stocks_dataframe: DataFrame = DataFrame(stocks_data)
         indonesia_stocks_dataframe['sector_id'] = \
@@ -0,0 +1,211 @@
+from random import uniform
+from threading import Lock
+from time import sleep, monotonic
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+from settings.logging_rules import logger
+from settings.scraper_rules import ScraperRules
+
+
+"""
+
+  -- Rate Limiter --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class RateLimiter(ScraperRules):
+  # one limiter shared by every scraper (and thread) of the process
+  __SHARED: Optional['RateLimiter'] = None
+  __SHARED_LOCK: Lock = Lock()
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - rate  (dtype: Optional[float], default: SCRAPER_RATE_LIMIT, requests per second)
+      - burst (dtype: Optional[int],   default: SCRAPER_RATE_BURST)
+
+    [ description ]:
+      Thread-safe token bucket with burst. The rate adapts: it is cut on
+      HTTP 429 (and paused for Retry-After) and recovers on success
+  """
+  def __init__(self, rate: Optional[float] = None, burst: Optional[int] = None) -> None:
+    self.maximum_rate:  float = float(rate or self.SCRAPER_RATE_LIMIT)
+    self.rate:          float = self.maximum_rate
+    self.capacity:      float = float(max(burst or self.SCRAPER_RATE_BURST, 1))
+    self.tokens:        float = self.capacity
+    self.updated:       float = monotonic()
+    self.blocked_until: float = 0.0
+
+    self.__lock: Lock = Lock()
+    self.__metrics: Dict[str, float] = {
+      'requests':     0,
+      'waits':        0,
+      'wait_seconds': 0.0,
+      'work_seconds': 0.0,
+      'rate_limited': 0
+    }
+
+
+  """
+    [ name ]:
+      shared (return dtype: RateLimiter)
+
+    [ description ]:
+      The process-wide limiter used by HistoricalScraper and InfographicScraper
+  """
+  @classmethod
+  def shared(cls) -> 'RateLimiter':
+    with cls.__SHARED_LOCK:
+      if cls.__SHARED is None: cls.__SHARED = cls()
+      return cls.__SHARED
+
+
+  """
+    [ name ]:
+      acquire (return dtype: float)
+
+    [ description ]:
+      Block until one token is available and take it.
+      Returns the seconds spent waiting
+  """
+  def acquire(self) -> float:
+    waited: float = 0.0
+
+    while True:
+      with self.__lock:
+        now: float = monotonic()
+        self.tokens  = min(self.capacity, self.tokens + ((now - self.updated) * self.rate))
+        self.updated = now
+
+        delay: float = max(0.0, self.blocked_until - now)
+        if (delay == 0.0) and (self.tokens >= 1):
+          self.tokens -= 1
+          self.__metrics['requests'] += 1
+          if waited > 0:
+            self.__metrics['waits']        += 1
+            self.__metrics['wait_seconds'] += waited
+          return waited
+
+        if delay == 0.0: delay = (1 - self.tokens) / self.rate
+
+      sleep(delay)
+      waited += delay
+
+
+  """
+    [ name ]:
+      request (return dtype: Iterator[None])
+
+    [ description ]:
+      Context manager around one request: takes a token, then measures
+      the time spent on the request itself (work)
+  """
+  @contextmanager
+  def request(self) -> Iterator[None]:
+    self.acquire()
+    started: float = monotonic()
+    try:
+      yield
+
+    finally:
+      with self.__lock:
+        self.__metrics['work_seconds'] += monotonic() - started
+
+
+  """
+    [ name ]:
+      penalize (return dtype: None)
+
+    [ parameters ]:
+      - retry_after (dtype: Optional[float], Retry-After header in seconds)
+
+    [ description ]:
+      HTTP 429: multiplicative decrease of the rate, and no request before
+      Retry-After (or SCRAPER_BACKOFF_BASE seconds without the header)
+  """
+  def penalize(self, retry_after: Optional[float] = None) -> None:
+    with self.__lock:
+      pause: float = float(retry_after) if retry_after is not None else float(self.SCRAPER_BACKOFF_BASE)
+
+      self.rate = max(self.SCRAPER_RATE_MINIMUM, self.rate * self.SCRAPER_RATE_DECREASE)
+      self.tokens = 0.0
+      self.blocked_until = max(self.blocked_until, monotonic() + pause)
+      self.__metrics['rate_limited'] += 1
+
+    logger.warning(f'[ RATE LIMITED ] pause {pause:.1f} seconds, rate -> {self.rate:.2f} requests/second')
+
+
+  """
+    [ name ]:
+      reward (return dtype: None)
+
+    [ description ]:
+      Successful request: additive increase of the rate (up to the maximum)
+  """
+  def reward(self) -> None:
+    with self.__lock:
+      self.rate = min(self.maximum_rate, self.rate + self.SCRAPER_RATE_INCREASE)
+
+
+  """
+    [ name ]:
+      backoff (return dtype: float)
+
+    [ parameters ]:
+      - retry_count (dtype: int)
+
+    [ description ]:
+      Exponential back-off with "equal jitter" (half fixed, half random),
+      so symbols failing together do not retry together
+  """
+  def backoff(self, retry_count: int) -> float:
+    exponential_backoff: float = min(
+      float(self.SCRAPER_BACKOFF_MAXIMUM),
+      self.SCRAPER_BACKOFF_BASE * (2 ** max(retry_count, 0))
+    )
+    return exponential_backoff * uniform(0.5, 1.0)
+
+
+  """
+    [ name ]:
+      get_metrics (return dtype: Dict[str, float])
+
+    [ description ]:
+      Waits versus work: request count, waits, seconds spent waiting for a
+      token, seconds spent on requests, 429 count and the current rate
+  """
+  def get_metrics(self) -> Dict[str, float]:
+    with self.__lock:
+      metrics: Dict[str, float] = dict(self.__metrics)
+      metrics['rate'] = self.rate
+
+    total_seconds: float = metrics['wait_seconds'] + metrics['work_seconds']
+    metrics['wait_ratio'] = (metrics['wait_seconds'] / total_seconds) if total_seconds else 0.0
+    return metrics
+
+
+  """
+    [ name ]:
+      log_metrics (return dtype: None)
+
+    [ parameters ]:
+      - label (dtype: str)
+  """
+  def log_metrics(self, label: str) -> None:
+    metrics: Dict[str, float] = self.get_metrics()
+    logger.info(
+      f"[ RATE LIMITER ] [{label}] requests: {metrics['requests']}, " +
+      f"waits: {metrics['waits']} ({metrics['wait_seconds']:.1f}s), " +
+      f"work: {metrics['work_seconds']:.1f}s, wait ratio: {metrics['wait_ratio']:.2f}, " +
+      f"429: {metrics['rate_limited']}, rate: {metrics['rate']:.2f}/s"
+    )
@@ -0,0 +1,122 @@
+from time import sleep, monotonic
+from heapq import heapify, heappush, heappop
+from typing import List, Dict, Tuple, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+
+from settings.logging_rules import logger
+from settings.scraper_rules import ScraperRules
+from stock_scraping.rate_limiter import RateLimiter
+
+
+"""
+
+  -- Retry Queue --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class RetryQueue(ScraperRules):
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - rate_limiter (dtype: Optional[RateLimiter], default: RateLimiter.shared())
+      - max_workers  (dtype: Optional[int],         default: SCRAPER_THREAD_WORKER)
+      - attempts     (dtype: Optional[int],         default: 1 + SCRAPER_MAXIMUM_RETRY)
+
+    [ description ]:
+      Retry scheduler: a priority queue keyed by the next eligible time,
+      drained by one worker pool. Every symbol has its own jittered
+      exponential back-off and attempt budget, so a slow symbol does not
+      hold back the others
+  """
+  def __init__(
+    self,
+    rate_limiter: Optional[RateLimiter] = None,
+    max_workers:  Optional[int] = None,
+    attempts:     Optional[int] = None
+  ) -> None:
+    self.rate_limiter: RateLimiter = rate_limiter or RateLimiter.shared()
+    self.max_workers:  int = max(1, max_workers or self.SCRAPER_THREAD_WORKER)
+    self.attempts:     int = max(1, attempts or (1 + self.SCRAPER_MAXIMUM_RETRY))
+
+
+  """
+    [ name ]:
+      run (return dtype: List[str])
+
+    [ parameters ]:
+      - symbols       (dtype: List[str])
+      - task          (dtype: Callable[[str], bool], True when the symbol is finished)
+      - first_attempt (dtype: int, default: 0, attempts already spent on the symbols)
+
+    [ description ]:
+      Run the task for every symbol, re-queue the unfinished ones after their
+      back-off, until the attempt budget is spent. Returns the failed symbols
+  """
+  def run(
+    self,
+    symbols:       List[str],
+    task:          Callable[[str], bool],
+    first_attempt: int = 0
+  ) -> List[str]:
+    failed_symbols: List[str] = []
+
+    now: float = monotonic()
+    queue: List[Tuple[float, int, str, int]] = [
+      (
+        now + (self.rate_limiter.backoff(first_attempt - 1) if first_attempt > 0 else 0.0),
+        sequence, symbol, first_attempt
+      ) for sequence, symbol in enumerate(symbols)
+    ]
+    heapify(queue)
+    sequence: int = len(queue)
+
+    running: Dict[Future, Tuple[str, int]] = {}
+    with ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+      while queue or running:
+        now = monotonic()
+        while queue and (queue[0][0] <= now) and (len(running) < self.max_workers):
+          _, _, symbol, attempt = heappop(queue)
+          running[executor.submit(task, symbol)] = (symbol, attempt)
+
+        timeout: Optional[float] = max(0.0, queue[0][0] - now) \
+          if queue and (len(running) < self.max_workers) else None
+
+        if not running:
+          sleep(timeout or 0.0)
+          continue
+
+        done, _ = wait(running, timeout = timeout, return_when = FIRST_COMPLETED)
+        for future in done:
+          symbol, attempt = running.pop(future)
+          try:
+            is_finished: bool = future.result()
+
+          except Exception as error_message:
+            logger.error(f'{error_message} {symbol}')
+            is_finished: bool = False
+
+          if is_finished: continue
+
+          attempt += 1
+          if attempt >= self.attempts:
+            failed_symbols.append(symbol)
+            logger.warning(f'[ RETRY QUEUE ] "{symbol}" failed after {attempt} attempts')
+            continue
+
+          exponential_backoff: float = self.rate_limiter.backoff(attempt - 1)
+          heappush(queue, (monotonic() + exponential_backoff, sequence, symbol, attempt))
+          sequence += 1
+          logger.warning(
+            f'[ RETRY QUEUE ] "{symbol}" attempt {attempt + 1}/{self.attempts} ' +
+            f'in {exponential_backoff:.1f} seconds'
+          )
+
+    return failed_symbols
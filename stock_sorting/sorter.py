@@ -1,7 +1,8 @@
 import re
-from json import dump
-from typing import List, Dict
-from pandas import DataFrame, isna
+import numpy as np
+from json import load
+from typing import Any, List, Dict, Tuple, Optional
+from pandas import Series, DataFrame
 
 from os import makedirs
 from os.path import exists as file_is_exists
@@ -9,7 +10,10 @@ from os.path import exists as file_is_exists
 from settings.logging_rules import logger
 from settings.location_rules import LocationRules
 
-from stock_report.pdf_report import PdfReport
+from stock_report.report_queue import ReportQueue
+from stock_report.artefact_cache import ArtefactCache
+from stock_storage.table_storage import TableStorage
+from stock_storage.json_writer import JsonWriter
 
 from warnings import filterwarnings
 filterwarnings("ignore")
@@ -28,6 +32,88 @@ filterwarnings("ignore")
 
 
 class Sorter(LocationRules):
+  # fundamental fields of the fundamentals JSON -> suffix of the value
+  FUNDAMENTAL_FIELDS: Dict[str, str] = {
+    'marketCap':           '',
+    'dividendRate':        '',
+    'dividendYield':       ' %',
+    'earningsGrowth':      ' %',
+    'profitMargins':       ' %',
+    'grossMargins':        ' %',
+    'beta':                '',
+    'bookValue':           '',
+    'priceToBook':         '',
+    'quickRatio':          '',
+    'currentRatio':        '',
+    'debtToEquity':        '',
+    'revenuePerShare':     '',
+    'revenueGrowth':       ' %',
+    'ebitda':              '',
+    'regularMarketChange': '',
+    'payoutRatio':         ' %',
+    'trailingPE':          '',
+    'forwardPE':           '',
+    'trailingEps':         '',
+    'forwardEps':          ''
+  }
+
+  # integers above it lose precision as float64 sort keys (2 ** 53)
+  SORT_KEY_MAX_INTEGER: int = 2 ** 53
+
+  # fields of the infographic JSON (top 50 stocks)
+  INFOGRAPHIC_FIELDS: List[str] = [
+    'fontawesome_icon', 'symbol', 'sector_id',
+    'shortName', 'beta', 'dividendYield'
+  ]
+
+  # fundamental labels (fundamental PDF report)
+  FUNDAMENTAL_LABELS: Dict[str, str] = {
+    'shortName':            'Nama Emiten (Issuer Name)', 
+    'symbol':               'Simbol (Symbol)', 
+    'sector_id':            'Sektor (Sector)', 
+    'address':              'Alamat (Address)', 
+    'phone':                'Nomor Telepon (Phone Number)', 
+    'website':              'Situs Web (Website)', 
+    'marketCap':            'Kapitalisasi Pasar (Market Cap)', 
+    'dividendRate':         'Tingkat Dividen (Dividend Rate)', 
+    'dividendYield':        'Hasil Dividen (Dividend Yield)', 
+    'earningsGrowth':       'Pertumbuhan Laba (Earnings Growth)',
+    'profitMargins':        'Margin Laba (Profit Margins)', 
+    'grossMargins':         'Margin Kotor (Gross Margins)', 
+    'beta':                 'Beta', 
+    'bookValue':            'Nilai Buku (Book Value)', 
+    'priceToBook':          'Rasio Harga terhadap Nilai Buku (Price To Book)', 
+    'quickRatio':           'Rasio Cepat (Quick Ratio)', 
+    'currentRatio':         'Rasio Saat Ini (Current Ratio)', 
+    'debtToEquity':         'Rasio Utang terhadap Ekuitas (Debt To Equity)', 
+    'revenuePerShare':      'Pendapatan per Saham (Revenue Per Share)', 
+    'revenueGrowth':        'Pertumbuhan Pendapatan (Revenue Growth)', 
+    'ebitda':               'Ebitda', 
+    'regularMarketChange':  'Perubahan Harga di Pasar Reguler (Regular Market Change)', 
+    'payoutRatio':          'Rasio Pembayaran Dividen (Payout Ratio)',
+    'trailingPE':           'Rasio P/E Historis (Trailing P/E)', 
+    'forwardPE':            'Rasio P/E Proyeksi (Forward P/E)', 
+    'trailingEps':          'EPS Historis (Trailing EPS)', 
+    'forwardEps':           'EPS Proyeksi (Forward EPS)'
+  }
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - storage (dtype: Optional[TableStorage], default: TableStorage())
+
+    [ description ]:
+      The ranking table is written through the storage backend,
+      the JSON outputs through the JSON writer
+  """
+  def __init__(self, storage: Optional[TableStorage] = None) -> None:
+    self.storage: TableStorage = storage or TableStorage()
+    self.json_writer: JsonWriter = JsonWriter()
+
+
   """ 
     [ name ]:
       __dataframe_imputation (return dtype: DataFrame)
@@ -65,6 +151,102 @@ class Sorter(LocationRules):
       return "+62{}".format(digits)
 
 
+  """ 
+    [ name ]:
+      __sort_keys (return dtype: Optional[List[np.ndarray]])
+
+    [ parameters ]:
+      - dataframe     (dtype: DataFrame)
+      - columns       (dtype: List[str])
+      - is_ascendings (dtype: List[bool])
+      - key_cache     (dtype: Optional[Dict[Tuple[str, bool], Optional[np.ndarray]]],
+                       keys encoded by earlier rankings of the same frame)
+
+    [ description ]:
+      Sort keys as float64 arrays ordered ascending (descending columns
+      negated), None when a column is not numeric, has NaN (placed last
+      by sort_values either way) or has integers beyond float64 precision
+  """
+  def __sort_keys(
+    self, dataframe: DataFrame,
+    columns:         List[str],
+    is_ascendings:   List[bool],
+    key_cache:       Optional[Dict[Tuple[str, bool], Optional[np.ndarray]]] = None
+  ) -> Optional[List[np.ndarray]]:
+    if key_cache is None: key_cache = {}
+
+    sort_keys: List[np.ndarray] = []
+    for column, is_ascending in zip(columns, is_ascendings):
+      if (column, is_ascending) not in key_cache:
+        key_cache[(column, is_ascending)] = self.__sort_key(dataframe[column], is_ascending)
+
+      sort_key: Optional[np.ndarray] = key_cache[(column, is_ascending)]
+      if sort_key is None: return None
+      sort_keys.append(sort_key)
+
+    return sort_keys
+
+
+  """ 
+    [ name ]:
+      __sort_key (return dtype: Optional[np.ndarray])
+
+    [ parameters ]:
+      - values       (dtype: Series)
+      - is_ascending (dtype: bool)
+  """
+  def __sort_key(self, values: Series, is_ascending: bool) -> Optional[np.ndarray]:
+    values: np.ndarray = values.to_numpy()
+    if values.dtype.kind not in 'biuf': return None
+
+    if (values.dtype.kind in 'iu') and len(values) and (
+      (values.max() > self.SORT_KEY_MAX_INTEGER) or
+      (values.min() < -self.SORT_KEY_MAX_INTEGER)
+    ): return None
+
+    values = values.astype(np.float64)
+    if np.isnan(values).any(): return None
+
+    return values if is_ascending else -values
+
+
+  """ 
+    [ name ]:
+      __top_positions (return dtype: np.ndarray)
+
+    [ parameters ]:
+      - sort_keys (dtype: List[np.ndarray], from __sort_keys)
+      - number    (dtype: int, 0 < number < rows)
+      - from_head (dtype: bool, head (True) or tail (False) of the order)
+
+    [ description ]:
+      Row positions of the first / last "number" rows of the stable
+      multi-key order, without sorting every row: the primary key is
+      partitioned around its number-th value, every row tied with it is
+      kept (tie expansion) and only these candidates are lexsorted
+  """
+  def __top_positions(
+    self, sort_keys: List[np.ndarray],
+    number:          int,
+    from_head:       bool
+  ) -> np.ndarray:
+    primary_key: np.ndarray = sort_keys[0]
+
+    if from_head:
+      threshold: float = np.partition(primary_key, number - 1)[number - 1]
+      candidates: np.ndarray = np.flatnonzero(primary_key <= threshold)
+    else:
+      threshold: float = np.partition(primary_key, len(primary_key) - number)[len(primary_key) - number]
+      candidates: np.ndarray = np.flatnonzero(primary_key >= threshold)
+
+    # lexsort is stable and the candidates keep the row order, ties
+    # are ordered as sort_values orders them
+    candidate_order: np.ndarray = candidates[
+      np.lexsort([sort_key[candidates] for sort_key in sort_keys[::-1]])
+    ]
+    return candidate_order[:number] if from_head else candidate_order[-number:]
+
+
   """ 
     [ name ]:
       __data_rangking (return dtype: DataFrame)
@@ -74,17 +256,33 @@ class Sorter(LocationRules):
       - ranking        (dtype: Dict[str, str or int])
       - columns        (dtype: List[str])
       - is_ascendings  (dtype: List[bool])
+      - key_cache      (dtype: Optional[Dict[Tuple[str, bool], Optional[np.ndarray]]])
 
     [ description ]:
-      DataFrame Rangking
+      DataFrame Rangking. The top N of a multi-column ranking is selected
+      by partial sort (__top_positions), the same rows in the same order
+      as sort_values(...).head(N) / .tail(N); a single column (quicksort,
+      not stable), non-numeric keys or NaN use the full sort
   """
   def __data_rangking(
     self, dataframe: DataFrame,
     ranking:       Dict[str, str or int],
     columns:       List[str],
-    is_ascendings: List[bool]
+    is_ascendings: List[bool],
+    key_cache:     Optional[Dict[Tuple[str, bool], Optional[np.ndarray]]] = None
   ) -> DataFrame:
     try:
+      number: int = ranking.get('number')
+      from_head: bool = ranking.get('ranking_by') != 'TAIL_RANK'
+
+      if (len(columns) > 1) and (len(columns) == len(is_ascendings)) and \
+        isinstance(number, (int, np.integer)) and (0 < number < len(dataframe)):
+        sort_keys: Optional[List[np.ndarray]] = \
+          self.__sort_keys(dataframe, columns, is_ascendings, key_cache)
+
+        if sort_keys is not None:
+          return dataframe.iloc[self.__top_positions(sort_keys, number, from_head)]
+
       if ranking.get('ranking_by') == 'HEAD_RANK':
         ranking_stocks: DataFrame = dataframe.sort_values(
           by        = columns,
@@ -110,16 +308,111 @@ class Sorter(LocationRules):
       return dataframe
 
   
+  """ 
+    [ name ]:
+      __format_column (return dtype: List[Any])
+
+    [ parameters ]:
+      - infographic (dtype: DataFrame)
+      - column      (dtype: str)
+      - missing     (dtype: Any, value of the NaN cells)
+      - suffix      (dtype: str, default: '')
+
+    [ description ]:
+      Values of a column as the former per-row formatting wrote them:
+      the cell as text (str of the python value, like iterrows rows)
+      followed by the suffix, "missing" for NaN cells
+  """
+  def __format_column(
+    self, infographic: DataFrame,
+    column:            str,
+    missing:           Any,
+    suffix:            str = ''
+  ) -> List[Any]:
+    values: Series = infographic[column].astype(object)
+    return [
+      missing if is_missing else f'{value}{suffix}'
+        for value, is_missing in zip(values.tolist(), values.isna().tolist())
+    ]
+
+
+  """ 
+    [ name ]:
+      __fundamental_columns (return dtype: Dict[str, List[Any]])
+
+    [ parameters ]:
+      - infographic (dtype: DataFrame)
+
+    [ description ]:
+      JSON fields of every issuer, formatted column by column
+      (keys in the order of the fundamentals JSON)
+  """
+  def __fundamental_columns(self, infographic: DataFrame) -> Dict[str, List[Any]]:
+    raw_values: Dict[str, List[Any]] = {
+      column: infographic[column].astype(object).tolist()
+        for column in [
+          'fontawesome_icon', 'symbol', 'sector_id', 'shortName',
+          'address1', 'address2', 'city', 'zip'
+        ]
+    }
+
+    return {
+      # header data
+      'fontawesome_icon': raw_values['fontawesome_icon'],
+      'symbol':    [symbol[:len(symbol) - 3] for symbol in raw_values['symbol']],
+      'sector_id': raw_values['sector_id'],
+      'shortName': raw_values['shortName'],
+
+      # issuer data
+      'address': [
+        f'{address1}; {address2}; {city}; {zip_code}'
+          for address1, address2, city, zip_code in zip(
+            raw_values['address1'], raw_values['address2'],
+            raw_values['city'], raw_values['zip']
+          )
+      ],
+      'phone': [
+        'Tidak Ada' if is_missing else self.__format_phone(phone)
+          for phone, is_missing in zip(
+            infographic['phone'].astype(object).tolist(),
+            infographic['phone'].isna().tolist()
+          )
+      ],
+      'website': self.__format_column(infographic, 'website', 'Tidak Ada'),
+
+      # fundamental data
+      **{
+        field_name: self.__format_column(infographic, field_name, f'0.0{suffix}', suffix)
+          for field_name, suffix in self.FUNDAMENTAL_FIELDS.items()
+      }
+    }
+
+
+  """ 
+    [ name ]:
+      __column_records (return dtype: List[Dict[str, Any]])
+
+    [ parameters ]:
+      - columns (dtype: Dict[str, List[Any]], same length)
+  """
+  def __column_records(self, columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    return [dict(zip(columns.keys(), row)) for row in zip(*columns.values())]
+
+
   """ 
     [ name ]:
       by_default_infographic (return dtype: bool)
 
     [ parameters ]:
-      - infographic   (dtype: DataFrame)
-      - ranking       (dtype: Dict[str, str or int])
+      - infographic        (dtype: DataFrame)
+      - ranking            (dtype: Dict[str, str or int])
+      - generate_artefacts (dtype: bool, default: True)
 
     [ description ]:
-      Sorting By Default Infographic
+      Sorting By Default Infographic. The ranking table is written here,
+      the JSON / PDF artefacts by generate_artefacts: called inline, or
+      skipped (generate_artefacts = False) for a ranking-only run and
+      generated later on the returned ranking, as a separate stage
   """
   def by_default_infographic(
     self, infographic: DataFrame,
@@ -127,7 +420,8 @@ class Sorter(LocationRules):
       {
         'ranking_by': 'HEAD_RANK', #Option: HEAD_RANK, TAIL_RANK
         'number'    : 50
-      }
+      },
+    generate_artefacts: bool = True
   ) -> bool:
     try:
       required_columns: List[str] = [
@@ -169,134 +463,83 @@ class Sorter(LocationRules):
         is_ascendings = is_ascendings
       )
 
-      # generate csv file
-      infographic.to_csv(
-        index       = False,
-        path_or_buf = self.DATASET_RANKING_CSV_PATH
-      )
+      # generate ranking table
+      self.storage.write(self.DATASET_RANKING_CSV_PATH, infographic, index = False)
 
+      if generate_artefacts and (self.generate_artefacts(infographic) is False):
+        return False
+
+      return infographic
+    
+    except Exception as error_message:
+      logger.error(error_message)
+      return False
+
+
+  """ 
+    [ name ]:
+      generate_artefacts (return dtype: bool)
+
+    [ parameters ]:
+      - infographic (dtype: DataFrame, ranking of by_default_infographic)
+
+    [ description ]:
+      Artefacts of a ranking: infographic JSON (top 50 stocks), issuers
+      PDF, sectors JSON, fundamentals JSON and PDF of every issuer
+      (the indicator stage reads the short names of the fundamentals JSON)
+  """
+  def generate_artefacts(self, infographic: DataFrame) -> bool:
+    try:
+      # column-wise JSON fields of every issuer (one pass over the columns)
+      fundamental_columns: Dict[str, List[Any]] = self.__fundamental_columns(infographic)
 
       # infographic information
-      infographic_json: list[dict[str, str]] = [
-        {
-          "fontawesome_icon": row["fontawesome_icon"],
-          "symbol":           row["symbol"][:len(row["symbol"]) - 3], 
-          "sector_id":        row["sector_id"],
-          "shortName":        row["shortName"],
-          "beta":             '0.0' if isna(row["beta"]) else str(row["beta"]),
-          "dividendYield":    '0.0 %' if isna(row["dividendYield"]) else f'{row["dividendYield"]} %'
-        }
-        for _, row in infographic.iterrows()
-      ]      
-
-      with open(self.DATASET_RANKING_JSON_PATH, "w") as infographic_json_value:
-        dump({'infographics': infographic_json}, infographic_json_value)
+      infographic_json: List[Dict[str, Any]] = self.__column_records({
+        field_name: fundamental_columns[field_name]
+          for field_name in self.INFOGRAPHIC_FIELDS
+      })
+      self.json_writer.write(self.DATASET_RANKING_JSON_PATH, {'infographics': infographic_json})
       
 
       # generate reports
-      pdf_report: PdfReport = PdfReport()
+      report_queue: ReportQueue = ReportQueue.shared()
       logger.info(f'[ PROCESSED ] [ ISSUERS ] [ PDF REPORT ] Generate Report...')
-      pdf_report.generate_report_issuers(issuers = infographic_json)
-      logger.info(f'[ SUCCESS ] [ ISSUERS ] [ PDF REPORT ] Generate Report Success...')
+      report_queue.submit('generate_report_issuers', 'emiten_saham.pdf', issuers = infographic_json)
 
 
       # sectors information
       sectors_json = list(infographic['sector_id'].unique())
-      with open(self.DATASET_SECTOR_JSON_PATH, "w") as sectors_json_value:
-        dump({'sectors': sectors_json}, sectors_json_value)
-        logger.info(f'[ SAVED ] [ SECTORS ] Generate Data Saved on "{self.DATASET_SECTOR_JSON_PATH}"...')
+      self.json_writer.write(self.DATASET_SECTOR_JSON_PATH, {'sectors': sectors_json})
+      logger.info(f'[ SAVED ] [ SECTORS ] Generate Data Saved on "{self.DATASET_SECTOR_JSON_PATH}"...')
 
-      # fundamental information
+      # fundamental information (JSON skipped when unchanged, artefact manifest)
       if not file_is_exists(self.DATASET_FUNDAMENTAL_JSON_PATH):
         makedirs(self.DATASET_FUNDAMENTAL_JSON_PATH)
 
-      for _, row in infographic.iterrows():
-        issuer_symbol: str = row['symbol'][:len(row['symbol']) - 3]
-        logger.info(f'[ PROCESSED ] [ FUNDAMENTAL ] [ {issuer_symbol} ] Generate Data...')
-        fundamentals_json: dict[str, str] = {
-          # header data
-          "fontawesome_icon": row["fontawesome_icon"],
-          'symbol':       issuer_symbol,
-          'sector_id':    row['sector_id'],
-          'shortName':    row['shortName'],
-
-          # issuer data
-          'address':      f'{row["address1"]}; {row["address2"]}; {row["city"]}; {row["zip"]}',
-          'phone':        'Tidak Ada' if isna(row["phone"]) else self.__format_phone(row["phone"]),
-          'website':      'Tidak Ada' if isna(row["website"]) else str(row["website"]),
-
-          # fundamental data
-          'marketCap':           '0.0' if isna(row["marketCap"]) else str(row["marketCap"]),
-          'dividendRate':        '0.0' if isna(row["dividendRate"]) else str(row["dividendRate"]),
-          'dividendYield':       '0.0 %' if isna(row["dividendYield"]) else f'{row["dividendYield"]} %',
-          'earningsGrowth':      '0.0 %' if isna(row["earningsGrowth"]) else f'{row["earningsGrowth"]} %',
-          'profitMargins':       '0.0 %' if isna(row["profitMargins"]) else f'{row["profitMargins"]} %',
-          'grossMargins':        '0.0 %' if isna(row["grossMargins"]) else f'{row["grossMargins"]} %',
-          'beta':                '0.0' if isna(row["beta"]) else str(row["beta"]),
-          'bookValue':           '0.0' if isna(row["bookValue"]) else str(row["bookValue"]),
-          'priceToBook':         '0.0' if isna(row["priceToBook"]) else str(row["priceToBook"]),
-          'quickRatio':          '0.0' if isna(row["quickRatio"]) else str(row["quickRatio"]),
-          'currentRatio':        '0.0' if isna(row["currentRatio"]) else str(row["currentRatio"]),
-          'debtToEquity':        '0.0' if isna(row["debtToEquity"]) else str(row["debtToEquity"]),
-          'revenuePerShare':     '0.0' if isna(row["revenuePerShare"]) else str(row["revenuePerShare"]),
-          'revenueGrowth':       '0.0 %' if isna(row["revenueGrowth"]) else f'{row["revenueGrowth"]} %',
-          'ebitda':              '0.0' if isna(row["ebitda"]) else str(row["ebitda"]),
-          'regularMarketChange': '0.0' if isna(row["regularMarketChange"]) else str(row["regularMarketChange"]),
-          'payoutRatio':         '0.0 %' if isna(row["payoutRatio"]) else f'{row["payoutRatio"]} %',
-          'trailingPE':          '0.0' if isna(row["trailingPE"]) else str(row["trailingPE"]),
-          'forwardPE':           '0.0' if isna(row["forwardPE"]) else str(row["forwardPE"]),
-          'trailingEps':         '0.0' if isna(row["trailingEps"]) else str(row["trailingEps"]),
-          'forwardEps':          '0.0' if isna(row["forwardEps"]) else str(row["forwardEps"])
-        }
-
-        logger.info(f'[ SUCCESS ] [ FUNDAMENTAL ] [ {issuer_symbol} ] Generate Data Success...')
+      logger.info(f'[ PROCESSED ] [ FUNDAMENTAL ] [ {len(infographic)} ISSUERS ] Generate Data...')
+      fundamentals_json: List[Dict[str, Any]] = self.__column_records(fundamental_columns)
+      logger.info(f'[ SUCCESS ] [ FUNDAMENTAL ] [ {len(infographic)} ISSUERS ] Generate Data Success...')
+
+      artefact_cache: ArtefactCache = ArtefactCache.shared()
+
+      for fundamental_json in fundamentals_json:
+        issuer_symbol: str = fundamental_json['symbol']
 
         fundamentals_json_path: str = f'{self.DATASET_FUNDAMENTAL_JSON_PATH}/{issuer_symbol}.json'
-        with open(fundamentals_json_path, 'w') as fundamentals_json_value:
-          dump({'fundamentals': fundamentals_json}, fundamentals_json_value)
+        if artefact_cache.write_json(fundamentals_json_path, {'fundamentals': fundamental_json}):
           logger.info(f'[ SAVED ] [ FUNDAMENTAL ] [ {issuer_symbol} ] Generate Data Saved on "{fundamentals_json_path}"...')
 
-        # fundamental labels
-        fundamental_labels: List[str] = {
-          'shortName':            'Nama Emiten (Issuer Name)', 
-          'symbol':               'Simbol (Symbol)', 
-          'sector_id':            'Sektor (Sector)', 
-          'address':              'Alamat (Address)', 
-          'phone':                'Nomor Telepon (Phone Number)', 
-          'website':              'Situs Web (Website)', 
-          'marketCap':            'Kapitalisasi Pasar (Market Cap)', 
-          'dividendRate':         'Tingkat Dividen (Dividend Rate)', 
-          'dividendYield':        'Hasil Dividen (Dividend Yield)', 
-          'earningsGrowth':       'Pertumbuhan Laba (Earnings Growth)',
-          'profitMargins':        'Margin Laba (Profit Margins)', 
-          'grossMargins':         'Margin Kotor (Gross Margins)', 
-          'beta':                 'Beta', 
-          'bookValue':            'Nilai Buku (Book Value)', 
-          'priceToBook':          'Rasio Harga terhadap Nilai Buku (Price To Book)', 
-          'quickRatio':           'Rasio Cepat (Quick Ratio)', 
-          'currentRatio':         'Rasio Saat Ini (Current Ratio)', 
-          'debtToEquity':         'Rasio Utang terhadap Ekuitas (Debt To Equity)', 
-          'revenuePerShare':      'Pendapatan per Saham (Revenue Per Share)', 
-          'revenueGrowth':        'Pertumbuhan Pendapatan (Revenue Growth)', 
-          'ebitda':               'Ebitda', 
-          'regularMarketChange':  'Perubahan Harga di Pasar Reguler (Regular Market Change)', 
-          'payoutRatio':          'Rasio Pembayaran Dividen (Payout Ratio)',
-          'trailingPE':           'Rasio P/E Historis (Trailing P/E)', 
-          'forwardPE':            'Rasio P/E Proyeksi (Forward P/E)', 
-          'trailingEps':          'EPS Historis (Trailing EPS)', 
-          'forwardEps':           'EPS Proyeksi (Forward EPS)'
-        }
-
         logger.info(f'[ PROCESSED ] [ FUNDAMENTAL ] [ PDF REPORT ] [ {issuer_symbol} ] Generate Report...')
-        pdf_report.generate_report_fundamental(
+        report_queue.submit(
+          'generate_report_fundamental', f'fundamentals/{issuer_symbol}.pdf',
           symbol        = issuer_symbol,
-          short_name    = row['shortName'],
-          issuer_labels = fundamental_labels,
-          issuer_datas  = fundamentals_json
+          short_name    = fundamental_json['shortName'],
+          issuer_labels = self.FUNDAMENTAL_LABELS,
+          issuer_datas  = fundamental_json
         )
-        logger.info(f'[ SUCCESS ] [ FUNDAMENTAL ] [ PDF REPORT ] [ {issuer_symbol} ] Generate Report Success...')
 
-      return infographic
+      artefact_cache.save()
+      return True
     
     except Exception as error_message:
       logger.error(error_message)
@@ -352,14 +595,135 @@ class Sorter(LocationRules):
         is_ascendings = is_ascendings
       )
 
-      # Generate CSV file
-      infographic.to_csv(
-        index       = False,
-        path_or_buf = self.DATASET_RANKING_CSV_PATH
-      )
+      # Generate ranking table
+      self.storage.write(self.DATASET_RANKING_CSV_PATH, infographic, index = False)
 
       return infographic
     
     except Exception as error_message:
       logger.error(error_message)
       return False
+
+
+  """ 
+    [ name ]:
+      read_profiles (return dtype: List[Dict[str, Any]])
+
+    [ parameters ]:
+      - json_path (dtype: str, JSON list of ranking profiles)
+
+    [ description ]:
+      Ranking profiles, each like the by_custom_infographic arguments:
+      {"name", "required_columns", "is_ascendings",
+       "ranking": {"ranking_by", "number"}}
+  """
+  def read_profiles(self, json_path: str) -> List[Dict[str, Any]]:
+    try:
+      with open(json_path, 'r') as profiles_json:
+        profiles: Any = load(profiles_json)
+
+      if type(profiles).__name__ != 'list':
+        logger.error(f'the ranking profiles of "{json_path}" must be a list')
+        return []
+
+      return profiles
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {json_path}')
+      return []
+
+
+  """ 
+    [ name ]:
+      by_profiles (return dtype: Dict[str, DataFrame])
+
+    [ parameters ]:
+      - infographic (dtype: DataFrame)
+      - profiles    (dtype: List[Dict[str, Any]], see read_profiles)
+
+    [ description ]:
+      Many rankings over one frame: the columns of every profile are
+      imputed once and their sort keys encoded once (shared by the
+      profiles ranking on the same column and direction). Each profile
+      is ranked like by_custom_infographic and written in the same pass
+      to ranking_profiles/{name}.csv (ranking table) and {name}.json
+      (rank, symbol and ranked columns). Returns name -> ranking table
+  """
+  def by_profiles(
+    self, infographic: DataFrame,
+    profiles:          List[Dict[str, Any]]
+  ) -> Dict[str, DataFrame]:
+    rankings: Dict[str, DataFrame] = {}
+    try:
+      valid_profiles: List[Dict[str, Any]] = []
+      for profile in profiles:
+        name: Any = profile.get('name')
+        if (type(name).__name__ != 'str') or (not re.fullmatch(r'[\w\-]+', name)):
+          logger.error(f'the ranking profile name "{name}" must be a word (file name)')
+          continue
+
+        if type(profile.get('required_columns')).__name__ != 'list':
+          logger.error(f'[ {name} ] the "required_columns" parameter must be a list')
+          continue
+
+        if type(profile.get('is_ascendings')).__name__ != 'list':
+          logger.error(f'[ {name} ] the "is_ascendings" parameter must be a list')
+          continue
+
+        valid_profiles.append(profile)
+
+      # imputation once, for the columns of every profile
+      profile_columns: List[str] = list(dict.fromkeys(
+        column for profile in valid_profiles for column in profile['required_columns']
+      ))
+      imputed: DataFrame = self.__dataframe_imputation(
+        dataframe = infographic[[
+          column for column in profile_columns if column in infographic.columns
+        ]].copy(),
+        columns   = profile_columns
+      )
+
+      if not file_is_exists(self.DATASET_RANKING_PROFILES_PATH):
+        makedirs(self.DATASET_RANKING_PROFILES_PATH)
+
+      key_cache: Dict[Tuple[str, bool], Optional[np.ndarray]] = {}
+      for profile in valid_profiles:
+        name: str = profile['name']
+        try:
+          # the frame as by_custom_infographic imputes it, for this profile
+          profile_infographic: DataFrame = infographic.copy(deep = False)
+          for column in profile['required_columns']:
+            profile_infographic[column] = imputed[column].to_numpy()
+
+          ranking_stocks: DataFrame = self.__data_rangking(
+            dataframe     = profile_infographic,
+            ranking       = profile.get('ranking', {'ranking_by': 'HEAD_RANK', 'number': 50}),
+            columns       = profile['required_columns'],
+            is_ascendings = profile['is_ascendings'],
+            key_cache     = key_cache
+          )
+
+          profile_path: str = f'{self.DATASET_RANKING_PROFILES_PATH}/{name}'
+          self.storage.write(f'{profile_path}.csv', ranking_stocks, index = False)
+
+          self.json_writer.write_records(f'{profile_path}.json', 'rankings', {
+            'rank': np.arange(1, len(ranking_stocks) + 1),
+            **({
+              'symbol': [symbol[:len(symbol) - 3] for symbol in ranking_stocks['symbol'].tolist()]
+            } if 'symbol' in ranking_stocks.columns else {}),
+            **{
+              column: ranking_stocks[column].to_numpy()
+                for column in dict.fromkeys(profile['required_columns'])
+            }
+          })
+
+          rankings[name] = ranking_stocks
+          logger.info(f'[ SAVED ] [ RANKING PROFILE ] [ {name} ] {len(ranking_stocks)} stocks saved on "{profile_path}.csv"')
+
+        except Exception as error_message:
+          logger.error(f'{error_message} {name}')
+
+    except Exception as error_message:
+      logger.error(error_message)
+
+    return rankings
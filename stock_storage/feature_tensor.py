@@ -0,0 +1,243 @@
+import os
+import numpy as np
+from json import dump, load
+from typing import Any, List, Dict, Tuple, Optional
+from pandas import DataFrame, to_datetime
+
+from os import makedirs
+from os.path import exists as file_is_exists, splitext
+
+from settings.logging_rules import logger
+from settings.location_rules import LocationRules
+from stock_storage.table_storage import TableStorage
+
+
+"""
+
+  -- Feature Tensor --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class FeatureTensor(LocationRules):
+  # name of the whole panel tensor (symbols are upper case)
+  PANEL_NAME: str = 'panel'
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - storage (dtype: Optional[TableStorage], default: TableStorage())
+
+    [ description ]:
+      Normalized modeling features as memory-mappable float32 .npy arrays
+      (rows, columns) with a small JSON header (columns, dates, min-max),
+      per symbol or for the whole panel. The trainer opens them with
+      FeatureTensor.load and slices training windows without parsing
+  """
+  def __init__(self, storage: Optional[TableStorage] = None) -> None:
+    self.storage: TableStorage = storage or TableStorage()
+
+
+  """
+    [ name ]:
+      __read_symbol (return dtype: Optional[Tuple[DataFrame, Dict[str, Any]]])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+
+    [ description ]:
+      Modeling table and min-max stats of a symbol (None if missing)
+  """
+  def __read_symbol(self, symbol: str) -> Optional[Tuple[DataFrame, Dict[str, Any]]]:
+    try:
+      dataframe: DataFrame = self.storage.read(
+        f'{self.DATASET_MODELING_CSV_PATH}/{symbol}.csv',
+        index_col = 'Date', round_trip = True
+      )
+      if dataframe.empty: return None
+      dataframe.index = to_datetime(dataframe.index, errors = 'coerce')
+
+      min_max: Dict[str, Any] = {}
+      min_max_json_path: str = f'{self.DATASET_MINMAX_CSV_PATH}/{symbol}.json'
+      if file_is_exists(min_max_json_path):
+        with open(min_max_json_path, 'r') as min_max_json:
+          min_max = load(min_max_json)
+
+      return dataframe, min_max
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return None
+
+
+  """
+    [ name ]:
+      __write_tensor (return dtype: str)
+
+    [ parameters ]:
+      - name    (dtype: str)
+      - frames  (dtype: List[DataFrame], same columns)
+      - header  (dtype: Dict[str, Any])
+
+    [ description ]:
+      Write the frames one after the other into one float32 .npy array
+      (memory-mapped, no float64 copy of the whole panel) and its JSON
+      header (temporary files, then atomic replace)
+  """
+  def __write_tensor(self, name: str, frames: List[DataFrame], header: Dict[str, Any]) -> str:
+    tensor_path: str = f'{self.DATASET_MODELING_TENSOR_PATH}/{name}.npy'
+    header_path: str = f'{self.DATASET_MODELING_TENSOR_PATH}/{name}.json'
+    temporary_path: str = f'{tensor_path}.{os.getpid()}.tmp'
+
+    shape: Tuple[int, int] = (sum(len(frame) for frame in frames), len(header['columns']))
+    tensor: np.memmap = np.lib.format.open_memmap(
+      temporary_path, mode = 'w+', dtype = np.float32, shape = shape
+    )
+
+    row: int = 0
+    for frame in frames:
+      tensor[row:row + len(frame)] = frame.to_numpy(dtype = np.float32)
+      row += len(frame)
+
+    tensor.flush()
+    del tensor
+    os.replace(temporary_path, tensor_path)
+
+    header.update({'shape': list(shape), 'dtype': 'float32'})
+    with open(f'{header_path}.{os.getpid()}.tmp', 'w') as header_json:
+      dump(header, header_json)
+    os.replace(f'{header_path}.{os.getpid()}.tmp', header_path)
+
+    return tensor_path
+
+
+  """
+    [ name ]:
+      __get_symbols (return dtype: List[str])
+
+    [ parameters ]:
+      - symbols (dtype: Optional[List[str]], default: every modeling table)
+  """
+  def __get_symbols(self, symbols: Optional[List[str]]) -> List[str]:
+    if symbols is not None: return symbols
+    return [
+      splitext(table_name)[0]
+        for table_name in self.storage.list_tables(self.DATASET_MODELING_CSV_PATH)
+    ]
+
+
+  """
+    [ name ]:
+      export_symbols (return dtype: List[str])
+
+    [ parameters ]:
+      - symbols (dtype: Optional[List[str]], default: every modeling table)
+
+    [ description ]:
+      One tensor per symbol: modeling_tensors/{symbol}.npy + {symbol}.json.
+      Returns the exported symbols
+  """
+  def export_symbols(self, symbols: Optional[List[str]] = None) -> List[str]:
+    exported_symbols: List[str] = []
+    try:
+      if not file_is_exists(self.DATASET_MODELING_TENSOR_PATH):
+        makedirs(self.DATASET_MODELING_TENSOR_PATH)
+
+      for symbol in self.__get_symbols(symbols):
+        symbol_data: Optional[Tuple[DataFrame, Dict[str, Any]]] = self.__read_symbol(symbol)
+        if symbol_data is None: continue
+
+        dataframe, min_max = symbol_data
+        self.__write_tensor(symbol, [dataframe], {
+          'columns': list(dataframe.columns),
+          'dates':   dataframe.index.strftime('%Y-%m-%d').tolist(),
+          **min_max
+        })
+        exported_symbols.append(symbol)
+
+      logger.info(f'[ SAVED ] [ MODELING TENSOR ] {len(exported_symbols)} symbols saved on "{self.DATASET_MODELING_TENSOR_PATH}"')
+
+    except Exception as error_message:
+      logger.error(error_message)
+
+    return exported_symbols
+
+
+  """
+    [ name ]:
+      export_panel (return dtype: Optional[str])
+
+    [ parameters ]:
+      - symbols (dtype: Optional[List[str]], default: every modeling table)
+
+    [ description ]:
+      Every symbol in one tensor, modeling_tensors/panel.npy, the header
+      has the row range, dates and min-max of each symbol.
+      Returns the tensor path
+  """
+  def export_panel(self, symbols: Optional[List[str]] = None) -> Optional[str]:
+    try:
+      if not file_is_exists(self.DATASET_MODELING_TENSOR_PATH):
+        makedirs(self.DATASET_MODELING_TENSOR_PATH)
+
+      frames: List[DataFrame] = []
+      header: Dict[str, Any] = {'columns': [], 'symbols': {}}
+
+      for symbol in self.__get_symbols(symbols):
+        symbol_data: Optional[Tuple[DataFrame, Dict[str, Any]]] = self.__read_symbol(symbol)
+        if symbol_data is None: continue
+
+        dataframe, min_max = symbol_data
+        if not frames:
+          header['columns'] = list(dataframe.columns)
+
+        elif list(dataframe.columns) != header['columns']:
+          logger.warning(f'[ MODELING TENSOR ] [ SKIPPED ] "{symbol}" columns differ from the panel')
+          continue
+
+        start: int = sum(len(frame) for frame in frames)
+        header['symbols'][symbol] = {
+          'start': start,
+          'stop':  start + len(dataframe),
+          'dates': dataframe.index.strftime('%Y-%m-%d').tolist(),
+          **min_max
+        }
+        frames.append(dataframe)
+
+      if not frames:
+        logger.warning('[ MODELING TENSOR ] no modeling table to export')
+        return None
+
+      tensor_path: str = self.__write_tensor(self.PANEL_NAME, frames, header)
+      logger.info(f'[ SAVED ] [ MODELING TENSOR ] {len(frames)} symbols saved on "{tensor_path}"')
+      return tensor_path
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
+
+
+  """
+    [ name ]:
+      load (return dtype: Tuple[np.memmap, Dict[str, Any]])
+
+    [ parameters ]:
+      - name (dtype: str, symbol or PANEL_NAME)
+
+    [ description ]:
+      Open a tensor read-only (memory-mapped) with its header: slices of
+      it (training windows) are read from disk without a copy
+  """
+  def load(self, name: str) -> Tuple[np.memmap, Dict[str, Any]]:
+    with open(f'{self.DATASET_MODELING_TENSOR_PATH}/{name}.json', 'r') as header_json:
+      header: Dict[str, Any] = load(header_json)
+
+    return np.load(f'{self.DATASET_MODELING_TENSOR_PATH}/{name}.npy', mmap_mode = 'r'), header
@@ -0,0 +1,234 @@
+import os
+import numpy as np
+from json import dump, dumps
+from json.encoder import encode_basestring_ascii
+from typing import Any, List, Dict, Union, TextIO, Callable, Optional
+
+from os.path import exists as file_is_exists
+
+from settings.logging_rules import logger
+from settings.location_rules import LocationRules
+
+try:
+  import orjson
+except ImportError:
+  orjson = None
+
+
+"""
+
+  -- JSON Writer --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class JsonWriter(LocationRules):
+  # JSON serializers of the number columns ('auto': orjson if installed)
+  JSON_SERIALIZERS: List[str] = ['auto', 'orjson', 'json']
+
+  # records formatted and written per chunk of rows
+  ROWS_PER_WRITE: int = 2048
+
+  # orjson writes these floats differently from float.__repr__
+  # (1e16 / 0.00001 instead of 1e+16 / 1e-05, NaN / Infinity as null)
+  REPR_EXPONENT_MIN: float = 1e-4
+  REPR_EXPONENT_MAX: float = 1e16
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - serializer (dtype: Optional[str], default: DATASET_JSON_SERIALIZER)
+
+    [ description ]:
+      JSON outputs written in the format of json.dump with its default
+      settings (", " / ": " separators, ASCII escapes, NaN / Infinity),
+      so their consumers read the same bytes. Records are streamed from
+      columns (no list of dicts), the number columns are formatted by
+      orjson (numpy arrays, one call per column) or by float.__repr__
+  """
+  def __init__(self, serializer: Optional[str] = None) -> None:
+    self.serializer: str = (serializer or self.DATASET_JSON_SERIALIZER).lower()
+    if self.serializer not in self.JSON_SERIALIZERS:
+      raise ValueError(f'unknown JSON serializer "{self.serializer}"')
+
+    if self.serializer == 'auto':
+      self.serializer = 'json' if orjson is None else 'orjson'
+
+    elif (self.serializer == 'orjson') and (orjson is None):
+      logger.warning('[ JSON WRITER ] orjson is not installed, using json')
+      self.serializer = 'json'
+
+
+  """
+    [ name ]:
+      __json_numbers_stdlib (return dtype: List[str])
+
+    [ parameters ]:
+      - values (dtype: np.ndarray, int or float)
+
+    [ description ]:
+      Number tokens as json.dumps writes them
+  """
+  def __json_numbers_stdlib(self, values: np.ndarray) -> List[str]:
+    if values.dtype.kind in 'iu':
+      return list(map(int.__repr__, values.tolist()))
+
+    tokens: List[str] = list(map(float.__repr__, values.tolist()))
+    for position in np.flatnonzero(~np.isfinite(values)).tolist():
+      value: float = values[position]
+      tokens[position] = 'NaN' if np.isnan(value) else \
+        ('Infinity' if value > 0 else '-Infinity')
+
+    return tokens
+
+
+  """
+    [ name ]:
+      __json_numbers_orjson (return dtype: List[str])
+
+    [ parameters ]:
+      - values (dtype: np.ndarray, int or float)
+
+    [ description ]:
+      Number tokens of the whole column serialized by orjson, the floats
+      it writes differently (exponents, non-finite) taken from the stdlib
+  """
+  def __json_numbers_orjson(self, values: np.ndarray) -> List[str]:
+    if len(values) == 0: return []
+
+    tokens: List[str] = orjson.dumps(
+      np.ascontiguousarray(values), option = orjson.OPT_SERIALIZE_NUMPY
+    ).decode('ascii')[1:-1].split(',')
+    if values.dtype.kind in 'iu': return tokens
+
+    with np.errstate(invalid = 'ignore'):
+      magnitude: np.ndarray = np.abs(values)
+      repr_positions: np.ndarray = np.flatnonzero(
+        ~np.isfinite(values) | (magnitude >= self.REPR_EXPONENT_MAX) |
+        ((magnitude < self.REPR_EXPONENT_MIN) & (values != 0))
+      )
+
+    if len(repr_positions):
+      repr_tokens: List[str] = self.__json_numbers_stdlib(values[repr_positions])
+      for position, token in zip(repr_positions.tolist(), repr_tokens):
+        tokens[position] = token
+
+    return tokens
+
+
+  """
+    [ name ]:
+      json_tokens (return dtype: List[str])
+
+    [ parameters ]:
+      - values (dtype: Union[np.ndarray, List[Any]])
+
+    [ description ]:
+      JSON token of each value of a column: int / float arrays through
+      the serializer, text with the ASCII escapes of json.dumps, other
+      values by json.dumps
+  """
+  def json_tokens(self, values: Union[np.ndarray, List[Any]]) -> List[str]:
+    if isinstance(values, np.ndarray) and (values.dtype.kind in 'iuf'):
+      # float32 as float64: json.dumps writes the float64 repr of the value
+      if values.dtype.kind == 'f': values = values.astype(np.float64, copy = False)
+
+      if self.serializer == 'orjson': return self.__json_numbers_orjson(values)
+      return self.__json_numbers_stdlib(values)
+
+    return [
+      encode_basestring_ascii(value) if isinstance(value, str) else dumps(value)
+        for value in (values.tolist() if isinstance(values, np.ndarray) else values)
+    ]
+
+
+  """
+    [ name ]:
+      __atomic_write (return dtype: str)
+
+    [ parameters ]:
+      - json_path (dtype: str)
+      - write     (dtype: Callable[[TextIO], None])
+
+    [ description ]:
+      Write through a temporary file, then atomic replace
+  """
+  def __atomic_write(self, json_path: str, write: Callable[[TextIO], None]) -> str:
+    temporary_path: str = f'{json_path}.{os.getpid()}.tmp'
+    try:
+      with open(temporary_path, 'w') as json_file:
+        write(json_file)
+
+      os.replace(temporary_path, json_path)
+      return json_path
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {json_path}')
+      if file_is_exists(temporary_path): os.remove(temporary_path)
+      raise
+
+
+  """
+    [ name ]:
+      write (return dtype: str)
+
+    [ parameters ]:
+      - json_path (dtype: str)
+      - payload   (dtype: Any)
+
+    [ description ]:
+      Write a small payload (dicts of text / numbers) with json.dump:
+      orjson has no ", " / ": " separators nor ASCII escapes
+  """
+  def write(self, json_path: str, payload: Any) -> str:
+    return self.__atomic_write(json_path, lambda json_file: dump(payload, json_file))
+
+
+  """
+    [ name ]:
+      write_records (return dtype: str)
+
+    [ parameters ]:
+      - json_path (dtype: str)
+      - root_key  (dtype: str)
+      - columns   (dtype: Dict[str, Union[np.ndarray, List[Any]]], same length)
+
+    [ description ]:
+      Write {root_key: [records]} straight from the columns, byte for
+      byte as json.dump({root_key: [{key: value, ...}, ...]}) would
+  """
+  def write_records(
+    self, json_path: str,
+    root_key:        str,
+    columns:         Dict[str, Union[np.ndarray, List[Any]]]
+  ) -> str:
+    # record template: {"key": %s, ...} with the key escapes of json.dumps
+    record_template: str = '{' + ', '.join(
+      encode_basestring_ascii(key).replace('%', '%%') + ': %s'
+        for key in columns.keys()
+    ) + '}'
+    total_rows: int = len(next(iter(columns.values()))) if columns else 0
+
+    def write(json_file: TextIO) -> None:
+      json_file.write('{' + encode_basestring_ascii(root_key) + ': [')
+
+      for start in range(0, total_rows, self.ROWS_PER_WRITE):
+        stop: int = min(start + self.ROWS_PER_WRITE, total_rows)
+        tokens: List[List[str]] = [
+          self.json_tokens(values[start:stop]) for values in columns.values()
+        ]
+
+        if start: json_file.write(', ')
+        json_file.write(', '.join(record_template % row for row in zip(*tokens)))
+
+      json_file.write(']}')
+
+    return self.__atomic_write(json_path, write)
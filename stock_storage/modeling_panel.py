@@ -0,0 +1,197 @@
+import os
+from json import dump, load
+from typing import Any, List, Dict, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pandas import DataFrame, to_datetime
+
+from os.path import exists as file_is_exists, splitext
+
+from settings.logging_rules import logger
+from settings.location_rules import LocationRules
+from stock_storage.table_storage import TableStorage
+
+
+"""
+
+  -- Modeling Panel --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class ModelingPanel(LocationRules):
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - storage (dtype: Optional[TableStorage], default: TableStorage())
+
+    [ description ]:
+      Consolidated modeling output: the normalized modeling tables of
+      every symbol in one Parquet file (one row group per symbol), with
+      an index JSON (columns, symbol -> row range / row group, min-max).
+      The per-symbol modeling tables and min-max JSON stay as they are
+  """
+  def __init__(self, storage: Optional[TableStorage] = None) -> None:
+    self.storage: TableStorage = storage or TableStorage()
+
+
+  """
+    [ name ]:
+      __read_symbol (return dtype: Optional[DataFrame])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+
+    [ description ]:
+      Modeling table of a symbol (Date column as datetime64),
+      None if it is missing or empty
+  """
+  def __read_symbol(self, symbol: str) -> Optional[DataFrame]:
+    try:
+      dataframe: DataFrame = self.storage.read(
+        f'{self.DATASET_MODELING_CSV_PATH}/{symbol}.csv',
+        index_col = 'Date', round_trip = True
+      ).reset_index()
+      if dataframe.empty: return None
+
+      dataframe['Date'] = to_datetime(dataframe['Date'], errors = 'coerce')
+      return dataframe
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return None
+
+
+  """
+    [ name ]:
+      __read_min_max (return dtype: Dict[str, Dict[str, float]])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+  """
+  def __read_min_max(self, symbol: str) -> Dict[str, Dict[str, float]]:
+    try:
+      min_max_json_path: str = f'{self.DATASET_MINMAX_CSV_PATH}/{symbol}.json'
+      if not file_is_exists(min_max_json_path): return {}
+
+      with open(min_max_json_path, 'r') as min_max_json:
+        return load(min_max_json)
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return {}
+
+
+  """
+    [ name ]:
+      generate_panel (return dtype: Optional[Dict[str, Any]])
+
+    [ parameters ]:
+      - symbols (dtype: Optional[List[str]], default: every modeling table)
+
+    [ description ]:
+      Write the panel Parquet file and its index JSON (temporary files,
+      then atomic replace). Returns the index
+  """
+  def generate_panel(self, symbols: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+    try:
+      if symbols is None:
+        symbols = [
+          splitext(table_name)[0]
+            for table_name in self.storage.list_tables(self.DATASET_MODELING_CSV_PATH)
+        ]
+
+      panel_index: Dict[str, Any] = {'columns': [], 'rows': 0, 'symbols': {}}
+      temporary_path: str = f'{self.DATASET_MODELING_PANEL_PATH}.{os.getpid()}.tmp'
+
+      parquet_writer: Optional[pq.ParquetWriter] = None
+      try:
+        for symbol in symbols:
+          dataframe: Optional[DataFrame] = self.__read_symbol(symbol)
+          if dataframe is None: continue
+
+          feature_columns: List[str] = [column for column in dataframe.columns if column != 'Date']
+          if parquet_writer is None:
+            panel_index['columns'] = feature_columns
+
+          elif feature_columns != panel_index['columns']:
+            logger.warning(f'[ MODELING PANEL ] [ SKIPPED ] "{symbol}" columns differ from the panel')
+            continue
+
+          dataframe.insert(0, 'symbol', symbol)
+          table: pa.Table = pa.Table.from_pandas(dataframe, preserve_index = False)
+          if parquet_writer is None:
+            parquet_writer = pq.ParquetWriter(temporary_path, table.schema)
+
+          # one row group per symbol: a symbol is read without the others
+          parquet_writer.write_table(table, row_group_size = len(dataframe))
+
+          panel_index['symbols'][symbol] = {
+            'start':      panel_index['rows'],
+            'stop':       panel_index['rows'] + len(dataframe),
+            'row_group':  len(panel_index['symbols']),
+            'first_date': dataframe['Date'].iloc[0].strftime('%Y-%m-%d'),
+            'last_date':  dataframe['Date'].iloc[-1].strftime('%Y-%m-%d'),
+            **self.__read_min_max(symbol)
+          }
+          panel_index['rows'] += len(dataframe)
+
+      finally:
+        if parquet_writer is not None: parquet_writer.close()
+
+      if parquet_writer is None:
+        logger.warning('[ MODELING PANEL ] no modeling table to consolidate')
+        return None
+
+      os.replace(temporary_path, self.DATASET_MODELING_PANEL_PATH)
+
+      temporary_index_path: str = f'{self.DATASET_MODELING_PANEL_INDEX_PATH}.{os.getpid()}.tmp'
+      with open(temporary_index_path, 'w') as panel_index_json:
+        dump(panel_index, panel_index_json)
+      os.replace(temporary_index_path, self.DATASET_MODELING_PANEL_INDEX_PATH)
+
+      logger.info(
+        f'[ SAVED ] [ MODELING PANEL ] {len(panel_index["symbols"])} symbols, ' +
+        f'{panel_index["rows"]} rows saved on "{self.DATASET_MODELING_PANEL_PATH}"'
+      )
+      return panel_index
+
+    except Exception as error_message:
+      logger.error(error_message)
+      return None
+
+
+  """
+    [ name ]:
+      read_symbol (return dtype: Optional[DataFrame])
+
+    [ parameters ]:
+      - symbol (dtype: str)
+
+    [ description ]:
+      Read the rows of one symbol from the panel (its row group only)
+  """
+  def read_symbol(self, symbol: str) -> Optional[DataFrame]:
+    try:
+      with open(self.DATASET_MODELING_PANEL_INDEX_PATH, 'r') as panel_index_json:
+        panel_index: Dict[str, Any] = load(panel_index_json)
+
+      if symbol not in panel_index['symbols']: return None
+
+      row_group: int = panel_index['symbols'][symbol]['row_group']
+      return pq.ParquetFile(self.DATASET_MODELING_PANEL_PATH) \
+        .read_row_group(row_group, columns = ['Date', *panel_index['columns']]) \
+        .to_pandas() \
+        .set_index('Date')
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {symbol}')
+      return None
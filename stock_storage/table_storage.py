@@ -0,0 +1,206 @@
+import os
+from typing import List, Dict, Optional
+from pandas import (
+  DataFrame, isna, to_datetime,
+  read_csv, read_parquet, read_feather
+)
+from pandas.api.types import is_object_dtype
+
+from os import listdir
+from os.path import exists as file_is_exists, splitext
+
+from settings.logging_rules import logger
+from settings.location_rules import LocationRules
+
+
+"""
+
+  -- Table Storage --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class TableStorage(LocationRules):
+  # storage format -> file extension
+  STORAGE_EXTENSIONS: Dict[str, str] = {
+    'csv':     'csv',
+    'parquet': 'parquet',
+    'feather': 'feather'
+  }
+
+  # text date columns, stored as datetime64 by the columnar formats
+  DATE_COLUMNS: List[str] = ['Date']
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - storage_format (dtype: Optional[str], default: DATASET_STORAGE_FORMAT)
+
+    [ description ]:
+      Tables of the dataset (historicals, indicators, modeling datas,
+      ranking) read and written through one backend: CSV (text, like
+      before) or the typed columnar formats Parquet / Feather (pyarrow),
+      which keep the float64 / int64 / datetime64 dtypes and read only the
+      requested columns
+  """
+  def __init__(self, storage_format: Optional[str] = None) -> None:
+    self.storage_format: str = (storage_format or self.DATASET_STORAGE_FORMAT).lower()
+    if self.storage_format not in self.STORAGE_EXTENSIONS:
+      raise ValueError(f'unknown storage format "{self.storage_format}"')
+
+    self.extension: str = self.STORAGE_EXTENSIONS[self.storage_format]
+
+
+  """
+    [ name ]:
+      get_path (return dtype: str)
+
+    [ parameters ]:
+      - csv_path (dtype: str, table path as defined by LocationRules)
+
+    [ description ]:
+      Path of the table with the extension of the storage format
+  """
+  def get_path(self, csv_path: str) -> str:
+    return f'{splitext(csv_path)[0]}.{self.extension}'
+
+
+  """
+    [ name ]:
+      exists (return dtype: bool)
+
+    [ parameters ]:
+      - csv_path (dtype: str)
+  """
+  def exists(self, csv_path: str) -> bool:
+    return file_is_exists(self.get_path(csv_path))
+
+
+  """
+    [ name ]:
+      list_tables (return dtype: List[str])
+
+    [ parameters ]:
+      - directory (dtype: str)
+
+    [ description ]:
+      Sorted file names of the tables stored in a directory
+  """
+  def list_tables(self, directory: str) -> List[str]:
+    return sorted(
+      item for item in listdir(directory)
+        if item.endswith(f'.{self.extension}')
+    )
+
+
+  """
+    [ name ]:
+      read (return dtype: DataFrame)
+
+    [ parameters ]:
+      - csv_path  (dtype: str)
+      - columns   (dtype: Optional[List[str]], default: every column)
+      - index_col  (dtype: Optional[str])
+      - round_trip (dtype: bool, default: False, floats read back exactly as written)
+
+    [ description ]:
+      Read a table, only the requested columns (and the index column).
+      Only the arguments every backend honours: round_trip is the exact
+      float parser of read_csv, the columnar formats are always exact
+  """
+  def read(
+    self, csv_path: str,
+    columns:    Optional[List[str]] = None,
+    index_col:  Optional[str] = None,
+    round_trip: bool = False
+  ) -> DataFrame:
+    table_path: str = self.get_path(csv_path)
+    if (columns is not None) and (index_col is not None) and (index_col not in columns):
+      columns = [index_col, *columns]
+
+    if self.storage_format == 'csv':
+      return read_csv(
+        table_path, usecols = columns, index_col = index_col,
+        float_precision = 'round_trip' if round_trip else None
+      )
+
+    if self.storage_format == 'parquet':
+      dataframe: DataFrame = read_parquet(table_path, columns = columns)
+    else:
+      dataframe: DataFrame = read_feather(table_path, columns = columns)
+
+    if index_col is not None: dataframe = dataframe.set_index(index_col)
+    return dataframe
+
+
+  """
+    [ name ]:
+      __to_columnar (return dtype: DataFrame)
+
+    [ parameters ]:
+      - dataframe (dtype: DataFrame)
+      - index     (dtype: bool)
+
+    [ description ]:
+      Columnar layout of a table: the index becomes a column, the text
+      dates become datetime64 and the other object values (lists, dicts)
+      are written as text, as the CSV would
+  """
+  def __to_columnar(self, dataframe: DataFrame, index: bool) -> DataFrame:
+    dataframe = dataframe.reset_index() if index else dataframe.reset_index(drop = True)
+
+    for column in dataframe.columns:
+      if not is_object_dtype(dataframe[column]): continue
+
+      if column in self.DATE_COLUMNS:
+        dataframe[column] = to_datetime(dataframe[column], errors = 'coerce')
+        continue
+
+      dataframe[column] = dataframe[column].map(
+        lambda value: value if isinstance(value, str) or (value is None) or \
+          (isinstance(value, float) and isna(value)) else str(value)
+      )
+
+    return dataframe
+
+
+  """
+    [ name ]:
+      write (return dtype: str)
+
+    [ parameters ]:
+      - csv_path  (dtype: str)
+      - dataframe (dtype: DataFrame)
+      - index     (dtype: bool, default: True, like DataFrame.to_csv)
+
+    [ description ]:
+      Write a table (temporary file, then atomic replace).
+      Returns the written path
+  """
+  def write(self, csv_path: str, dataframe: DataFrame, index: bool = True) -> str:
+    table_path: str = self.get_path(csv_path)
+    temporary_path: str = f'{table_path}.{os.getpid()}.tmp'
+
+    try:
+      if self.storage_format == 'csv':
+        dataframe.to_csv(path_or_buf = temporary_path, index = index)
+      elif self.storage_format == 'parquet':
+        self.__to_columnar(dataframe, index).to_parquet(temporary_path, index = False)
+      else:
+        self.__to_columnar(dataframe, index).to_feather(temporary_path)
+
+      os.replace(temporary_path, table_path)
+      return table_path
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {table_path}')
+      if file_is_exists(temporary_path): os.remove(temporary_path)
+      raise
@@ -0,0 +1,550 @@
+import os
+from glob import glob
+from time import time
+from hashlib import sha256
+from threading import Lock
+from json import dump, dumps, load
+from typing import Any, List, Dict, Tuple, Callable, Optional
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+
+from os.path import exists as file_is_exists, isdir
+
+from settings.logging_rules import logger
+from settings.location_rules import LocationRules
+
+
+"""
+
+  -- Pipeline Runner (Stage DAG) --
+
+  Writer : Al-Fariqy Raihan Azhwar
+  NPM    : 202143501514
+  Class  : R8Q
+  Email  : alfariqyraihan@gmail.com
+
+"""
+
+
+class PipelineStage:
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - name       (dtype: str)
+      - run        (dtype: Callable[[Dict[str, Any]], Any], gets the results of the stages before)
+      - after      (dtype: Optional[List[str]], stages this one depends on)
+      - inputs     (dtype: Optional[List[str]], files / directories / glob patterns)
+      - outputs    (dtype: Optional[List[str]], files / directories / glob patterns)
+      - parameters (dtype: Any, JSON serializable, part of the fingerprint)
+      - cacheable  (dtype: bool, default: True, False for stages reading the network)
+      - load       (dtype: Optional[Callable[[], Any]], result of a skipped stage, from disk)
+      - retry      (dtype: Optional[Callable[[Dict[str, Any], List[str]], Any]], run for the failed items only)
+
+    [ description ]:
+      One stage of the pipeline. It fails when "run" raises or returns
+      False, or when one of its outputs is missing afterwards. It is
+      partial when "run" returns a PartialResult: a resume run calls
+      "retry" with the failed items (or "run" when there is no retry)
+  """
+  def __init__(
+    self, name: str,
+    run:        Callable[[Dict[str, Any]], Any],
+    after:      Optional[List[str]] = None,
+    inputs:     Optional[List[str]] = None,
+    outputs:    Optional[List[str]] = None,
+    parameters: Any = None,
+    cacheable:  bool = True,
+    load:       Optional[Callable[[], Any]] = None,
+    retry:      Optional[Callable[[Dict[str, Any], List[str]], Any]] = None
+  ) -> None:
+    self.name:       str = name
+    self.run:        Callable[[Dict[str, Any]], Any] = run
+    self.after:      List[str] = after or []
+    self.inputs:     List[str] = inputs or []
+    self.outputs:    List[str] = outputs or []
+    self.parameters: Any = parameters
+    self.cacheable:  bool = cacheable
+    self.load:       Optional[Callable[[], Any]] = load
+    self.retry:      Optional[Callable[[Dict[str, Any], List[str]], Any]] = retry
+
+
+class PartialResult:
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - failed (dtype: List[str], items (symbols) that still failed)
+      - total  (dtype: int, items the stage ran for)
+      - result (dtype: Any, default: None, result for the stages after it)
+
+    [ description ]:
+      Result of a stage done for part of its items. The stage is PARTIAL:
+      the stages after it still run, the failed items are kept in the
+      state for a resume run. It fails when the failed items are above
+      the maximum failure ratio
+  """
+  def __init__(self, failed: List[str], total: int, result: Any = None) -> None:
+    self.failed: List[str] = list(failed)
+    self.total:  int = total
+    self.result: Any = result
+
+
+class PipelineRunner(LocationRules):
+  # stages running at the same time (independent stages only)
+  PIPELINE_MAX_WORKERS: int = 4
+
+  # failed items / items above which a partial stage fails
+  PIPELINE_MAXIMUM_FAILURE_RATIO: float = 0.5
+
+  # bytes read at a time when hashing a file content
+  PIPELINE_HASH_CHUNK_SIZE: int = 1024 * 1024
+
+
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - resume      (dtype: bool, default: False)
+      - state_path  (dtype: Optional[str], default: DATASET_PIPELINE_STATE_PATH)
+      - max_workers (dtype: Optional[int], default: PIPELINE_MAX_WORKERS)
+      - maximum_failure_ratio (dtype: Optional[float], default: PIPELINE_MAXIMUM_FAILURE_RATIO)
+
+    [ description ]:
+      Runs the stages as a DAG: a stage starts once the stages it comes
+      after are done, independent stages run concurrently (threads).
+      The state file keeps, per stage, the fingerprints (path, content
+      sha256) of its inputs and outputs: a cacheable stage whose inputs
+      and outputs are unchanged is skipped. With "resume", the stages
+      that succeeded in the last unfinished run are skipped too (network
+      stages included), so the run continues from the failed stage and
+      the partial stages retry their failed items
+  """
+  def __init__(
+    self, resume: bool = False,
+    state_path:   Optional[str] = None,
+    max_workers:  Optional[int] = None,
+    maximum_failure_ratio: Optional[float] = None
+  ) -> None:
+    self.resume:      bool = resume
+    self.state_path:  str = state_path or self.DATASET_PIPELINE_STATE_PATH
+    self.max_workers: int = max_workers or self.PIPELINE_MAX_WORKERS
+    self.maximum_failure_ratio: float = self.PIPELINE_MAXIMUM_FAILURE_RATIO \
+      if maximum_failure_ratio is None else maximum_failure_ratio
+
+    self.__lock:  Lock = Lock()
+    self.__state: Dict[str, Any] = self.__load_state()
+
+
+  """
+    [ name ]:
+      __load_state (return dtype: Dict[str, Any])
+  """
+  def __load_state(self) -> Dict[str, Any]:
+    try:
+      if not file_is_exists(self.state_path): return {'stages': {}, 'files': {}}
+      with open(self.state_path, 'r') as state_json:
+        state: Dict[str, Any] = load(state_json)
+
+      state.setdefault('files', {})
+      return state
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {self.state_path}')
+      return {'stages': {}, 'files': {}}
+
+
+  """
+    [ name ]:
+      __save_state (return dtype: None)
+
+    [ description ]:
+      Write the state (temporary file, then atomic replace), after
+      every stage: a crash keeps the stages done so far
+  """
+  def __save_state(self) -> None:
+    try:
+      with self.__lock:
+        state_directory: str = os.path.dirname(self.state_path) or '.'
+        if not file_is_exists(state_directory): os.makedirs(state_directory)
+
+        temporary_path: str = f'{self.state_path}.{os.getpid()}.tmp'
+        with open(temporary_path, 'w') as state_json:
+          dump(self.__state, state_json, sort_keys = True, indent = 1)
+        os.replace(temporary_path, self.state_path)
+
+    except Exception as error_message:
+      logger.error(f'{error_message} {self.state_path}')
+
+
+  """
+    [ name ]:
+      __list_files (return dtype: List[str])
+
+    [ parameters ]:
+      - patterns (dtype: List[str], files / directories / glob patterns)
+  """
+  def __list_files(self, patterns: List[str]) -> List[str]:
+    file_paths: List[str] = []
+    for pattern in patterns:
+      for path in sorted(glob(pattern)):
+        if not isdir(path):
+          file_paths.append(path)
+          continue
+
+        for directory, _, file_names in sorted(os.walk(path)):
+          file_paths.extend(os.path.join(directory, file_name) for file_name in sorted(file_names))
+
+    return file_paths
+
+
+  """
+    [ name ]:
+      __file_digest (return dtype: str)
+
+    [ parameters ]:
+      - path (dtype: str)
+
+    [ description ]:
+      sha256 of the file content. The digest is kept in the state
+      with the size and mtime it was read at, and reused while both
+      are unchanged, so an unchanged file is only read once
+  """
+  def __file_digest(self, path: str) -> str:
+    path_stat: os.stat_result = os.stat(path)
+    with self.__lock:
+      cached: Optional[List[Any]] = self.__state['files'].get(path)
+    if cached and (cached[0] == path_stat.st_size) and (cached[1] == path_stat.st_mtime_ns):
+      return cached[2]
+
+    content_hash: Any = sha256()
+    with open(path, 'rb') as content_file:
+      for chunk in iter(lambda: content_file.read(self.PIPELINE_HASH_CHUNK_SIZE), b''):
+        content_hash.update(chunk)
+
+    digest: str = content_hash.hexdigest()
+    with self.__lock:
+      self.__state['files'][path] = [path_stat.st_size, path_stat.st_mtime_ns, digest]
+
+    return digest
+
+
+  """
+    [ name ]:
+      fingerprint (return dtype: str)
+
+    [ parameters ]:
+      - patterns   (dtype: List[str])
+      - parameters (dtype: Any, default: None)
+
+    [ description ]:
+      sha256 of the path and content sha256 of every matched file and
+      of the parameters: a rewrite with the same bytes, or a fresh
+      checkout (new mtimes), keeps the fingerprint
+  """
+  def fingerprint(self, patterns: List[str], parameters: Any = None) -> str:
+    file_digests: List[Tuple[str, str]] = []
+    for path in self.__list_files(patterns):
+      try:
+        file_digests.append((path, self.__file_digest(path)))
+
+      except FileNotFoundError:
+        continue
+
+    return sha256(
+      dumps([patterns, file_digests, parameters], sort_keys = True, default = str).encode('utf-8')
+    ).hexdigest()
+
+
+  """
+    [ name ]:
+      __outputs_exist (return dtype: bool)
+
+    [ parameters ]:
+      - stage (dtype: PipelineStage)
+  """
+  def __outputs_exist(self, stage: PipelineStage) -> bool:
+    return all(glob(pattern) for pattern in stage.outputs)
+
+
+  """
+    [ name ]:
+      __skip_reason (return dtype: Tuple[Optional[str], str])
+
+    [ parameters ]:
+      - stage             (dtype: PipelineStage)
+      - upstream_executed (dtype: bool, a stage before this one ran in this run)
+
+    [ description ]:
+      Why the stage is skipped ('unchanged', 'resumed' or None) and the
+      fingerprint of its inputs
+  """
+  def __skip_reason(self, stage: PipelineStage, upstream_executed: bool) -> Tuple[Optional[str], str]:
+    inputs_fingerprint: str = self.fingerprint(stage.inputs, stage.parameters)
+
+    record: Optional[Dict[str, Any]] = self.__state['stages'].get(stage.name)
+    if (record is None) or (record.get('status') != 'SUCCESS'):
+      return None, inputs_fingerprint
+
+    if (not self.__outputs_exist(stage)) or \
+      (self.fingerprint(stage.outputs) != record.get('outputs')):
+      return None, inputs_fingerprint
+
+    if stage.cacheable and (inputs_fingerprint == record.get('inputs')):
+      return 'unchanged', inputs_fingerprint
+
+    if self.resume and (not upstream_executed) and \
+      (record.get('run_id') == self.__state.get('run_id')):
+      return 'resumed', inputs_fingerprint
+
+    return None, inputs_fingerprint
+
+
+  """
+    [ name ]:
+      __retry_record (return dtype: Optional[Dict[str, Any]])
+
+    [ parameters ]:
+      - stage             (dtype: PipelineStage)
+      - upstream_executed (dtype: bool, a stage before this one ran in this run)
+
+    [ description ]:
+      Record of the stage when it was partial in the resumed run (its
+      failed items are retried), None when the stage runs in full
+  """
+  def __retry_record(self, stage: PipelineStage, upstream_executed: bool) -> Optional[Dict[str, Any]]:
+    record: Optional[Dict[str, Any]] = self.__state['stages'].get(stage.name)
+    if (not self.resume) or upstream_executed or (stage.retry is None) or \
+      (record is None) or (record.get('status') != 'PARTIAL') or \
+      (record.get('run_id') != self.__state.get('run_id')) or (not record.get('failed')):
+      return None
+
+    return record
+
+
+  """
+    [ name ]:
+      __load_result (return dtype: bool)
+
+    [ parameters ]:
+      - stage   (dtype: PipelineStage)
+      - results (dtype: Dict[str, Any])
+
+    [ description ]:
+      Result of a skipped stage loaded from disk (False if it can not
+      be loaded: the stage runs instead)
+  """
+  def __load_result(self, stage: PipelineStage, results: Dict[str, Any]) -> bool:
+    try:
+      if stage.load is not None: results[stage.name] = stage.load()
+      return True
+
+    except Exception as error_message:
+      logger.error(f'[ PIPELINE ] [ {stage.name} ] {error_message}')
+      return False
+
+
+  """
+    [ name ]:
+      __run_stage (return dtype: Any)
+
+    [ parameters ]:
+      - stage        (dtype: PipelineStage)
+      - results      (dtype: Dict[str, Any])
+      - retry_record (dtype: Optional[Dict[str, Any]], default: None, see __retry_record)
+
+    [ description ]:
+      Run a stage (worker thread), or retry its failed items, raise
+      when it failed
+  """
+  def __run_stage(
+    self, stage: PipelineStage,
+    results:      Dict[str, Any],
+    retry_record: Optional[Dict[str, Any]] = None
+  ) -> Any:
+    started_at: float = time()
+    if retry_record is None:
+      logger.info(f'[ PIPELINE ] [ {stage.name} ] Running...')
+      result: Any = stage.run(results)
+
+    else:
+      logger.info(f'[ PIPELINE ] [ {stage.name} ] Retrying {retry_record["failed"]}...')
+      result: Any = stage.retry(results, retry_record['failed'])
+
+    if result is False:
+      raise RuntimeError(f'stage "{stage.name}" returned False')
+
+    missing_outputs: List[str] = [pattern for pattern in stage.outputs if not glob(pattern)]
+    if missing_outputs:
+      raise RuntimeError(f'stage "{stage.name}" did not write {missing_outputs}')
+
+    if isinstance(result, PartialResult):
+      # a retry is measured against the items of the first run
+      if retry_record is not None: result.total = retry_record.get('total', result.total)
+
+      failure_ratio: float = len(result.failed) / max(result.total, 1)
+      if failure_ratio > self.maximum_failure_ratio:
+        raise RuntimeError(
+          f'stage "{stage.name}" failed for {len(result.failed)} of {result.total} items '
+          f'(above {self.maximum_failure_ratio:.0%}): {result.failed}'
+        )
+
+      logger.warning(
+        f'[ PIPELINE ] [ {stage.name} ] [ PARTIAL ] {time() - started_at:.2f} seconds, '
+        f'{len(result.failed)} of {result.total} items failed: {result.failed}'
+      )
+      return result
+
+    logger.info(f'[ PIPELINE ] [ {stage.name} ] [ SUCCESS ] {time() - started_at:.2f} seconds')
+    return result
+
+
+  """
+    [ name ]:
+      __validate (return dtype: None)
+
+    [ parameters ]:
+      - stages (dtype: List[PipelineStage])
+
+    [ description ]:
+      Unique names, known dependencies and no cycle (raise ValueError)
+  """
+  def __validate(self, stages: List[PipelineStage]) -> None:
+    names: List[str] = [stage.name for stage in stages]
+    if len(set(names)) != len(names):
+      raise ValueError(f'duplicate pipeline stages {names}')
+
+    for stage in stages:
+      unknown: List[str] = [name for name in stage.after if name not in names]
+      if unknown: raise ValueError(f'stage "{stage.name}" comes after unknown stages {unknown}')
+
+    done: set = set()
+    remaining: List[PipelineStage] = list(stages)
+    while remaining:
+      ready: List[PipelineStage] = [stage for stage in remaining if set(stage.after) <= done]
+      if not ready:
+        raise ValueError(f'pipeline stages have a cycle {[stage.name for stage in remaining]}')
+
+      done.update(stage.name for stage in ready)
+      remaining = [stage for stage in remaining if stage.name not in done]
+
+
+  """
+    [ name ]:
+      run (return dtype: Dict[str, str])
+
+    [ parameters ]:
+      - stages (dtype: List[PipelineStage])
+
+    [ description ]:
+      Run the pipeline. A failed stage blocks the stages after it, the
+      independent ones still run (a partial stage blocks nothing).
+      Returns stage name -> status (SUCCESS, PARTIAL, SKIPPED, FAILED
+      or BLOCKED)
+  """
+  def run(self, stages: List[PipelineStage]) -> Dict[str, str]:
+    statuses: Dict[str, str] = {}
+    try:
+      self.__validate(stages)
+
+      # resume: keep the run id of the unfinished run
+      if not (self.resume and (self.__state.get('completed') is False)):
+        self.__state['run_id'] = f'{time():.6f}'
+      self.__state['completed'] = False
+      self.__state.setdefault('stages', {})
+
+      results:  Dict[str, Any] = {}
+      executed: set = set()
+      stage_by_name: Dict[str, PipelineStage] = {stage.name: stage for stage in stages}
+
+      with ThreadPoolExecutor(max_workers = self.max_workers) as executor:
+        running: Dict[Future, Tuple[PipelineStage, str]] = {}
+
+        while True:
+          # start (or skip / block) every stage whose dependencies are done,
+          # until nothing changes
+          is_changed: bool = True
+          while is_changed:
+            is_changed = False
+            running_names: set = {stage.name for stage, _ in running.values()}
+
+            for stage in stages:
+              if (stage.name in statuses) or (stage.name in running_names): continue
+
+              dependency_statuses: List[Optional[str]] = [statuses.get(name) for name in stage.after]
+              if any(status in ('FAILED', 'BLOCKED') for status in dependency_statuses):
+                statuses[stage.name] = 'BLOCKED'
+                logger.warning(f'[ PIPELINE ] [ {stage.name} ] [ BLOCKED ] a stage before it failed')
+                is_changed = True
+                continue
+
+              if not all(status in ('SUCCESS', 'PARTIAL', 'SKIPPED') for status in dependency_statuses):
+                continue
+
+              upstream_executed: bool = any(name in executed for name in stage.after)
+              skip_reason, inputs_fingerprint = self.__skip_reason(stage, upstream_executed)
+
+              if (skip_reason is not None) and self.__load_result(stage, results):
+                statuses[stage.name] = 'SKIPPED'
+                logger.info(f'[ PIPELINE ] [ {stage.name} ] [ SKIPPED ] {skip_reason}')
+                is_changed = True
+                continue
+
+              running[executor.submit(
+                self.__run_stage, stage, dict(results), self.__retry_record(stage, upstream_executed)
+              )] = (stage, inputs_fingerprint)
+              running_names.add(stage.name)
+
+          if not running: break
+
+          done_futures, _ = wait(list(running.keys()), return_when = FIRST_COMPLETED)
+          for future in done_futures:
+            stage, inputs_fingerprint = running.pop(future)
+            executed.add(stage.name)
+
+            try:
+              result: Any = future.result()
+              record: Dict[str, Any] = {
+                'status':  'SUCCESS',
+                'inputs':  inputs_fingerprint,
+                'outputs': self.fingerprint(stage.outputs),
+                'run_id':  self.__state['run_id']
+              }
+
+              # failed items kept for a resume run
+              if isinstance(result, PartialResult):
+                record.update({'status': 'PARTIAL', 'failed': result.failed, 'total': result.total})
+                result = result.result
+
+              results[stage.name] = result
+              statuses[stage.name] = record['status']
+
+            except Exception as error_message:
+              statuses[stage.name] = 'FAILED'
+              logger.error(f'[ PIPELINE ] [ {stage.name} ] [ FAILED ] {error_message}')
+              record: Dict[str, Any] = {'status': 'FAILED', 'run_id': self.__state['run_id']}
+
+            with self.__lock:
+              self.__state['stages'][stage.name] = record
+            self.__save_state()
+
+      self.__state['completed'] = all(
+        statuses.get(name) in ('SUCCESS', 'SKIPPED') for name in stage_by_name
+      )
+
+      # digests of the files removed since
+      self.__state['files'] = {
+        path: cached for path, cached in self.__state['files'].items() if file_is_exists(path)
+      }
+      self.__save_state()
+
+      logger.info(f'[ PIPELINE ] {statuses}')
+      if not self.__state['completed']:
+        logger.warning('[ PIPELINE ] unfinished, run again with resume to continue from the failed or partial stages')
+
+    except Exception as error_message:
+      logger.error(error_message)
+
+    return statuses
@@ -1,11 +1,12 @@
-from os import makedirs, listdir
+from os import makedirs
 from os.path import exists as file_is_exists
 
 import json
-from typing import List
+from typing import List, Optional
 
 from settings.logging_rules import logger
 from settings.location_rules import LocationRules
+from stock_storage.table_storage import TableStorage
 
 from warnings import filterwarnings
 filterwarnings("ignore")
@@ -24,16 +25,35 @@ filterwarnings("ignore")
 
 
 class WorkloadsPerWorkflow(LocationRules):
-  def generate_workloads(self) -> None:
+  """
+    [ name ]:
+      __init__ (return dtype: None)
+
+    [ parameters ]:
+      - storage (dtype: Optional[TableStorage], default: TableStorage())
+
+    [ description ]:
+      Workloads are built from the modeling tables of the storage format
+  """
+  def __init__(self, storage: Optional[TableStorage] = None) -> None:
+    self.storage: TableStorage = storage or TableStorage()
+
+
+  """
+    [ name ]:
+      generate_workloads (return dtype: bool)
+
+    [ description ]:
+      Workloads of 5 modeling tables per JSON file.
+      Returns False when they could not be written
+  """
+  def generate_workloads(self) -> bool:
     try:
       if not file_is_exists(self.DATASET_WOKLOADS_JSON_PATH):
         makedirs(self.DATASET_WOKLOADS_JSON_PATH)
 
-      stock_name_modeling: List[str] = sorted(
-        [
-          item for item in listdir(self.DATASET_MODELING_CSV_PATH)
-        ]
-      )
+      stock_name_modeling: List[str] = \
+        self.storage.list_tables(self.DATASET_MODELING_CSV_PATH)
 
       for _idx in range(len(stock_name_modeling) // 5):
         workloads: List[str] = stock_name_modeling[(_idx * 5) : 5 * (_idx + 1)]
@@ -42,5 +62,8 @@ class WorkloadsPerWorkflow(LocationRules):
         with open(workloads_filename, 'w') as workloads_file:
           json.dump({'workloads': workloads}, workloads_file)
 
+      return True
+
     except Exception as error_message:
       logger.error(error_message)
+      return False